@@ -0,0 +1,201 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource  # Unix only: peak RSS of the worker processes
+except ImportError:
+    resource = None
+
+import numpy as np
+import pandas as pd
+
+from question_four.simple_moving_avg import (
+    best_sma_for_stock, load_prices, score_universe, select_per_stock, select_portfolio_period,
+    write_outputs, parse_periods
+)
+
+"""
+Benchmark suite for the SMA optimisation pipeline.
+
+Builds synthetic universes of configurable size and times each pipeline
+stage (load, per-stock sweep, portfolio sweep, CSV output), recording the
+best wall time over the repeats and the peak traced memory. Times come from
+untraced runs; tracemalloc slows allocation-heavy code down a lot, so the
+peak is measured in a separate run. tracemalloc only sees this process, so
+with --workers > 1 the portfolio sweep also records the peak RSS of the
+worker processes (ru_maxrss). Results are written as JSON so runs from
+different versions can be compared.
+
+Run from the repository root:
+    python -m benchmarks.bench_sma --tickers 10,100 --days 2500 --output bench_sma.json
+"""
+
+
+# Helper to create synthetic price data (same model as the test helper, but
+# with its own seeded generator instead of the global NumPy state)
+def generate_price_series(length, start=100, drift=0.1, noise=1.0, seed=None):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(loc=drift, scale=noise, size=length)
+    return pd.Series(start + np.cumsum(returns))
+
+
+def generate_universe(n_tickers, n_days, seed=0):
+    """
+    Synthetic close_df: n_tickers random walks over n_days business days.
+    Prices start high enough that the walks stay positive.
+    """
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=n_days)
+    columns = {
+        f"T{i:05d}": generate_price_series(n_days, start=1000, seed=seed + i).to_numpy()
+        for i in range(n_tickers)
+    }
+    return pd.DataFrame(columns, index=dates)
+
+
+def measure(func, repeat=1):
+    """
+    Runs func `repeat` times untraced and keeps the best wall time, then once
+    more under tracemalloc for the peak traced bytes.
+
+    Returns:
+        tuple: (result of the last timed run, best seconds, peak traced bytes)
+    """
+    best = np.inf
+    result = None
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return result, best, peak
+
+
+def worker_peak_rss():
+    """
+    Peak resident set size in bytes of the largest finished child process so
+    far (e.g. a process pool worker), or None where getrusage is unavailable.
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # KiB on Linux, bytes on macOS
+
+
+def run_case(n_tickers, n_days, sma_periods, forward_days=50, workers=1, repeat=1, seed=0):
+    """
+    Benchmarks every pipeline stage for one universe size.
+
+    Returns:
+        list of dict: One record per stage
+    """
+    close_df = generate_universe(n_tickers, n_days, seed)
+    tickers = list(close_df.columns)
+    records = []
+
+    def record(stage, seconds, peak, worker_rss=None):
+        records.append({
+            "stage": stage,
+            "tickers": n_tickers,
+            "days": n_days,
+            "periods": len(sma_periods),
+            "workers": workers,
+            "seconds": seconds,
+            "peak_bytes": peak,
+            "worker_peak_rss_bytes": worker_rss,
+        })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Stage 1: load (file-based source into a cold price cache)
+        csv_dir = os.path.join(tmp, "csv")
+        os.makedirs(csv_dir)
+        for ticker in tickers:
+            pd.DataFrame({"Date": close_df.index, "Close": close_df[ticker]}).to_csv(
+                os.path.join(csv_dir, f"{ticker}.csv"), index=False)
+
+        def load():
+            cache_dir = tempfile.mkdtemp(dir=tmp)
+            return load_prices(tickers, cache_dir=cache_dir, csv_source=csv_dir, years=n_days // 250 + 1)
+
+        loaded, seconds, peak = measure(load, repeat)
+        record("load", seconds, peak)
+
+        # Stage 2: per-stock sweep
+        def per_stock():
+            return [best_sma_for_stock(loaded[t], sma_periods, forward_days) for t in tickers]
+
+        _, seconds, peak = measure(per_stock, repeat)
+        record("per_stock_sweep", seconds, peak)
+
+        # Stage 3: portfolio sweep (score cube + both reductions)
+        def portfolio():
+            cube = score_universe(loaded, tickers, sma_periods, forward_days, workers=workers)
+            return cube, select_per_stock(cube), select_portfolio_period(cube, tickers)[0]
+
+        (cube, results_df, portfolio_df), seconds, peak = measure(portfolio, repeat)
+        record("portfolio_sweep", seconds, peak, worker_peak_rss() if workers != 1 else None)
+
+        # Stage 4: CSV output
+        def output():
+            return write_outputs(results_df, portfolio_df, cube,
+                                 os.path.join(tmp, "per_stock.csv"), os.path.join(tmp, "portfolio.csv"),
+                                 os.path.join(tmp, "cube.csv"))
+
+        _, seconds, peak = measure(output, repeat)
+        record("csv_output", seconds, peak)
+
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SMA optimisation pipeline.")
+    parser.add_argument("--tickers", default="10,100", help="comma-separated universe sizes")
+    parser.add_argument("--days", default="2500", help="comma-separated series lengths")
+    parser.add_argument("--periods", default="10:200:5",
+                        help='SMA period grid, "start:stop:step" (inclusive) or a comma-separated list')
+    parser.add_argument("--forward-days", type=int, default=50, help="holding period in days")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes for the portfolio sweep")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage (best time is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic universe")
+    parser.add_argument("--output", default="bench_sma.json", help="JSON results file")
+    args = parser.parse_args(argv)
+
+    sma_periods = parse_periods(args.periods)
+    records = []
+
+    for n_tickers in (int(x) for x in args.tickers.split(",")):
+        for n_days in (int(x) for x in args.days.split(",")):
+            for rec in run_case(n_tickers, n_days, sma_periods, args.forward_days,
+                                args.workers, args.repeat, args.seed):
+                records.append(rec)
+                workers_rss = rec["worker_peak_rss_bytes"]
+                print(f"{rec['stage']:16} | {rec['tickers']:6} tickers | {rec['days']:6} days | "
+                      f"{rec['seconds']:9.4f} s | {rec['peak_bytes'] / 2**20:9.1f} MiB"
+                      + (f" | workers {workers_rss / 2**20:9.1f} MiB RSS" if workers_rss else ""))
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "results": records,
+        }, f, indent=2)
+
+    print(f"\nSaved benchmark results: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
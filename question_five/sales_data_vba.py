@@ -1,48 +1,21 @@
-import pandas as pd
-import numpy as np
-import random # Python's built-in random number generator
+try:
+    from .sales_generator import generate_sales, CATEGORIES, REGIONS
+except ImportError:  # Run as a script from inside question_five/
+    from sales_generator import generate_sales, CATEGORIES, REGIONS
 
 print("=" * 70)
 print("CREATING EXCEL FILE FOR VBA")
 print("=" * 70)
 
-# Fix the random seed so results are reproducible every run
-np.random.seed(42)
-
-# Generate mock sales data for 25 products across 5 categories and 5 regions.
+# Generate mock sales data for 25 products across 5 categories and 5 regions
+# (5 products per category, regions rotated across the products).
 # This dataset is intended for export to Excel, where additional calculations
 # (Revenue, Discount, Profit) will be handled by VBA.
-data = [] 
-categories = ['Electronics', 'Furniture', 'Apparel', 'Food', 'Stationery']
-regions = ['Asia', 'Europe', 'Africa', 'North America', 'South America']
-
-for i in range(25):
-    # Assign each product to a category (5 products per category)
-    category = categories[i // 5]  
-
-    # Rotate regions to evenly distribute products among all 5 regions 
-    region = regions[i % 5]        
-    
-    product_name = f"{category[:3]}_Prod{(i % 5) + 1:02d}" # Generate short product codes
-
-    units_sold = random.randint(50, 800) # Randomly assign units sold
-    unit_price = round(random.uniform(20, 150), 2) # Random unit price between £20 and £150
-    manufacturing_cost = round(random.uniform(5, 100), 2) # Random manufacturing cost between £5 and £100
-    
-    data.append({
-        'Product': product_name,
-        'Category': category,
-        'Region': region,
-        'Units Sold': units_sold,
-        'Unit Price (£)': unit_price,
-        'Manufacturing Cost (£)': manufacturing_cost,
-        'Revenue (£)': '',  # Placeholder: to be calculated in Excel
-        'Discount (£)': '', # Placeholder: to be calculated in Excel
-        'Profit (£)': ''    # Placeholder: to be calculated in Excel
-    })
-
-# Create a dataframe from the product data
-df = pd.DataFrame(data)
+# The seed makes the results reproducible every run.
+df = generate_sales(25, seed=42)
+data = df.astype({'Category': str, 'Region': str}).to_dict("records")
+categories = CATEGORIES
+regions = REGIONS
 
 # Summary printout of created data
 print("\n Created 25 products:")
@@ -0,0 +1,195 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .sales_report import calculate_sales_report
+except ImportError:  # Run as a script from inside question_five/
+    from sales_report import calculate_sales_report
+
+"""
+Scalable synthetic sales data generator.
+
+Produces the same Product / Category / Region schema as sales_data_vba.py at
+any size. Every column is one vectorized NumPy draw; the random columns each
+have their own stream spawned from one seed, so a given seed gives the same
+rows whatever the chunk size. Output is written chunk by chunk to CSV,
+Parquet (needs pyarrow) or XLSX (needs openpyxl, write-only mode), so memory
+use depends on the chunk size, not on the row count.
+"""
+
+CATEGORIES = ['Electronics', 'Furniture', 'Apparel', 'Food', 'Stationery']
+REGIONS = ['Asia', 'Europe', 'Africa', 'North America', 'South America']
+
+COLUMNS = ['Product', 'Category', 'Region', 'Units Sold', 'Unit Price (£)', 'Manufacturing Cost (£)',
+           'Revenue (£)', 'Discount (£)', 'Profit (£)']
+CALCULATED_COLUMNS = ['Revenue (£)', 'Discount (£)', 'Profit (£)']
+
+CHUNK_ROWS = 1_000_000
+XLSX_MAX_ROWS = 1_048_575  # Excel sheet limit, minus the header row
+FORMATS = ["csv", "parquet", "xlsx"]
+
+
+def sales_streams(seed):
+    """
+    One numpy Generator per random column (units, price, cost), all spawned
+    from the same seed.
+    """
+    units, price, cost = np.random.SeedSequence(seed).spawn(3)
+    return np.random.default_rng(units), np.random.default_rng(price), np.random.default_rng(cost)
+
+
+def generate_sales(rows, seed=42, start=0, streams=None):
+    """
+    Builds `rows` products as a DataFrame, one vectorized call per column.
+
+    Row i belongs to category (i // 5) % 5 and region i % 5, as in the
+    original 25-product table; product numbers keep counting up after the
+    first 25 rows (Ele_Prod01..05, then Ele_Prod06..10, ...).
+
+    Parameters:
+        rows (int): Number of products
+        seed (int): Seed for the random columns
+        start (int): Index of the first row (for chunked generation)
+        streams (tuple): Generators from sales_streams(), to continue a sequence
+    Returns:
+        pd.DataFrame: COLUMNS, with Revenue/Discount/Profit left blank
+    """
+    units_rng, price_rng, cost_rng = streams or sales_streams(seed)
+    index = np.arange(start, start + rows, dtype=np.int64)
+
+    category = (index // 5) % 5
+    region = index % 5
+    number = (index // 25) * 5 + index % 5 + 1
+
+    # Product code: first 3 letters of the category + zero-padded number
+    prefixes = np.array([f"{c[:3]}_Prod" for c in CATEGORIES])
+    product = np.strings.add(prefixes[category], np.strings.zfill(number.astype(str), 2))
+
+    return pd.DataFrame({
+        'Product': product,
+        'Category': pd.Categorical.from_codes(category, CATEGORIES),
+        'Region': pd.Categorical.from_codes(region, REGIONS),
+        'Units Sold': units_rng.integers(50, 801, size=rows),                  # 50-800 units
+        'Unit Price (£)': np.round(price_rng.uniform(20, 150, size=rows), 2),  # £20-£150
+        'Manufacturing Cost (£)': np.round(cost_rng.uniform(5, 100, size=rows), 2),  # £5-£100
+        'Revenue (£)': '',   # Placeholder: to be calculated
+        'Discount (£)': '',  # Placeholder: to be calculated
+        'Profit (£)': '',    # Placeholder: to be calculated
+    })
+
+
+def iter_sales_chunks(rows, seed=42, chunk_rows=CHUNK_ROWS, calculate=False):
+    """
+    Yields the rows of generate_sales(rows, seed) as DataFrames of at most
+    chunk_rows rows each (with Revenue/Discount/Profit filled if calculate).
+    """
+    streams = sales_streams(seed)
+    for start in range(0, rows, chunk_rows):
+        chunk = generate_sales(min(chunk_rows, rows - start), seed, start, streams)
+        yield calculate_sales_report(chunk) if calculate else chunk
+
+
+def write_sales(path, rows, seed=42, fmt="csv", chunk_rows=CHUNK_ROWS, calculate=False):
+    """
+    Generates and writes `rows` products one chunk at a time.
+
+    Parameters:
+        path (str): Output file
+        rows (int): Number of products
+        seed (int): Seed for the random columns
+        fmt (str): "csv", "parquet" or "xlsx"
+        chunk_rows (int): Rows generated and written per chunk
+        calculate (bool): Fill Revenue/Discount/Profit instead of leaving them blank
+    Returns:
+        int: Rows written
+    """
+    chunks = iter_sales_chunks(rows, seed, chunk_rows, calculate)
+    if fmt == "csv":
+        _write_csv(path, chunks)
+    elif fmt == "parquet":
+        _write_parquet(path, chunks)
+    elif fmt == "xlsx":
+        _write_xlsx(path, chunks)
+    else:
+        raise ValueError(f"Unknown output format: {fmt!r} (expected one of {FORMATS})")
+    return rows
+
+
+def _write_csv(path, chunks):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        f.write(",".join(COLUMNS) + "\n")
+        for chunk in chunks:
+            chunk.to_csv(f, header=False, index=False)
+
+
+def _write_parquet(path, chunks):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("Parquet output needs pyarrow (pip install pyarrow)") from error
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(_with_blank_as_null(chunk), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_xlsx(path, chunks):
+    try:
+        from openpyxl import Workbook
+    except ImportError as error:
+        raise ImportError("XLSX output needs openpyxl (pip install openpyxl)") from error
+
+    # Write-only mode streams rows to disk instead of keeping cells in memory.
+    # Rows beyond Excel's sheet limit continue on Sales_2, Sales_3, ...
+    workbook = Workbook(write_only=True)
+    sheet, sheet_rows, sheets = None, XLSX_MAX_ROWS, 0
+
+    for chunk in chunks:
+        chunk = chunk.astype({'Category': str, 'Region': str})
+        for row in chunk.itertuples(index=False, name=None):
+            if sheet_rows == XLSX_MAX_ROWS:
+                sheets += 1
+                sheet = workbook.create_sheet("Sales" if sheets == 1 else f"Sales_{sheets}")
+                sheet.append(COLUMNS)
+                sheet_rows = 0
+            sheet.append([None if value == '' else value for value in row])
+            sheet_rows += 1
+
+    if sheet is None:
+        workbook.create_sheet("Sales").append(COLUMNS)
+    workbook.save(path)
+
+
+def _with_blank_as_null(chunk):
+    # Blank placeholder columns become nulls (typed columns once calculated)
+    blank = [c for c in CALCULATED_COLUMNS if not pd.api.types.is_numeric_dtype(chunk[c])]
+    return chunk.assign(**{c: pd.Series(np.nan, index=chunk.index) for c in blank})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic sales data in bounded-memory chunks.")
+    parser.add_argument("--rows", type=int, default=25, help="number of products")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="output format")
+    parser.add_argument("--output", help="output file (default: sales_data.<format>)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="rows generated per chunk")
+    parser.add_argument("--calculate", action="store_true", help="fill Revenue, Discount and Profit")
+    args = parser.parse_args(argv)
+
+    output = args.output or f"sales_data.{args.format}"
+    write_sales(output, args.rows, args.seed, args.format, args.chunk_rows, args.calculate)
+    print(f"Saved {args.rows} rows: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+"""
+Revenue, Discount and Profit for the sales table, in Python.
+
+Applies the business rules of the Calculate_Sales_Report VBA macro (see
+sales_data_vba.py) as whole-column NumPy operations instead of a per-row
+loop over worksheet cells, and writes the three finished columns back in a
+single assignment. The arithmetic is done in the same order as the macro, in
+double precision, so the numbers are identical.
+"""
+
+UNITS, PRICE, COST = 'Units Sold', 'Unit Price (£)', 'Manufacturing Cost (£)'
+REVENUE, DISCOUNT, PROFIT = 'Revenue (£)', 'Discount (£)', 'Profit (£)'
+
+DISCOUNT_THRESHOLD = 400  # Units sold above this get the discount
+DISCOUNT_RATE = 0.1       # 10% of revenue
+
+
+def calculate_sales_report(df):
+    """
+    Fills the Revenue, Discount and Profit columns.
+
+    Rules (as in the VBA macro):
+        revenue = units sold * unit price
+        discount = 10% of revenue if units sold > 400, else 0
+        profit = revenue - units sold * manufacturing cost - discount
+
+    Parameters:
+        df (pd.DataFrame): Sales table with Units Sold, Unit Price (£) and
+            Manufacturing Cost (£) columns
+    Returns:
+        pd.DataFrame: The same table (modified in place) with the three columns filled
+    """
+    units = df[UNITS].to_numpy(dtype=np.float64)
+    price = df[PRICE].to_numpy(dtype=np.float64)
+    cost = df[COST].to_numpy(dtype=np.float64)
+
+    revenue = units * price
+    total_cost = units * cost
+    discount = np.where(units > DISCOUNT_THRESHOLD, revenue * DISCOUNT_RATE, 0.0)
+    profit = revenue - total_cost - discount
+
+    # One bulk write of all three finished columns
+    df[[REVENUE, DISCOUNT, PROFIT]] = np.column_stack((revenue, discount, profit))
+    return df
+
+
+def calculate_sales_file(input_path, output_path):
+    """
+    Reads a sales table (CSV or XLSX), calculates it and writes the whole
+    finished table in one go.
+
+    Every sheet of a workbook is calculated (large generated workbooks
+    continue on Sales_2, Sales_3, ...). XLSX output keeps the same sheets,
+    written through one ExcelWriter; CSV output gets all the rows in order.
+
+    Returns:
+        pd.DataFrame: The calculated table (all sheets, in order)
+    """
+    is_excel = str(input_path).lower().endswith((".xlsx", ".xls"))
+    if is_excel:
+        sheets = pd.read_excel(input_path, sheet_name=None)
+    else:
+        sheets = {"Sheet1": pd.read_csv(input_path, float_precision="round_trip")}
+    for sheet in sheets.values():
+        calculate_sales_report(sheet)
+
+    df = pd.concat(sheets.values(), ignore_index=True) if len(sheets) > 1 else next(iter(sheets.values()))
+    if str(output_path).lower().endswith(".xlsx"):
+        with pd.ExcelWriter(output_path) as writer:
+            for name, sheet in sheets.items():
+                sheet.to_excel(writer, sheet_name=name, index=False)
+    else:
+        df.to_csv(output_path, index=False)
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calculate Revenue, Discount and Profit for a sales table.")
+    parser.add_argument("input", help="sales table (.csv or .xlsx)")
+    parser.add_argument("output", help="calculated table (.csv or .xlsx)")
+    args = parser.parse_args(argv)
+
+    df = calculate_sales_file(args.input, args.output)
+    print(f"Calculated {len(df)} rows: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
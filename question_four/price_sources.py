@@ -0,0 +1,241 @@
+import os
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+"""
+Pluggable price sources with a local on-disk cache.
+
+A price source is any object with fetch(tickers, start=None) returning a
+DataFrame of daily closing prices (DatetimeIndex x tickers). Three are
+provided:
+
+    YFinanceSource      - downloads from Yahoo Finance (needs network)
+    CsvDirectorySource  - reads <TICKER>.csv files (Date, Close); fully offline
+    PriceCache          - wraps another source with a per-ticker NumPy cache
+                          (memory-mapped on read), fetching only the missing
+                          tail of dates and falling back to the cache offline
+
+Yahoo closes are split- and dividend-adjusted, so a split rewrites the whole
+history. PriceCache fetches the tail starting at the last cached date and
+compares that overlapping close; if it changed, the ticker's full history is
+downloaded again instead of appending new bars on a different basis.
+"""
+
+
+class YFinanceSource:
+    """
+    Yahoo Finance daily closes via yfinance (imported lazily, so offline
+    environments without the package can still use the other sources).
+    """
+
+    def __init__(self, period="10y", interval="1d"):
+        self.period = period
+        self.interval = interval
+
+    def fetch(self, tickers, start=None):
+        import yfinance as yf  # Yahoo Finance API wrapper to fetch historical market data
+
+        # Full history on first use, otherwise the dates from `start` on (inclusive)
+        if start is None:
+            data = yf.download(tickers, period=self.period, interval=self.interval, progress=False)
+        else:
+            data = yf.download(tickers, start=start, interval=self.interval, progress=False)
+
+        if data.empty:
+            return pd.DataFrame(columns=list(tickers), dtype=np.float64)
+        return data["Close"]
+
+
+class CsvDirectorySource:
+    """
+    File-based stand-in for a market data feed: one <TICKER>.csv per ticker
+    with Date and Close columns. Lets the pipeline and its tests run with no
+    network at all.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch(self, tickers, start=None):
+        columns = {}
+
+        for ticker in tickers:
+            path = os.path.join(self.directory, f"{_file_stem(ticker)}.csv")
+            if not os.path.exists(path):
+                continue
+
+            prices = pd.read_csv(path, parse_dates=["Date"], index_col="Date")["Close"]
+            if start is not None:
+                prices = prices[prices.index >= pd.Timestamp(start)]
+            columns[ticker] = prices
+
+        return pd.DataFrame(columns, columns=[t for t in tickers if t in columns], dtype=np.float64)
+
+
+class PriceCache:
+    """
+    Local columnar cache in front of another price source.
+
+    Each ticker is stored as two .npy files (dates and closes) and read back
+    memory-mapped. On load, tickers whose last cached date is older than
+    `max_age_days` are refreshed by fetching the dates from it onwards. If the
+    close on that overlapping date no longer matches the cache (the upstream
+    history was adjusted, e.g. after a split), the full history is fetched
+    again and replaces the cached one. If the upstream fetch fails (e.g. no
+    network) the cached data is used as is.
+    """
+
+    # Relative difference on the overlapping close that counts as an adjustment
+    ADJUSTMENT_TOLERANCE = 1e-6
+
+    def __init__(self, directory, source=None, max_age_days=1, offline=False):
+        self.directory = directory
+        self.source = source
+        self.max_age_days = max_age_days
+        self.offline = offline or source is None
+
+    def load(self, tickers, start=None):
+        """
+        Returns daily closes for `tickers` (refreshing stale ones first).
+
+        Parameters:
+            tickers (list of str): Tickers to load
+            start (date-like): Optional first date to keep
+        Returns:
+            pd.DataFrame: DatetimeIndex x tickers closing prices
+        """
+        if not self.offline:
+            self.refresh(tickers)
+
+        columns = {}
+        for ticker in tickers:
+            cached = self.read(ticker)
+            if cached is not None:
+                columns[ticker] = cached
+
+        close_df = pd.DataFrame(columns, columns=[t for t in tickers if t in columns], dtype=np.float64)
+        if not columns:
+            close_df.index = pd.DatetimeIndex([])
+        if start is not None:
+            close_df = close_df[close_df.index >= pd.Timestamp(start)]
+        return close_df.sort_index()
+
+    def refresh(self, tickers):
+        """
+        Fetches the missing tail of dates for every stale ticker.
+        Tickers sharing the same last cached date are fetched together;
+        tickers whose history was adjusted upstream are fetched again in full.
+        """
+        stale_after = np.datetime64(dt.date.today() - dt.timedelta(days=self.max_age_days), "D")
+        groups = {}
+
+        for ticker in tickers:
+            last = self.last_date(ticker)
+            if last is None or last < stale_after:
+                groups.setdefault(last, []).append(ticker)
+
+        adjusted = []
+        for last, group in groups.items():
+            # Start at the last cached date, so its close can be compared
+            start = None if last is None else last.astype(dt.date)
+            try:
+                fresh = self.source.fetch(group, start=start)
+            except Exception:
+                continue  # Offline or upstream failure: keep serving the cache
+
+            for ticker in group:
+                if ticker not in fresh.columns:
+                    continue
+                prices = fresh[ticker].dropna()
+                if last is not None and self._adjusted(ticker, last, prices):
+                    adjusted.append(ticker)
+                else:
+                    self.append(ticker, prices)
+
+        if adjusted:
+            try:
+                full = self.source.fetch(adjusted, start=None)
+            except Exception:
+                return  # Keep the old (consistent) history until the next refresh
+            for ticker in adjusted:
+                if ticker in full.columns:
+                    self.replace(ticker, full[ticker].dropna())
+
+    def read(self, ticker):
+        """
+        Returns the cached closes for one ticker (memory-mapped), or None.
+        """
+        dates_path, close_path = self._paths(ticker)
+        if not os.path.exists(close_path):
+            return None
+
+        dates = np.load(dates_path, mmap_mode="r")
+        close = np.load(close_path, mmap_mode="r")
+        return pd.Series(close, index=pd.DatetimeIndex(dates), name=ticker, copy=False)
+
+    def last_date(self, ticker):
+        dates_path, _ = self._paths(ticker)
+        if not os.path.exists(dates_path):
+            return None
+        dates = np.load(dates_path, mmap_mode="r")
+        return dates[-1] if len(dates) else None
+
+    def append(self, ticker, prices):
+        """
+        Adds new daily closes after the last cached date for one ticker.
+        """
+        dates = _to_days(prices.index)
+        close = prices.to_numpy(dtype=np.float64)
+
+        last = self.last_date(ticker)
+        if last is not None:
+            keep = dates > last
+            dates_path, close_path = self._paths(ticker)
+            dates = np.concatenate((np.load(dates_path), dates[keep]))
+            close = np.concatenate((np.load(close_path), close[keep]))
+
+        self._write(ticker, dates, close)
+
+    def replace(self, ticker, prices):
+        """
+        Replaces the whole cached history of one ticker.
+        """
+        self._write(ticker, _to_days(prices.index), prices.to_numpy(dtype=np.float64))
+
+    def _adjusted(self, ticker, last, prices):
+        # True if the fetched close on the last cached date differs from the cache
+        dates = _to_days(prices.index)
+        overlap = np.flatnonzero(dates == last)
+        if not len(overlap):
+            return False  # Nothing to compare against
+        _, close_path = self._paths(ticker)
+        cached = float(np.load(close_path, mmap_mode="r")[-1])
+        fetched = float(prices.iloc[overlap[0]])
+        return not np.isclose(fetched, cached, rtol=self.ADJUSTMENT_TOLERANCE, atol=0.0)
+
+    def _write(self, ticker, dates, close):
+        os.makedirs(self.directory, exist_ok=True)
+        for path, array in zip(self._paths(ticker), (dates, close)):
+            # Write to a temp file and swap it in, so readers never see half a file
+            tmp = f"{path}.tmp.npy"
+            np.save(tmp, array)
+            os.replace(tmp, path)
+
+    def _paths(self, ticker):
+        stem = os.path.join(self.directory, _file_stem(ticker))
+        return f"{stem}.dates.npy", f"{stem}.close.npy"
+
+
+def _file_stem(ticker):
+    # Keep ticker symbols such as "BRK-B" or "^GSPC" safe as file names
+    return ticker.replace(os.sep, "_").replace("^", "_")
+
+
+def _to_days(index):
+    # Normalise timestamps (possibly tz-aware) to plain calendar days
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype("datetime64[D]")
@@ -0,0 +1,162 @@
+import os
+import json
+
+import numpy as np
+import pandas as pd
+
+"""
+Compact price store for large universes.
+
+All closes live in one contiguous 2-D array (tickers x days), optionally
+float32, with per-ticker [start, stop) offsets marking each ticker's valid
+range. Each row holds that ticker's NaN-free closes, so a ticker's history is
+a zero-copy slice. Tickers with interior gaps also keep the date positions of
+their closes (one flat int32 array shared by all such tickers), so their
+Series views carry the right dates. A saved store is opened memory-mapped, so
+a full universe can be scored without reading it all into RAM.
+
+The store behaves like a read-only close_df for the scoring code: it has
+.columns, supports `ticker in store`, and store[ticker] returns a Series view.
+"""
+
+VALUES_FILE = "values.npy"
+DATES_FILE = "dates.npy"
+POSITIONS_FILE = "positions.npy"
+INDEX_FILE = "index.json"
+
+
+class PriceStore:
+
+    def __init__(self, values, tickers, starts, stops, dates=None, path=None,
+                 positions=None, position_starts=None):
+        self.values = values
+        self.tickers = list(tickers)
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.stops = np.asarray(stops, dtype=np.int64)
+        self.dates = dates
+        # Date positions of gappy tickers: row i uses positions[position_starts[i]:...]
+        # (-1 means the ticker has no interior gaps)
+        self.positions = np.zeros(0, dtype=np.int32) if positions is None else positions
+        self.position_starts = (np.full(len(self.tickers), -1, dtype=np.int64) if position_starts is None
+                                else np.asarray(position_starts, dtype=np.int64))
+        self.path = path
+        self._rows = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+    @classmethod
+    def from_frame(cls, close_df, dtype=np.float64):
+        """
+        Packs a close_df (dates x tickers) into a store.
+
+        Each ticker's non-NaN closes are written from its first valid date
+        onwards. Interior gaps are squeezed out, exactly as dropna() would,
+        and the dates of the remaining closes are kept for such tickers.
+
+        Parameters:
+            close_df (pd.DataFrame): Closing prices, one column per ticker
+            dtype: np.float64 or np.float32
+        """
+        values = np.full((close_df.shape[1], close_df.shape[0]), np.nan, dtype=dtype)
+        starts = np.zeros(close_df.shape[1], dtype=np.int64)
+        stops = np.zeros(close_df.shape[1], dtype=np.int64)
+        position_starts = np.full(close_df.shape[1], -1, dtype=np.int64)
+        positions, n_positions = [], 0
+
+        for i, ticker in enumerate(close_df.columns):
+            column = close_df[ticker].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(column)
+            if valid.any():
+                days = np.flatnonzero(valid)
+                starts[i] = days[0]
+                stops[i] = starts[i] + len(days)
+                values[i, starts[i]:stops[i]] = column[valid]
+                if days[-1] >= stops[i]:  # Interior gaps: remember where each close belongs
+                    position_starts[i] = n_positions
+                    positions.append(days.astype(np.int32))
+                    n_positions += len(days)
+
+        dates = None
+        if isinstance(close_df.index, pd.DatetimeIndex):
+            dates = close_df.index.to_numpy().astype("datetime64[D]")
+        positions = np.concatenate(positions) if positions else np.zeros(0, dtype=np.int32)
+        return cls(values, close_df.columns, starts, stops, dates,
+                   positions=positions, position_starts=position_starts)
+
+    @classmethod
+    def open(cls, directory, mmap_mode="r"):
+        """
+        Opens a saved store; the price matrix is memory-mapped, not loaded.
+        """
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            index = json.load(f)
+
+        values = np.load(os.path.join(directory, VALUES_FILE), mmap_mode=mmap_mode)
+        dates_path = os.path.join(directory, DATES_FILE)
+        dates = np.load(dates_path) if os.path.exists(dates_path) else None
+        positions_path = os.path.join(directory, POSITIONS_FILE)
+        positions = np.load(positions_path) if os.path.exists(positions_path) else None
+        return cls(values, index["tickers"], index["starts"], index["stops"], dates, path=directory,
+                   positions=positions, position_starts=index.get("position_starts"))
+
+    def save(self, directory):
+        """
+        Writes the store to a directory (values.npy, dates.npy, positions.npy,
+        index.json).
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, VALUES_FILE), self.values)
+        if self.dates is not None:
+            np.save(os.path.join(directory, DATES_FILE), self.dates)
+        np.save(os.path.join(directory, POSITIONS_FILE), self.positions)
+
+        with open(os.path.join(directory, INDEX_FILE), "w") as f:
+            json.dump({"tickers": self.tickers, "starts": self.starts.tolist(),
+                       "stops": self.stops.tolist(), "position_starts": self.position_starts.tolist()}, f)
+        self.path = directory
+
+    @property
+    def columns(self):
+        return self.tickers
+
+    def __contains__(self, ticker):
+        return ticker in self._rows
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def ticker_values(self, ticker):
+        """
+        The ticker's NaN-free closes as a zero-copy view into the store.
+        """
+        i = self._rows[ticker]
+        return self.values[i, self.starts[i]:self.stops[i]]
+
+    def day_positions(self, ticker):
+        """
+        Positions (in the store's dates) of the ticker's closes.
+        """
+        i = self._rows[ticker]
+        if self.position_starts[i] < 0:
+            return np.arange(self.starts[i], self.stops[i])
+        first = self.position_starts[i]
+        return self.positions[first:first + self.stops[i] - self.starts[i]]
+
+    def __getitem__(self, ticker):
+        # Series view over the ticker's closes, each labelled with its own date
+        # (the same Series as close_df[ticker].dropna())
+        days = self.day_positions(ticker)
+        index = pd.DatetimeIndex(self.dates[days]) if self.dates is not None else pd.Index(days)
+        return pd.Series(self.ticker_values(ticker), index=index, name=ticker, copy=False)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+
+def ticker_values(prices, ticker):
+    """
+    NaN-free closes for one ticker from a close_df or a PriceStore.
+    A PriceStore hands back a zero-copy view.
+    """
+    if isinstance(prices, PriceStore):
+        return prices.ticker_values(ticker)
+    return prices[ticker].dropna().to_numpy()
@@ -1,31 +1,112 @@
+import argparse
+import os
 import pandas as pd
 import numpy as np
-import yfinance as yf # Yahoo Finance API wrapper to fetch historical market data
+
+try:
+    from .sma_engine import score_periods, score_periods_multi, best_from_scores
+    from .sma_cube import build_score_cube, best_sma_from_cube, portfolio_scores_from_cube, export_cube, \
+        cube_for_horizon
+    from .sma_parallel import build_score_cube_parallel
+    from .price_sources import YFinanceSource, CsvDirectorySource, PriceCache
+    from .sma_walk_forward import walk_forward_table
+    from .price_store import PriceStore, INDEX_FILE
+except ImportError:  # Run as a script from inside question_four/
+    from sma_engine import score_periods, score_periods_multi, best_from_scores
+    from sma_cube import build_score_cube, best_sma_from_cube, portfolio_scores_from_cube, export_cube, \
+        cube_for_horizon
+    from sma_parallel import build_score_cube_parallel
+    from price_sources import YFinanceSource, CsvDirectorySource, PriceCache
+    from sma_walk_forward import walk_forward_table
+    from price_store import PriceStore, INDEX_FILE
 
 # List of 10 companies from the S&P 500 companies
 TICKERS = ['NVDA','AAPL','MSFT','AMZN','GOOGL','AVGO','GOOG','META','TSLA','BRK-B']
 
 PERIOD = "10y"        # Fetch last 10 years data
 INTERVAL = "1d"       # Use daily frequency data
-FORWARD_DAYS = 50     # Holding period for return calculation: 50 days 
+FORWARD_DAYS = 50     # Holding period for return calculation: 50 days
 
 # SMA periods to test (simple moving averages only)
 SMA_PERIODS = list(range(10, 201, 5))  # from 10 to 200 days in steps of 5
 
-# Download Yahoo Finance data (10 years daily)
-data = yf.download(
-    TICKERS,
-    period=PERIOD,
-    interval=INTERVAL,
-    progress=False # Disable progress bar during download
-) 
+CACHE_DIR = "price_cache"   # Local on-disk price cache (one .npy pair per ticker)
+
+# Output file names
+PER_STOCK_CSV = "best_sma_per_stock_static.csv"
+PORTFOLIO_CSV = "portfolio_sma_scores_static.csv"
+CUBE_CSV = "sma_score_cube.csv"
+WALK_FORWARD_CSV = "sma_walk_forward.csv"
+
+# Walk-forward selection: ~3 years of training, then a ~1 year out-of-sample block
+TRAIN_DAYS = 756
+TEST_DAYS = 252
+
+
+def load_prices(tickers, cache_dir=CACHE_DIR, csv_source=None, offline=False, years=10):
+    """
+    Loads daily closing prices through the local price cache.
+
+    Only the missing tail of dates is fetched (from Yahoo Finance, or from
+    <TICKER>.csv files when csv_source is given), unless the upstream history
+    was adjusted since it was cached (e.g. after a split), in which case the
+    ticker is downloaded again in full; when offline, or when the fetch fails,
+    the cache is used as is.
+
+    Returns:
+        pd.DataFrame: Closing prices, one column per ticker
+    """
+    price_cache = open_price_cache(cache_dir, csv_source, offline)
+    close_df = price_cache.load(tickers, start=pd.Timestamp.today().normalize() - pd.DateOffset(years=years))
+
+    # If no data is available, raise an error early
+    if close_df.empty:
+        raise RuntimeError("No price data available. Check internet, the price cache or ticker symbols.")
 
-# If no data is returned, raise an error early
-if data.empty:
-    raise RuntimeError("No data was downloaded. Check internet or ticker symbols.")
+    return close_df.dropna(how="all") # Drop dates with no price for any ticker
 
-# Extract only the closing prices (Close) for all tickers
-close_df = data["Close"].dropna(how="all") # Drop rows where all ticker prices are NaN
+
+def open_price_cache(cache_dir=CACHE_DIR, csv_source=None, offline=False):
+    """
+    The local price cache in front of Yahoo Finance (or of <TICKER>.csv files).
+    """
+    source = CsvDirectorySource(csv_source) if csv_source else YFinanceSource(period=PERIOD, interval=INTERVAL)
+    return PriceCache(cache_dir, source, offline=offline)
+
+
+def open_price_store(directory, tickers=None, dtype=np.float64, cache_dir=CACHE_DIR, csv_source=None,
+                     offline=False, years=10):
+    """
+    Opens the compact price store in `directory` memory-mapped, building it
+    first (from load_prices) if it does not exist yet. The store can be passed
+    anywhere a close_df is accepted by the scoring functions.
+
+    The price cache is refreshed first, and the store is rebuilt whenever it
+    is out of date: the cache has newer dates than the store, or the store
+    holds other tickers or another dtype than requested.
+    """
+    tickers = list(tickers or TICKERS)
+    price_cache = open_price_cache(cache_dir, csv_source, offline)
+    if not price_cache.offline:
+        price_cache.refresh(tickers)
+
+    if os.path.exists(os.path.join(directory, INDEX_FILE)):
+        store = PriceStore.open(directory)
+        if _store_is_current(store, tickers, dtype, price_cache):
+            return store
+
+    # The cache was just refreshed, so build from it without fetching again
+    close_df = load_prices(tickers, cache_dir, csv_source, offline=True, years=years)
+    PriceStore.from_frame(close_df, dtype=dtype).save(directory)
+    return PriceStore.open(directory)
+
+
+def _store_is_current(store, tickers, dtype, price_cache):
+    if store.tickers != tickers or store.values.dtype != np.dtype(dtype) or store.dates is None:
+        return False
+    last_dates = [price_cache.last_date(ticker) for ticker in tickers]
+    last_dates = [last for last in last_dates if last is not None]
+    return not last_dates or max(last_dates) <= store.dates[-1]
 
 # Find the best SMA period for a single stock
 def best_sma_for_stock(close: pd.Series, sma_periods, forward_days=50):
@@ -34,153 +115,275 @@ def best_sma_for_stock(close: pd.Series, sma_periods, forward_days=50):
     for a given stock over a defined holding period (default: 50 days).
 
     The process:
-    - For each SMA period:
+    - For all SMA periods at once (vectorized, from one prefix sum):
         * Compute the simple moving average (SMA)
         * Generate buy signals when Close > SMA
         * Compute 50-day forward returns on those signal days
         * Score the SMA by averaging forward returns on signal days
     - Return the SMA period with the highest average forward return
+
+    Use sma_engine.sma_score_table() for the full per-period score table.
+
+    forward_days may also be a list of holding periods: signals are then
+    computed once, all horizons are scored in one batched pass, and the result
+    is {horizon: {"Best_SMA", "Best_Avg_Forward_<h>d", "Signals"} or None}.
     """
 
-    close = close.dropna() # Remove NaNs to ensure valid calculations
+    # Remove NaNs to ensure valid calculations (arrays, e.g. PriceStore rows, are used as is)
+    close = close.dropna().to_numpy() if isinstance(close, pd.Series) else np.asarray(close)
+
+    if np.ndim(forward_days):
+        return _best_sma_per_horizon(close, sma_periods, list(forward_days))
 
     # Skip if not enough data for longest SMA + forward period
     if len(close) < max(sma_periods) + forward_days + 5:
         return None
 
-    # Calculate forward return: (price 50 days ahead / current price) - 1
-    forward_ret = close.shift(-forward_days) / close - 1
-
-    best_period = None
-    best_avg = -np.inf # Initialize with lowest possible return
-    best_signals = 0
-
-    # Loop through each SMA period candidate
-    for p in sma_periods:
-        # Compute SMA with minimum required data for each window
-        sma = close.rolling(window=p, min_periods=p).mean()
-
-        # Signal condition: current price is above SMA (Close > SMA)
-        signal = close > sma
-
-        # Only keep days where signal is true and forward return is known
-        r = forward_ret[signal & forward_ret.notna()]
+    # Score every SMA period in one vectorized sweep (see sma_engine.py)
+    avg_returns, signal_counts = score_periods(close, sma_periods, forward_days)
 
-        if r.empty:
-            continue # Skip if no valid signals
+    # Keep the SMA period with the highest average forward return
+    return best_from_scores(sma_periods, avg_returns, signal_counts, label=f"Best_Avg_Forward_{forward_days}d")
 
-        avg_return = float(r.mean()) # Average return for this SMA
 
-        # Keep the SMA period with the highest average forward return
-        if avg_return > best_avg:
-            best_avg = avg_return
-            best_period = int(p)
-            best_signals = int(len(r))
+def _best_sma_per_horizon(close, sma_periods, horizons):
+    # One signal sweep, every horizon reduced together (see score_periods_multi)
+    avg_returns, signal_counts = score_periods_multi(close, sma_periods, horizons)
 
-    if best_period is None:
-        return None # No suitable SMA found
+    best = {}
+    for col, h in enumerate(horizons):
+        if len(close) < max(sma_periods) + h + 5:
+            best[h] = None
+        else:
+            best[h] = best_from_scores(sma_periods, avg_returns[:, col], signal_counts[:, col],
+                                       label=f"Best_Avg_Forward_{h}d")
+    return best
 
-    return {
-        "Best_SMA": best_period,
-        "Best_Avg_Forward_50d": best_avg,
-        "Signals": best_signals
-    }
 
-# Compute best SMA for each of your 10 stocks
-# Run the above function for each stock and collect results
-results = []
-
-for ticker in TICKERS:
-    close = close_df[ticker].dropna()
-
-    res = best_sma_for_stock(close, SMA_PERIODS, forward_days=FORWARD_DAYS)
-    if res is None:
-        # If a stock doesn't have enough valid data, skip it
-        continue
-
-    results.append({"Ticker": ticker, **res}) # Merge ticker with its SMA results
-
-# Convert results into a DataFrame for easier analysis/output
-results_df = pd.DataFrame(results).dropna()
-
-# If none of the stocks yielded results, raise an error
-if results_df.empty:
-    raise RuntimeError("No results were produced. Possibly insufficient data for all tickers.")
+def score_universe(close_df, tickers, sma_periods=SMA_PERIODS, forward_days=FORWARD_DAYS, workers=1):
+    """
+    Scores every (ticker, SMA period) pair once into the SMA score cube.
+    Both selections below are reductions over this cube, so no rolling mean
+    is computed twice. With workers != 1 the tickers are scored in a process
+    pool (0 or None = all CPU cores); the results are identical. A list of
+    forward_days gives a (ticker, period, horizon) cube.
+    """
+    if workers == 1:
+        return build_score_cube(close_df, tickers, sma_periods, forward_days=forward_days)
+    return build_score_cube_parallel(close_df, tickers, sma_periods, forward_days=forward_days,
+                                     workers=workers or None)
 
-# Round average forward return to 4 decimal places for readability
-results_df["Best_Avg_Forward_50d"] = results_df["Best_Avg_Forward_50d"].round(4)
 
-"""
-Enforce "same SMA period" for the portfolio of 10
-    - Evaluate each SMA period across all 10 stocks,
-    - Compute the portfolio score (mean of the 10 average forward returns),
-    - Choose the SMA period that maximises portfolio return.
-"""
+def select_per_stock(score_cube, label="Best_Avg_Forward_50d"):
+    """
+    Best SMA for each stock (per stock optimisation), rounded for output.
+    """
+    results_df = best_sma_from_cube(score_cube, label).dropna()
 
-portfolio_scores = []
+    # If none of the stocks yielded results, raise an error
+    if results_df.empty:
+        raise RuntimeError("No results were produced. Possibly insufficient data for all tickers.")
 
-for p in SMA_PERIODS:
-    per_stock_returns = []
+    # Round average forward return to 4 decimal places for readability
+    results_df[label] = results_df[label].round(4)
+    return results_df
 
-    for ticker in TICKERS:
-        if ticker not in close_df.columns:
-            continue
 
-        close = close_df[ticker].dropna()
+def select_portfolio_period(score_cube, tickers):
+    """
+    Enforce "same SMA period" for the portfolio
+        - Evaluate each SMA period across all stocks,
+        - Compute the portfolio score (mean of the per-stock average forward returns),
+        - Choose the SMA period that maximises portfolio return.
+
+    Returns:
+        tuple: (portfolio_scores_df sorted descending and rounded,
+                chosen SMA period or None if no period worked for all stocks)
+    """
+    portfolio_scores_df = portfolio_scores_from_cube(score_cube, tickers)
 
-        # Ensure enough data for this SMA + forward period
-        if len(close) < p + FORWARD_DAYS + 5:
-            continue
+    chosen_sma_period = None
+    if not portfolio_scores_df.empty:
+        # Select the top-performing SMA period for the portfolio
+        chosen_sma_period = int(portfolio_scores_df.iloc[0]["SMA_Period"])
 
-        # Calculate SMA and signal as before
-        sma = close.rolling(window=p, min_periods=p).mean()
-        signal = close > sma
-        forward_ret = close.shift(-FORWARD_DAYS) / close - 1
+    # Round portfolio return values
+    portfolio_scores_df["PortfolioMeanReturn"] = portfolio_scores_df["PortfolioMeanReturn"].round(4)
+    return portfolio_scores_df, chosen_sma_period
 
-        # Filter valid signal days with known forward returns
-        r = forward_ret[signal & forward_ret.notna()]
-        if r.empty:
-            continue
 
-        per_stock_returns.append(float(r.mean()))
+def write_outputs(results_df, portfolio_scores_df, score_cube,
+                  per_stock_path=PER_STOCK_CSV, portfolio_path=PORTFOLIO_CSV, cube_path=CUBE_CSV,
+                  walk_forward_df=None, walk_forward_path=WALK_FORWARD_CSV):
+    """
+    Writes the CSV outputs and returns the paths written.
+    """
+    # Output 1: each stock’s best SMA period and score
+    results_df.to_csv(per_stock_path, index=False)
 
-    # Only accept SMA periods that work for ALL 10 stocks 
-    if len(per_stock_returns) == len(TICKERS):
-        portfolio_scores.append({
-            "SMA_Period": p,
-            "PortfolioMeanReturn": float(np.mean(per_stock_returns))
-        })
+    # Output 2: portfolio SMA scoring table (shows how common SMA was chosen)
+    portfolio_scores_df.to_csv(portfolio_path, index=False)
 
-# Create DataFrame from portfolio-level SMA scores and sort descending by return
-portfolio_scores_df = pd.DataFrame(portfolio_scores).sort_values(
-    "PortfolioMeanReturn", ascending=False
-)
+    paths = [per_stock_path, portfolio_path]
 
-if portfolio_scores_df.empty:
-    print("No SMA period worked for all 10 stocks. Relax the strict condition if needed.")
-else:
-    # Select the top-performing SMA period for the portfolio
-    chosen_sma_period = int(portfolio_scores_df.iloc[0]["SMA_Period"])
-    print(f"\nChosen common SMA period for the portfolio: {chosen_sma_period} days\n")
+    # Output 3: full (ticker x period) score cube, reusable by downstream reports
+    if cube_path:
+        export_cube(score_cube, cube_path)
+        paths.append(cube_path)
 
-# Round portfolio return values 
-portfolio_scores_df["PortfolioMeanReturn"] = portfolio_scores_df["PortfolioMeanReturn"].round(4)
+    # Output 4: walk-forward (rolling out-of-sample) period selection per window
+    if walk_forward_df is not None and walk_forward_path:
+        walk_forward_df.to_csv(walk_forward_path, index=False)
+        paths.append(walk_forward_path)
 
-# ----- Outputs (CSV files) -----
+    return paths
 
-# Output 1: each stock’s best SMA period and score
-results_df.to_csv("best_sma_per_stock_static.csv", index=False)
 
-# Output 2: portfolio SMA scoring table (shows how common SMA was chosen)
-portfolio_scores_df.to_csv("portfolio_sma_scores_static.csv", index=False)
+def parse_periods(text):
+    """
+    Parses an SMA period grid: "start:stop:step" (stop inclusive) or "10,20,50".
+    """
+    if ":" in text:
+        start, stop, step = (int(part) for part in text.split(":"))
+        return list(range(start, stop + 1, step))
+    return [int(part) for part in text.split(",")]
 
-print("Saved output files:")
-print("best_sma_per_stock_static.csv")
-print("portfolio_sma_scores_static.csv")
 
-print("\nBest SMA for each stock (per stock optimisation):\n")
-print(results_df.to_string(index=False))
+def horizon_path(path, forward_days):
+    """
+    Adds the horizon to an output file name: "best.csv" -> "best_20d.csv".
+    """
+    stem, ext = os.path.splitext(path)
+    return f"{stem}_{forward_days}d{ext}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the best SMA period per stock and for the portfolio.")
+    parser.add_argument("--tickers", default=",".join(TICKERS), help="comma-separated ticker symbols")
+    parser.add_argument("--periods", default="10:200:5",
+                        help='SMA period grid, "start:stop:step" (inclusive) or a comma-separated list')
+    parser.add_argument("--forward-days", default=str(FORWARD_DAYS),
+                        help="holding period in days, or a comma-separated list scored in one pass")
+    parser.add_argument("--per-stock-out", default=PER_STOCK_CSV, help="per-stock results CSV")
+    parser.add_argument("--portfolio-out", default=PORTFOLIO_CSV, help="portfolio scores CSV")
+    parser.add_argument("--cube-out", default=CUBE_CSV, help='score cube CSV ("" to skip)')
+    parser.add_argument("--walk-forward-out", default=WALK_FORWARD_CSV,
+                        help='walk-forward selection CSV ("" to skip)')
+    parser.add_argument("--train-days", type=int, default=TRAIN_DAYS, help="walk-forward training window in days")
+    parser.add_argument("--test-days", type=int, default=TEST_DAYS,
+                        help="walk-forward out-of-sample block (and step) in days")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes for scoring (0 = all CPU cores)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="directory of the local price cache")
+    parser.add_argument("--offline", action="store_true", help="only read the local price cache")
+    parser.add_argument("--csv-source", default=None,
+                        help="directory of <TICKER>.csv files (Date, Close) to use instead of Yahoo Finance")
+    parser.add_argument("--price-store", default=None,
+                        help="score from a memory-mapped price store in this directory (built on first use)")
+    parser.add_argument("--float32", action="store_true", help="build the price store in float32")
+    args = parser.parse_args(argv)
+
+    tickers = [t.strip() for t in args.tickers.split(",") if t.strip()]
+    sma_periods = parse_periods(args.periods)
+    horizons = [int(part) for part in args.forward_days.split(",")]
+    if args.walk_forward_out and args.train_days <= max(horizons):
+        parser.error("--train-days must be greater than --forward-days")
+
+    load_options = dict(cache_dir=args.cache_dir, csv_source=args.csv_source, offline=args.offline)
+    if args.price_store:
+        close_df = open_price_store(args.price_store, tickers, np.float32 if args.float32 else np.float64,
+                                    **load_options)
+    else:
+        close_df = load_prices(tickers, **load_options)
+    if len(horizons) == 1:
+        run_single_horizon(args, close_df, tickers, sma_periods, horizons[0])
+    else:
+        run_multi_horizon(args, close_df, tickers, sma_periods, horizons)
+
+
+def run_single_horizon(args, close_df, tickers, sma_periods, forward_days):
+    score_cube = score_universe(close_df, tickers, sma_periods, forward_days, workers=args.workers)
+
+    results_df = select_per_stock(score_cube, label=f"Best_Avg_Forward_{forward_days}d")
+    portfolio_scores_df, chosen_sma_period = select_portfolio_period(score_cube, tickers)
+
+    walk_forward_df = None
+    if args.walk_forward_out:
+        walk_forward_df = walk_forward_table(close_df, tickers, sma_periods, forward_days,
+                                             args.train_days, args.test_days)
+
+    print_chosen_period(chosen_sma_period, tickers)
+
+    paths = write_outputs(results_df, portfolio_scores_df, score_cube,
+                          args.per_stock_out, args.portfolio_out, args.cube_out,
+                          walk_forward_df, args.walk_forward_out)
+
+    print("Saved output files:")
+    for path in paths:
+        print(path)
+
+    print_results(results_df, portfolio_scores_df, tickers)
+
+
+def run_multi_horizon(args, close_df, tickers, sma_periods, horizons):
+    # One (ticker, period, horizon) cube: signals once, all horizons in one pass
+    score_cube = score_universe(close_df, tickers, sma_periods, horizons, workers=args.workers)
+    paths = []
+    selections = []
+
+    # Best-per-horizon CSVs, e.g. best_sma_per_stock_static_20d.csv
+    for h in horizons:
+        cube_h = cube_for_horizon(score_cube, h)
+        results_df = select_per_stock(cube_h, label=f"Best_Avg_Forward_{h}d")
+        portfolio_scores_df, chosen_sma_period = select_portfolio_period(cube_h, tickers)
+
+        print(f"\n===== Holding period: {h} days =====")
+        print_chosen_period(chosen_sma_period, tickers)
+
+        paths += write_outputs(results_df, portfolio_scores_df, cube_h,
+                               horizon_path(args.per_stock_out, h), horizon_path(args.portfolio_out, h),
+                               cube_path=None)
+        selections.append((h, results_df, portfolio_scores_df))
+
+    # Full (ticker, period, horizon) result table
+    if args.cube_out:
+        export_cube(score_cube, args.cube_out)
+        paths.append(args.cube_out)
+
+    if args.walk_forward_out:
+        frames = []
+        for h in horizons:
+            frame = walk_forward_table(close_df, tickers, sma_periods, h, args.train_days, args.test_days)
+            frame.insert(1, "Forward_Days", h)
+            frames.append(frame)
+        pd.concat(frames, ignore_index=True).to_csv(args.walk_forward_out, index=False)
+        paths.append(args.walk_forward_out)
+
+    print("\nSaved output files:")
+    for path in paths:
+        print(path)
+
+    for h, results_df, portfolio_scores_df in selections:
+        print(f"\n===== Holding period: {h} days =====")
+        print_results(results_df, portfolio_scores_df, tickers)
+
+
+def print_chosen_period(chosen_sma_period, tickers):
+    if chosen_sma_period is None:
+        print(f"No SMA period worked for all {len(tickers)} stocks. Relax the strict condition if needed.")
+    else:
+        print(f"\nChosen common SMA period for the portfolio: {chosen_sma_period} days\n")
+
+
+def print_results(results_df, portfolio_scores_df, tickers):
+    print("\nBest SMA for each stock (per stock optimisation):\n")
+    print(results_df.to_string(index=False))
+
+    if not portfolio_scores_df.empty:
+        print(f"\nTop SMA periods for the whole {len(tickers)} stock portfolio:\n")
+        print(portfolio_scores_df.head(10).to_string(index=False))
 
-if not portfolio_scores_df.empty:
-    print("\nTop SMA periods for the whole 10 stock portfolio:\n")
-    print(portfolio_scores_df.head(10).to_string(index=False))
\ No newline at end of file
+
+# Run the analysis
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from .sma_engine import score_periods, score_periods_multi, best_from_scores
+    from .price_store import ticker_values
+except ImportError:  # Run as a script from inside question_four/
+    from sma_engine import score_periods, score_periods_multi, best_from_scores
+    from price_store import ticker_values
+
+"""
+SMA score cube: (ticker x period) -> mean forward return and signal count.
+
+The cube is computed once per ticker with the vectorized engine. Both the
+per-stock optimisation and the common-period portfolio selection are cheap
+reductions over it, and it can be exported to CSV so downstream reports can
+reuse it without recomputing any rolling means.
+
+With a list of holding periods (horizons) the cube holds one row per
+(ticker, period, horizon): signals are computed once per ticker and every
+horizon is scored in the same batched reduction. The selections work on one
+horizon at a time (see cube_for_horizon).
+"""
+
+CUBE_COLUMNS = ["Ticker", "SMA_Period", "Avg_Forward_Return", "Signals", "History_Days", "Forward_Days"]
+
+
+def build_score_cube(close_df, tickers, sma_periods, forward_days=50):
+    """
+    Scores every SMA period for every ticker once.
+
+    Parameters:
+        close_df (pd.DataFrame or PriceStore): Closing prices, one column per ticker
+        tickers (list of str): Tickers to score (missing columns are skipped)
+        sma_periods (list of int): SMA window lengths
+        forward_days (int or list of int): Holding period(s) in days
+    Returns:
+        pd.DataFrame: One row per (ticker, period[, horizon]) with CUBE_COLUMNS
+    """
+    frames = []
+
+    for ticker in tickers:
+        if ticker not in close_df.columns:
+            continue
+
+        close = ticker_values(close_df, ticker)  # Zero-copy view for a PriceStore
+        frames.append(ticker_scores(ticker, close, sma_periods, forward_days))
+
+    if not frames:
+        return pd.DataFrame(columns=CUBE_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def ticker_scores(ticker, close, sma_periods, forward_days=50):
+    """
+    Builds the cube rows for a single ticker from its NaN-free closing prices.
+    """
+    avg_returns, signal_counts = score_ticker(close, sma_periods, forward_days)
+    return cube_rows(ticker, sma_periods, forward_days, avg_returns, signal_counts, len(close))
+
+
+def score_ticker(close, sma_periods, forward_days=50):
+    """
+    Scores one ticker for a single horizon (exact per-period means) or for a
+    list of horizons (one batched pass, periods x horizons arrays).
+    """
+    if np.ndim(forward_days):
+        return score_periods_multi(close, sma_periods, forward_days)
+    return score_periods(close, sma_periods, forward_days)
+
+
+def cube_rows(ticker, sma_periods, forward_days, avg_returns, signal_counts, history_days):
+    """
+    Lays out one ticker's scores as cube rows, ordered by period then horizon.
+    """
+    periods = np.asarray(sma_periods, dtype=np.int64)
+    horizons = np.atleast_1d(np.asarray(forward_days, dtype=np.int64))
+
+    return pd.DataFrame({
+        "Ticker": ticker,
+        "SMA_Period": np.repeat(periods, len(horizons)),
+        "Avg_Forward_Return": np.asarray(avg_returns, dtype=np.float64).ravel(),
+        "Signals": np.asarray(signal_counts).astype(np.int64).ravel(),
+        "History_Days": int(history_days),
+        "Forward_Days": np.tile(horizons, len(periods)),
+    })
+
+
+def cube_for_horizon(cube, forward_days):
+    """
+    The single-horizon slice of a (ticker, period, horizon) cube.
+    """
+    return cube[cube["Forward_Days"] == forward_days].reset_index(drop=True)
+
+
+def best_sma_from_cube(cube, label="Best_Avg_Forward_50d"):
+    """
+    Per-stock optimisation: the best SMA period for each ticker in a
+    single-horizon cube.
+
+    Mirrors best_sma_for_stock: a ticker is skipped unless its history covers
+    the longest SMA period plus the forward period (and a 5-day margin).
+
+    Returns:
+        pd.DataFrame: Columns Ticker, Best_SMA, <label>, Signals
+    """
+    results = []
+
+    for ticker, rows in cube.groupby("Ticker", sort=False):
+        history = int(rows["History_Days"].iloc[0])
+        forward_days = int(rows["Forward_Days"].iloc[0])
+
+        if history < rows["SMA_Period"].max() + forward_days + 5:
+            continue
+
+        res = best_from_scores(rows["SMA_Period"].to_numpy(),
+                               rows["Avg_Forward_Return"].to_numpy(),
+                               rows["Signals"].to_numpy(), label)
+        if res is not None:
+            results.append({"Ticker": ticker, **res})
+
+    return pd.DataFrame(results, columns=["Ticker", "Best_SMA", label, "Signals"])
+
+
+def portfolio_scores_from_cube(cube, tickers):
+    """
+    Common-period portfolio selection over a single-horizon cube.
+
+    A period is only accepted if it produced signals for ALL tickers (each
+    with enough history for that period); its score is the mean of the
+    per-stock average forward returns.
+
+    Returns:
+        pd.DataFrame: Columns SMA_Period, PortfolioMeanReturn, sorted descending
+    """
+    eligible = cube[
+        (cube["History_Days"] >= cube["SMA_Period"] + cube["Forward_Days"] + 5)
+        & (cube["Signals"] > 0)
+    ]
+
+    portfolio_scores = []
+
+    for p, rows in eligible.groupby("SMA_Period", sort=True):
+        # Average in ticker order, exactly as the per-period loop did
+        per_stock = rows.set_index("Ticker")["Avg_Forward_Return"]
+        per_stock_returns = [float(per_stock[t]) for t in tickers if t in per_stock.index]
+
+        if len(per_stock_returns) == len(tickers):
+            portfolio_scores.append({
+                "SMA_Period": int(p),
+                "PortfolioMeanReturn": float(np.mean(per_stock_returns))
+            })
+
+    return pd.DataFrame(portfolio_scores, columns=["SMA_Period", "PortfolioMeanReturn"]).sort_values(
+        "PortfolioMeanReturn", ascending=False
+    )
+
+
+def export_cube(cube, path):
+    """
+    Writes the cube to CSV at full precision so it can be reloaded exactly.
+    """
+    cube.to_csv(path, index=False, float_format="%.17g")
+
+
+def load_cube(path):
+    """
+    Reads a cube previously written by export_cube().
+    """
+    return pd.read_csv(path, dtype={"Ticker": str})
@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+
+"""
+Vectorized SMA sweep engine.
+
+Every candidate SMA window is computed at once from a single cumulative-sum
+array, giving a (periods x days) signal matrix. The forward-return means for
+all periods are then reduced in one NumPy pass, instead of calling
+rolling().mean() and filtering a Series once per period.
+"""
+
+_EPS = np.finfo(np.float64).eps
+
+
+def forward_returns(values, forward_days):
+    """
+    Computes the forward return (price N days ahead / current price) - 1.
+
+    Parameters:
+        values (array-like): Closing prices, oldest first, without NaNs
+        forward_days (int): Holding period in days
+    Returns:
+        np.ndarray: Forward returns, NaN where the future price is unknown
+    """
+    values = np.asarray(values, dtype=np.float64)
+    fwd = np.full(len(values), np.nan)
+    if forward_days < len(values):
+        fwd[:len(values) - forward_days] = values[forward_days:] / values[:len(values) - forward_days] - 1
+    return fwd
+
+
+def sma_matrix(values, sma_periods):
+    """
+    Computes the simple moving average for every period from one prefix sum.
+
+    Parameters:
+        values (array-like): Closing prices, oldest first, without NaNs
+        sma_periods (list of int): SMA window lengths
+    Returns:
+        tuple: (sma (periods x days float array, NaN until the window is full),
+                tol (per-period rounding tolerance of the prefix-sum SMA))
+    """
+    values = np.asarray(values, dtype=np.float64)
+    periods = np.asarray(sma_periods, dtype=np.int64)
+    n = len(values)
+
+    # Subtract the first price so the running sum stays small (less rounding)
+    base = values[0] if n else 0.0
+    shifted = values - base
+    csum = np.concatenate(([0.0], np.cumsum(shifted)))
+
+    # Window sum for day t and period p is csum[t + 1] - csum[t + 1 - p];
+    # each row is a slice difference of the same prefix-sum array
+    sma = np.full((len(periods), n), np.nan)
+    for row, p in enumerate(periods):
+        if p <= n:
+            np.subtract(csum[p:], csum[:n + 1 - p], out=sma[row, p - 1:])
+    sma /= periods[:, None]
+    sma += base
+
+    # Upper bound on how far the prefix-sum SMA can drift from an exact mean
+    scale = np.abs(shifted).sum() if n else 0.0
+    tol = 2.0 * (n + 1) * _EPS * scale / periods + 8.0 * _EPS * (np.abs(values).max() if n else 0.0)
+    return sma, tol
+
+
+def signal_matrix(values, sma_periods):
+    """
+    Builds the "Close > SMA" buy signal for every SMA period.
+
+    Days where the price sits within rounding distance of the prefix-sum SMA
+    are re-checked against pandas' rolling mean, so the signals are identical
+    to close > close.rolling(window=p, min_periods=p).mean().
+
+    Parameters:
+        values (array-like): Closing prices, oldest first, without NaNs
+        sma_periods (list of int): SMA window lengths
+    Returns:
+        np.ndarray: Boolean (periods x days) signal matrix
+    """
+    values = np.asarray(values, dtype=np.float64)
+    sma, tol = sma_matrix(values, sma_periods)
+
+    diff = values[None, :] - sma
+    signal = diff > tol[:, None]  # NaN (incomplete window) compares as False
+    ambiguous = np.abs(diff) <= tol[:, None]
+
+    # Resolve near-ties with the reference rolling mean, one period at a time
+    if ambiguous.any():
+        close = pd.Series(values)
+        for row in np.flatnonzero(ambiguous.any(axis=1)):
+            p = int(sma_periods[row])
+            exact = close.rolling(window=p, min_periods=p).mean().to_numpy()
+            signal[row] = values > exact
+
+    return signal
+
+
+def score_periods(values, sma_periods, forward_days=50):
+    """
+    Scores every SMA period by its average forward return on signal days.
+
+    Parameters:
+        values (array-like): Closing prices, oldest first, without NaNs
+        sma_periods (list of int): SMA window lengths
+        forward_days (int): Holding period in days
+    Returns:
+        tuple: (avg_returns (float array, NaN where a period has no signals),
+                signal_counts (int array))
+    """
+    values = np.asarray(values, dtype=np.float64)
+    fwd = forward_returns(values, forward_days)
+
+    # Only keep days where the signal is on and the forward return is known
+    valid = signal_matrix(values, sma_periods) & ~np.isnan(fwd)[None, :]
+
+    counts = valid.sum(axis=1)
+
+    # Gather every period's signal-day returns into one flat array (row-major),
+    # then sum each period's contiguous segment. Summing the compacted values
+    # (rather than a zero-filled row) keeps the result bit-identical to r.mean().
+    selected = np.broadcast_to(fwd, valid.shape)[valid]
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    avg = np.full(len(counts), np.nan)
+    for row in np.flatnonzero(counts):
+        avg[row] = selected[bounds[row]:bounds[row + 1]].sum() / counts[row]
+    return avg, counts
+
+
+def score_periods_multi(values, sma_periods, horizons):
+    """
+    Scores every SMA period for several holding periods in one pass.
+
+    Signals are computed once. Signal counts for every horizon come from one
+    cumulative count, and the return sums for all horizons are a single
+    (periods x days) @ (days x horizons) product. Means agree with
+    score_periods() for each horizon up to floating-point rounding.
+
+    Parameters:
+        values (array-like): Closing prices, oldest first, without NaNs
+        sma_periods (list of int): SMA window lengths
+        horizons (list of int): Holding periods in days
+    Returns:
+        tuple: (avg_returns (periods x horizons, NaN where no signals),
+                signal_counts (periods x horizons int array))
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    signal = signal_matrix(values, sma_periods)
+
+    # Forward returns for every horizon as columns (0 where not yet known)
+    fwd = np.zeros((n, len(horizons)))
+    for col, h in enumerate(horizons):
+        fwd[:, col] = np.nan_to_num(forward_returns(values, h), nan=0.0)
+
+    # Signal days with a known h-day return are exactly the first n - h days
+    known = np.array([max(n - h, 0) for h in horizons])
+    running = np.concatenate((np.zeros((len(signal), 1), dtype=np.int64), np.cumsum(signal, axis=1)), axis=1)
+    counts = running[:, known]
+
+    totals = signal.astype(np.float64) @ fwd
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg = np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+    return avg, counts
+
+
+def sma_score_table(close, sma_periods, forward_days=50):
+    """
+    Returns the full per-period score table for one stock.
+
+    Parameters:
+        close (pd.Series or array-like): Closing prices, oldest first
+        sma_periods (list of int): SMA window lengths
+        forward_days (int): Holding period in days
+    Returns:
+        pd.DataFrame: Columns SMA_Period, Avg_Forward_Return, Signals
+    """
+    values = _clean_values(close)
+    avg, counts = score_periods(values, sma_periods, forward_days)
+
+    return pd.DataFrame({
+        "SMA_Period": np.asarray(sma_periods, dtype=np.int64),
+        "Avg_Forward_Return": avg,
+        "Signals": counts.astype(np.int64),
+    })
+
+
+def best_from_scores(sma_periods, avg_returns, signal_counts, label="Best_Avg_Forward_50d"):
+    """
+    Picks the SMA period with the highest average forward return.
+    Ties go to the earliest period, as in the original per-period loop.
+
+    Returns:
+        dict or None: {"Best_SMA", label, "Signals"}
+    """
+    avg_returns = np.asarray(avg_returns, dtype=np.float64)
+    if np.isnan(avg_returns).all():
+        return None  # No suitable SMA found
+
+    best = int(np.nanargmax(avg_returns))
+    return {
+        "Best_SMA": int(sma_periods[best]),
+        label: float(avg_returns[best]),
+        "Signals": int(signal_counts[best])
+    }
+
+
+def _clean_values(close):
+    # Accept Series or arrays; drop NaNs the same way close.dropna() does
+    values = np.asarray(close, dtype=np.float64)
+    return values[~np.isnan(values)]
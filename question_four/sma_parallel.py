@@ -0,0 +1,123 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .sma_cube import CUBE_COLUMNS, build_score_cube, score_ticker, cube_rows
+    from .price_store import PriceStore, ticker_values
+except ImportError:  # Run as a script from inside question_four/
+    from sma_cube import CUBE_COLUMNS, build_score_cube, score_ticker, cube_rows
+    from price_store import PriceStore, ticker_values
+
+"""
+Process-pool scoring across tickers.
+
+All closing prices are packed once into a single shared-memory block; workers
+attach to it when they start and read their tickers as zero-copy slices, so
+only (row, start, stop) offsets travel through the task queue. Results are put
+back in ticker order, so the cube is identical to the serial build.
+
+A PriceStore saved on disk is not copied at all: each worker memory-maps the
+store file itself and reads rows by their valid-range offsets.
+"""
+
+# Per-worker 2-D view of the prices (set by _attach_prices or _open_store)
+_worker_prices = None
+_worker_shm = None
+
+
+def build_score_cube_parallel(close_df, tickers, sma_periods, forward_days=50, workers=None, tickers_per_task=8):
+    """
+    Parallel version of sma_cube.build_score_cube().
+
+    Parameters:
+        close_df (pd.DataFrame or PriceStore): Closing prices, one column per ticker
+        tickers (list of str): Tickers to score (missing columns are skipped)
+        sma_periods (list of int): SMA window lengths
+        forward_days (int or list of int): Holding period(s) in days
+        workers (int): Number of processes (default: all CPU cores);
+            1 or fewer runs the serial build
+        tickers_per_task (int): Tickers handed to a worker per task
+    Returns:
+        pd.DataFrame: Same cube as build_score_cube()
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        return build_score_cube(close_df, tickers, sma_periods, forward_days)
+
+    tickers = [t for t in tickers if t in close_df.columns]
+    if not tickers:
+        return pd.DataFrame(columns=CUBE_COLUMNS)
+
+    if isinstance(close_df, PriceStore) and close_df.path is not None:
+        # Workers map the saved store themselves: nothing to copy or pack
+        rows = [close_df.tickers.index(t) for t in tickers]
+        slices = [(row, int(close_df.starts[row]), int(close_df.stops[row])) for row in rows]
+        lengths = np.array([stop - start for _, start, stop in slices], dtype=np.int64)
+        scores = _run_pool(slices, sma_periods, forward_days, workers, tickers_per_task,
+                           _open_store, (close_df.path,))
+    else:
+        # Pack every ticker's NaN-free history back to back in one flat array
+        series = [ticker_values(close_df, t) for t in tickers]
+        lengths = np.array([len(s) for s in series], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        shm = shared_memory.SharedMemory(create=True, size=max(int(lengths.sum()), 1) * 8)
+        try:
+            packed = np.ndarray((int(lengths.sum()),), dtype=np.float64, buffer=shm.buf)
+            for s, start in zip(series, offsets):
+                packed[start:start + len(s)] = s
+            del packed
+
+            slices = [(0, int(start), int(start + length)) for start, length in zip(offsets, lengths)]
+            scores = _run_pool(slices, sma_periods, forward_days, workers, tickers_per_task,
+                               _attach_prices, (shm.name, int(lengths.sum())))
+        finally:
+            shm.close()
+            shm.unlink()
+
+    frames = [
+        cube_rows(ticker, sma_periods, forward_days, avg, counts, length)
+        for ticker, (avg, counts), length in zip(tickers, scores, lengths)
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _run_pool(slices, sma_periods, forward_days, workers, tickers_per_task, initializer, initargs):
+    # Fan (row, start, stop) slices out in batches; return scores in input order
+    tasks = [
+        [(i, *slices[i]) for i in range(k, min(k + tickers_per_task, len(slices)))]
+        for k in range(0, len(slices), tickers_per_task)
+    ]
+
+    scores = [None] * len(slices)
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        for chunk in pool.map(_score_slices, tasks, [list(sma_periods)] * len(tasks),
+                              [forward_days] * len(tasks)):
+            for i, avg, counts in chunk:
+                scores[i] = (avg, counts)
+    return scores
+
+
+def _attach_prices(name, size):
+    # Runs once in each worker: map the shared block without copying it
+    global _worker_prices, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=name)
+    _worker_prices = np.ndarray((1, size), dtype=np.float64, buffer=_worker_shm.buf)
+
+
+def _open_store(path):
+    # Runs once in each worker: memory-map the saved price store
+    global _worker_prices
+    _worker_prices = PriceStore.open(path).values
+
+
+def _score_slices(slices, sma_periods, forward_days):
+    # Score a batch of tickers, each a zero-copy slice of one price row
+    return [
+        (i, *score_ticker(_worker_prices[row, start:stop], sma_periods, forward_days))
+        for i, row, start, stop in slices
+    ]
@@ -0,0 +1,133 @@
+import numpy as np
+
+"""
+Streaming "Close > SMA" signals for live daily bars.
+
+SmaSignalState keeps, for one ticker, a ring buffer of recent closes, a
+running window sum per candidate SMA period, and a ring of recent signals so
+forward returns can be credited once they are realised. Each new bar costs
+O(periods), and the whole state can be serialised to plain Python types.
+"""
+
+
+class SmaSignalState:
+    """
+    Incremental SMA signal and forward-return statistics for one ticker.
+
+    Parameters:
+        sma_periods (list of int): SMA window lengths
+        forward_days (int): Holding period in days for the return statistics
+    """
+
+    def __init__(self, sma_periods, forward_days=50):
+        self.periods = np.asarray(sma_periods, dtype=np.int64)
+        self.forward_days = int(forward_days)
+
+        # Ring of recent closes, long enough for the longest SMA and the holding period
+        self.size = int(max(self.periods.max(), self.forward_days)) + 1
+        self.closes = np.zeros(self.size)
+        self.bars = 0  # Number of closes seen so far
+
+        self.window_sums = np.zeros(len(self.periods))
+        self.signal = np.zeros(len(self.periods), dtype=bool)
+
+        # Signals of the last forward_days bars, waiting for their forward return
+        self.pending = np.zeros((max(self.forward_days, 1), len(self.periods)), dtype=bool)
+        self.return_sums = np.zeros(len(self.periods))
+        self.return_counts = np.zeros(len(self.periods), dtype=np.int64)
+
+    @classmethod
+    def from_history(cls, closes, sma_periods, forward_days=50):
+        """
+        Builds a warm state by replaying a price history (oldest first).
+        """
+        state = cls(sma_periods, forward_days)
+        for close in np.asarray(closes, dtype=np.float64):
+            state.update(close)
+        return state
+
+    def update(self, close):
+        """
+        Adds one new daily close and returns the "Close > SMA" signal for
+        every period (False until a period's window is full).
+        """
+        close = float(close)
+        t = self.bars
+
+        # Credit the forward return of the bar forward_days ago to its signals
+        if self.forward_days and t >= self.forward_days:
+            past = self.closes[(t - self.forward_days) % self.size]
+            fired = self.pending[t % self.forward_days]
+            self.return_sums[fired] += close / past - 1
+            self.return_counts[fired] += 1
+
+        # Slide every window: add the new close, drop the one leaving each window
+        leaving = t - self.periods
+        dropped = np.where(leaving >= 0, self.closes[leaving % self.size], 0.0)
+        self.window_sums += close - dropped
+        self.closes[t % self.size] = close
+        self.bars = t + 1
+
+        # Re-sum the windows exactly once per ring cycle so rounding cannot drift
+        if self.bars % self.size == 0:
+            self._resync()
+
+        full = self.bars >= self.periods
+        self.signal = full & (close > self.window_sums / self.periods)
+        if self.forward_days:
+            self.pending[t % self.forward_days] = self.signal
+        return self.signal.copy()
+
+    @property
+    def sma(self):
+        """
+        Current SMA per period (NaN until the window is full).
+        """
+        return np.where(self.bars >= self.periods, self.window_sums / self.periods, np.nan)
+
+    @property
+    def avg_forward_returns(self):
+        """
+        Running mean forward return on signal days per period (NaN if none yet).
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.return_counts > 0, self.return_sums / np.maximum(self.return_counts, 1), np.nan)
+
+    def to_dict(self):
+        """
+        Serialises the state to JSON-compatible Python types.
+        """
+        return {
+            "sma_periods": self.periods.tolist(),
+            "forward_days": self.forward_days,
+            "bars": self.bars,
+            "closes": self.closes.tolist(),
+            "window_sums": self.window_sums.tolist(),
+            "signal": self.signal.tolist(),
+            "pending": self.pending.tolist(),
+            "return_sums": self.return_sums.tolist(),
+            "return_counts": self.return_counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Restores a state written by to_dict().
+        """
+        state = cls(data["sma_periods"], data["forward_days"])
+        state.bars = int(data["bars"])
+        state.closes = np.asarray(data["closes"], dtype=np.float64)
+        state.window_sums = np.asarray(data["window_sums"], dtype=np.float64)
+        state.signal = np.asarray(data["signal"], dtype=bool)
+        state.pending = np.asarray(data["pending"], dtype=bool).reshape(state.pending.shape)
+        state.return_sums = np.asarray(data["return_sums"], dtype=np.float64)
+        state.return_counts = np.asarray(data["return_counts"], dtype=np.int64)
+        return state
+
+    def _resync(self):
+        # Recent closes, newest first, then each window sum from one cumulative sum
+        t = self.bars - 1
+        recent = self.closes[(t - np.arange(min(self.bars, self.size))) % self.size]
+        csum = np.cumsum(recent)
+        full = self.periods <= len(recent)
+        self.window_sums = np.where(full, csum[np.minimum(self.periods, len(recent)) - 1], self.window_sums)
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from .sma_engine import signal_matrix, forward_returns
+except ImportError:  # Run as a script from inside question_four/
+    from sma_engine import signal_matrix, forward_returns
+
+"""
+Walk-forward SMA period selection.
+
+The period is re-selected on each rolling training window and evaluated on
+the next out-of-sample block. Signals and forward returns are computed once
+per ticker, then turned into per-period prefix sums over time, so scoring any
+window is a difference of two prefix-sum columns: O(periods) per window step
+instead of a full re-sweep.
+
+A training window [start, end) only scores signal days whose forward price
+also falls inside it (t + forward_days < end), so selection never looks past
+the window. The test block scores signal days in [end, end + test_days).
+"""
+
+WALK_FORWARD_COLUMNS = [
+    "Ticker", "Window", "Train_Start", "Train_End", "Test_Start", "Test_End",
+    "Best_SMA", "Train_Avg_Forward_Return", "Train_Signals",
+    "OOS_Avg_Forward_Return", "OOS_Signals",
+]
+
+
+def walk_forward_windows(n_days, train_days, test_days, forward_days):
+    """
+    Lists the (train_start, train_end, test_end) day positions of each step.
+    Windows advance by test_days; the last test block may be shorter but
+    must contain at least one day with a known forward return.
+
+    train_days must be longer than forward_days, otherwise no training day
+    has its forward price inside the window (ValueError).
+    """
+    if train_days <= forward_days:
+        raise ValueError(f"train_days ({train_days}) must be greater than forward_days ({forward_days})")
+    windows = []
+    start = 0
+    while start + train_days < n_days - forward_days:
+        end = start + train_days
+        windows.append((start, end, min(end + test_days, n_days)))
+        start += test_days
+    return windows
+
+
+def walk_forward_ticker(close, sma_periods, forward_days=50, train_days=756, test_days=252, ticker=None):
+    """
+    Runs the walk-forward selection for one stock.
+
+    Parameters:
+        close (pd.Series): Closing prices (NaNs are dropped)
+        sma_periods (list of int): SMA window lengths
+        forward_days (int): Holding period in days
+        train_days (int): Training window length, > forward_days (default: ~3 years)
+        test_days (int): Out-of-sample block length and step (default: ~1 year)
+        ticker (str): Label for the Ticker column
+    Returns:
+        pd.DataFrame: One row per window with WALK_FORWARD_COLUMNS
+    """
+    close = close.dropna()
+    values = close.to_numpy(dtype=np.float64)
+    dates = close.index
+    periods = np.asarray(sma_periods, dtype=np.int64)
+
+    windows = walk_forward_windows(len(values), train_days, test_days, forward_days)
+    if not windows:
+        return pd.DataFrame(columns=WALK_FORWARD_COLUMNS)
+
+    # Signal-day returns and counts as prefix sums over time (periods x days+1)
+    fwd = forward_returns(values, forward_days)
+    valid = signal_matrix(values, periods) & ~np.isnan(fwd)[None, :]
+    zeros = np.zeros((len(periods), 1))
+    ret_sums = np.concatenate((zeros, np.cumsum(np.where(valid, fwd, 0.0), axis=1)), axis=1)
+    counts = np.concatenate((zeros.astype(np.int64), np.cumsum(valid, axis=1)), axis=1)
+
+    rows = []
+    for window, (start, end, test_end) in enumerate(windows):
+        # Training score for every period: one prefix-sum difference each
+        last = end - forward_days
+        train_counts = counts[:, last] - counts[:, start]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            train_avg = np.where(train_counts > 0,
+                                 (ret_sums[:, last] - ret_sums[:, start]) / train_counts, np.nan)
+
+        best_sma = None
+        oos_avg, oos_signals = np.nan, 0
+        best_avg, best_signals = np.nan, 0
+
+        if not np.isnan(train_avg).all():
+            best = int(np.nanargmax(train_avg))
+            best_sma = int(periods[best])
+            best_avg, best_signals = float(train_avg[best]), int(train_counts[best])
+
+            # Out-of-sample score of the chosen period on the next block
+            oos_signals = int(counts[best, test_end] - counts[best, end])
+            if oos_signals:
+                oos_avg = float((ret_sums[best, test_end] - ret_sums[best, end]) / oos_signals)
+
+        rows.append({
+            "Ticker": ticker,
+            "Window": window,
+            "Train_Start": dates[start],
+            "Train_End": dates[end - 1],
+            "Test_Start": dates[end],
+            "Test_End": dates[test_end - 1],
+            "Best_SMA": best_sma,
+            "Train_Avg_Forward_Return": best_avg,
+            "Train_Signals": best_signals,
+            "OOS_Avg_Forward_Return": oos_avg,
+            "OOS_Signals": oos_signals,
+        })
+
+    return pd.DataFrame(rows, columns=WALK_FORWARD_COLUMNS)
+
+
+def walk_forward_table(close_df, tickers, sma_periods, forward_days=50, train_days=756, test_days=252):
+    """
+    Walk-forward selection table for every ticker (missing columns are skipped).
+    """
+    frames = [
+        walk_forward_ticker(close_df[ticker], sma_periods, forward_days, train_days, test_days, ticker=ticker)
+        for ticker in tickers if ticker in close_df.columns
+    ]
+    frames = [frame for frame in frames if not frame.empty]
+
+    if not frames:
+        return pd.DataFrame(columns=WALK_FORWARD_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
@@ -1,7 +1,81 @@
+import argparse
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 # Import the modular function to perform the cipher shift
-from cipher_helpers import shift_cipher
+try:
+    from .cipher_helpers import shift_cipher
+except ImportError:  # Run as a script from inside question_one/
+    from cipher_helpers import shift_cipher
+
+# Characters read and translated at a time in streaming mode
+CHUNK_SIZE = 1 << 20
+
+
+def cipher_stream(source, target, shift, chunk_size=CHUNK_SIZE, workers=1):
+    """
+    Applies the shift cipher to a stream, one fixed-size chunk at a time.
+
+    Memory use depends on the chunk size, not on the input size. With more
+    than one worker, chunks are translated in a process pool; at most two
+    chunks per worker are in flight and they are written back in input order.
+
+    Parameters:
+        source (file object): Text (or binary) stream to read
+        target (file object): Stream of the same kind to write
+        shift (int): The number of positions to shift each letter
+        chunk_size (int): Characters (or bytes) per chunk
+        workers (int): Worker processes (1 translates in this process)
+    """
+    if workers <= 1:
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            target.write(shift_cipher(chunk, shift))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            pending.append(pool.submit(shift_cipher, chunk, shift))
+            if len(pending) >= 2 * workers:
+                target.write(pending.popleft().result())
+        while pending:
+            target.write(pending.popleft().result())
+
+
+def stream_files(paths, shift, output=None, chunk_size=CHUNK_SIZE, workers=1):
+    """
+    Streams each file (or stdin for "-" / no paths) through the cipher to
+    `output` (or stdout). Line endings and encoding (UTF-8) are preserved.
+    """
+    target = open(output, "w", encoding="utf-8", newline="") if output else _untranslated(sys.stdout)
+    try:
+        for path in paths or ["-"]:
+            if path == "-":
+                cipher_stream(_untranslated(sys.stdin), target, shift, chunk_size, workers)
+            else:
+                with open(path, encoding="utf-8", newline="") as source:
+                    cipher_stream(source, target, shift, chunk_size, workers)
+    finally:
+        if output:
+            target.close()
 
-def main():
+
+def _untranslated(stream):
+    # stdin/stdout as UTF-8 without newline translation, like the files
+    # (streams that cannot be reconfigured, e.g. StringIO, are used as is)
+    if hasattr(stream, "reconfigure"):
+        stream.reconfigure(encoding="utf-8", newline="")
+    return stream
+
+
+def interactive():
     # Step 1: Prompt user for input
     # The input can include spaces and punctuation
     word = input("Enter a word to scramble: ")  # Word to scramble
@@ -25,6 +99,28 @@ def main():
     # Print the scrambled word
     print(f"The scrambled word is: {scrambled_word}")
 
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Shift cipher. Without --shift, asks for a word and a shift interactively.")
+    parser.add_argument("files", nargs="*", help='files to encipher in streaming mode ("-" or none: stdin)')
+    parser.add_argument("--shift", type=int, help="shift to apply; enables non-interactive streaming mode")
+    parser.add_argument("--decode", action="store_true", help="shift back instead of forward")
+    parser.add_argument("--output", help="output file (default: stdout)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="characters per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes for large inputs")
+    args = parser.parse_args(argv)
+
+    if args.shift is None:
+        if args.files or args.decode or args.output:
+            parser.error("files, --decode and --output need --shift")
+        interactive()
+        return
+
+    shift = -args.shift if args.decode else args.shift
+    stream_files(args.files, shift % 26, args.output, args.chunk_size, args.workers)
+
+
 # Ensures this file runs only when executed directly
 if __name__ == "__main__":
     main()
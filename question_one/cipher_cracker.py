@@ -0,0 +1,88 @@
+import numpy as np
+
+"""
+Frequency-analysis cracker for the shift cipher.
+
+The ciphertext is reduced to one 26-bin letter histogram. Deciphering with
+shift s only relabels the bins, so the histogram of every candidate
+plaintext is the same histogram rotated by s: all 26 shifts are scored at
+once from a (26 x 26) gather of the bins, without deciphering the text.
+"""
+
+# Relative frequency of a-z in English text (percent)
+ENGLISH_FREQUENCIES = np.array([
+    8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025, 2.406,
+    6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074,
+]) / 100
+
+# _ROTATIONS[s, j]: cipher bin holding plaintext letter j when the shift is s
+_ROTATIONS = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+
+
+def letter_histogram(text):
+    """
+    Counts the ASCII letters a-z (either case) in a text.
+
+    Parameters:
+        text (str or bytes): Ciphertext
+    Returns:
+        np.ndarray: 26 letter counts
+    """
+    if isinstance(text, str):
+        text = text.encode("ascii", "ignore")  # Only ASCII letters are shifted
+    counts = np.bincount(np.frombuffer(text, dtype=np.uint8), minlength=256)
+    return counts[97:123] + counts[65:91]
+
+
+def score_shifts(histograms, method="chi2"):
+    """
+    Scores every shift for one or more letter histograms (lower is better).
+
+    Parameters:
+        histograms (array-like): 26 counts, or an (n x 26) matrix of them
+        method (str): "chi2" (chi-squared distance from English) or
+            "loglik" (negative log-likelihood under English frequencies)
+    Returns:
+        np.ndarray: Scores with the same leading shape, one per shift 0-25
+    """
+    histograms = np.asarray(histograms, dtype=np.float64)
+    observed = histograms[..., _ROTATIONS]  # (..., shift, letter)
+
+    if method == "chi2":
+        expected = histograms.sum(axis=-1)[..., None, None] * ENGLISH_FREQUENCIES
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.nan_to_num(((observed - expected) ** 2 / expected).sum(axis=-1))
+    if method == "loglik":
+        return -(observed * np.log(ENGLISH_FREQUENCIES)).sum(axis=-1)
+    raise ValueError(f"Unknown scoring method: {method!r}")
+
+
+def crack_shift(text, method="chi2"):
+    """
+    Ranks the shifts that may have produced a ciphertext.
+
+    Parameters:
+        text (str or bytes): Ciphertext from shift_cipher()
+        method (str): Scoring method (see score_shifts())
+    Returns:
+        list of tuple: (shift, score), most likely shift first
+    """
+    scores = score_shifts(letter_histogram(text), method)
+    order = np.argsort(scores, kind="stable")
+    return [(int(shift), float(scores[shift])) for shift in order]
+
+
+def crack_shifts(texts, method="chi2"):
+    """
+    Batch version of crack_shift() for many messages.
+
+    Parameters:
+        texts (list of str or bytes): Ciphertexts
+        method (str): Scoring method (see score_shifts())
+    Returns:
+        tuple: (ranked shifts (n x 26 int array, best first), matching scores)
+    """
+    histograms = np.array([letter_histogram(text) for text in texts]).reshape(len(texts), 26)
+    scores = score_shifts(histograms, method)
+    order = np.argsort(scores, axis=1, kind="stable")
+    return order, np.take_along_axis(scores, order, axis=1)
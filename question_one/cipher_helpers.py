@@ -1,29 +1,225 @@
+import string
+from functools import lru_cache
+
+import numpy as np
+
+
+class _ShiftTable(dict):
+    """
+    str.translate() table for one shift. The 52 ASCII letters are filled in up
+    front; any other character is worked out the first time it is seen (with
+    the same rule as the original per-character loop) and then cached.
+    """
+
+    def __init__(self, shift):
+        super().__init__()
+        self.shift = shift
+        for char in string.ascii_letters:
+            self[ord(char)] = self._shift_char(ord(char))
+
+    def __missing__(self, code):
+        # Non-ASCII characters: letters are shifted like the ASCII ones,
+        # everything else maps to itself
+        self[code] = self._shift_char(code)
+        return self[code]
+
+    def _shift_char(self, code):
+        char = chr(code)
+        if not char.isalpha():
+            return code
+        # ASCII starting point depends on case: 'A' (65) and 'a' (97)
+        start = 65 if char.isupper() else 97
+        return (code - start + self.shift) % 26 + start
+
+
+def shift_table(shift):
+    """
+    Returns the cached str.translate() table for a shift (any int, taken mod 26).
+    """
+    return _shift_table(shift % 26)
+
+
+def shift_bytes_table(shift):
+    """
+    Returns the cached 256-byte bytes.translate() table for a shift.
+    Only the ASCII letters change; every other byte maps to itself.
+    """
+    return _shift_bytes_table(shift % 26)
+
+
+# Cached on the shift mod 26, so at most 26 tables of each kind are ever built
+@lru_cache(maxsize=26)
+def _shift_table(shift):
+    return _ShiftTable(shift)
+
+
+@lru_cache(maxsize=26)
+def _shift_bytes_table(shift):
+    table = bytearray(range(256))
+    for start in (65, 97):
+        for offset in range(26):
+            table[start + offset] = start + (offset + shift) % 26
+    return bytes(table)
+
+
 def shift_cipher(word, shift):
     """
     Shifts each letter of the input word by the given shift value.
     This function works for both uppercase and lowercase letters.
     Non-alphabetic characters remain unchanged.
-    
+
+    The text is translated in one call with a table cached per shift, so long
+    inputs are not walked character by character in Python. Bytes input is
+    translated with a bytes table (ASCII letters only).
+
     Parameters:
-        word (str): The word or text to be scrambled.
+        word (str or bytes): The word or text to be scrambled.
         shift (int): The number of positions to shift each letter (X).
     Returns:
-        str: The scrambled word after applying the cipher.    
-    """
-    result = []  # This will store the scrambled word
-    
-    for char in word:
-        if char.isalpha():
-            # Determine if the character is uppercase or lowercase
-            # ASCII starting point depends on case
-            start = 65 if char.isupper() else 97  # ASCII value of 'A' (65) and 'a' (97)
-
-            # Shift the character and handle wrapping with modulo 26
-            shifted_char = chr((ord(char) - start + shift) % 26 + start)
-            result.append(shifted_char)
+        str (or bytes): The scrambled word after applying the cipher.
+    """
+    if isinstance(word, (bytes, bytearray, memoryview)):
+        return bytes(word).translate(shift_bytes_table(shift))
+    return word.translate(shift_table(shift))
+
+
+def shift_decipher(word, shift):
+    """
+    Reverses shift_cipher(): shifts each letter back by the given shift value.
+    (Non-ASCII letters are folded into a-z/A-Z by the cipher, so only ASCII
+    text round-trips exactly.)
+
+    Parameters:
+        word (str or bytes): The scrambled text.
+        shift (int): The shift that was used to scramble it.
+    Returns:
+        str (or bytes): The original text.
+    """
+    return shift_cipher(word, -shift)
+
+
+def keyed_cipher(word, key, per_letter=True):
+    """
+    Shifts each letter by a shift that changes with its position (keyed /
+    Vigenère-style cipher). Letters are shifted with the same rule as
+    shift_cipher(), so a single-shift key gives exactly the same output and
+    any key matches its repeated form ("b" and "bb"). Non-letters remain
+    unchanged. (Non-ASCII letters are folded into a-z/A-Z, so only ASCII
+    text round-trips exactly through keyed_decipher().)
+
+    The text is handled as a NumPy array of character codes and the key
+    stream is added modulo 26 to the ASCII letters in one vectorized step.
+
+    Parameters:
+        word (str or bytes): The text to be scrambled.
+        key (str, int or list of int): Shifts, repeated along the text. A
+            string key uses letter positions ('a' or 'A' = 0, 'b' = 1, ...).
+        per_letter (bool): Advance the key on letters only (classic Vigenère);
+            if False, it advances on every character.
+    Returns:
+        str (or bytes): The scrambled text.
+    """
+    return keyed_cipher_batch([word], [key], per_letter)[0]
+
+
+def keyed_decipher(word, key, per_letter=True):
+    """
+    Reverses keyed_cipher() by applying the negated key.
+    """
+    return keyed_cipher(word, [-shift for shift in _key_shifts(key)], per_letter)
+
+
+def keyed_cipher_batch(records, key, per_letter=True):
+    """
+    Applies keyed_cipher() to many records in one vectorized pass.
+
+    Parameters:
+        records (list of str, or list of bytes): Texts to be scrambled.
+        key: One key for every record, or a list with one key (str or list
+            of int) per record. The key stream restarts at each record.
+        per_letter (bool): See keyed_cipher().
+    Returns:
+        list: The scrambled records, in order.
+    """
+    if not records:
+        return []
+
+    # One key for all, or one per record (a list of keys has list/str items)
+    shared = isinstance(key, (str, int)) or not any(isinstance(k, (str, list, tuple)) for k in key)
+    keys = [_key_shifts(key)] if shared else [_key_shifts(k) for k in key]
+    if not shared and len(keys) != len(records):
+        raise ValueError("Expected one key per record")
+
+    # Single shift for every record: shift_cipher() is the exact reference
+    if all(len(k) == 1 for k in keys) and len({k[0] % 26 for k in keys}) == 1:
+        return [shift_cipher(record, keys[0][0]) for record in records]
+
+    is_bytes = isinstance(records[0], (bytes, bytearray))
+    lengths = np.array([len(record) for record in records], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    # Character codes of all records back to back (1 byte each if ASCII)
+    if is_bytes:
+        joined = b"".join(bytes(record) for record in records)
+        codes = np.frombuffer(joined, dtype=np.uint8)
+    else:
+        joined = "".join(records)
+        if joined.isascii():
+            codes = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
         else:
-            # Preserve spaces, punctuation, and digits
-            result.append(char)
+            codes = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+
+    upper = (codes >= 65) & (codes <= 90)
+    letter = upper | ((codes >= 97) & (codes <= 122))
+    if codes.dtype != np.uint8:
+        # Non-ASCII letters follow shift_cipher(): isalpha() decides whether
+        # they shift, isupper() whether they start from 'A' or 'a'
+        other = np.unique(codes[codes > 127])
+        other_alpha = np.array([chr(code).isalpha() for code in other.tolist()], dtype=bool)
+        other_upper = np.array([chr(code).isupper() for code in other.tolist()], dtype=bool)
+        where = codes > 127
+        position = np.searchsorted(other, codes[where])
+        letter[where] = other_alpha[position]
+        upper[where] = other_upper[position]
+    record = np.repeat(np.arange(len(records)), lengths)
+
+    # Position of every character in its record's key stream
+    if per_letter:
+        letters_before = np.concatenate(([0], np.cumsum(letter)))
+        step = letters_before[:-1] - letters_before[starts][record]
+    else:
+        step = np.arange(len(codes)) - starts[record]
+
+    # Flatten the keys so each character can look up its shift
+    flat_keys = np.array([shift % 26 for k in keys for shift in k], dtype=np.int64)
+    if shared:
+        shifts = flat_keys[step % len(flat_keys)]
+    else:
+        key_lengths = np.array([len(k) for k in keys], dtype=np.int64)
+        key_starts = np.concatenate(([0], np.cumsum(key_lengths)[:-1]))
+        shifts = flat_keys[key_starts[record] + step % key_lengths[record]]
+
+    base = np.where(upper, 65, 97)
+    shifted = np.where(letter, (codes.astype(np.int64) - base + shifts) % 26 + base, codes).astype(codes.dtype)
+
+    if is_bytes:
+        text = shifted.tobytes()
+    elif shifted.dtype == np.uint8:
+        text = shifted.tobytes().decode("ascii")
+    else:
+        text = shifted.tobytes().decode("utf-32-le")
+    return [text[start:start + length] for start, length in zip(starts.tolist(), lengths.tolist())]
+
 
-    # Convert list of characters back into a string
-    return ''.join(result)
+def _key_shifts(key):
+    # Normalise a key to a list of int shifts
+    if isinstance(key, str):
+        if not key.isascii() or not key.isalpha():
+            raise ValueError(f"Key must contain only the letters a-z: {key!r}")
+        return [ord(char) - 97 for char in key.lower()]
+    if isinstance(key, int):
+        return [key]
+    shifts = [int(shift) for shift in key]
+    if not shifts:
+        raise ValueError("Key must contain at least one shift")
+    return shifts
@@ -0,0 +1,156 @@
+import numpy as np
+
+try:
+    from .part_a_luhn_algo import DOUBLED_DIGIT_SUM
+except ImportError:  # Run as a script from inside question_three/
+    from part_a_luhn_algo import DOUBLED_DIGIT_SUM
+
+"""
+Bulk Luhn validation over NumPy digit matrices.
+
+A batch of account numbers (ints or digit strings) is turned into one padded
+(numbers x digits) uint8 matrix, right-aligned so every column has the same
+position from the right. Every second digit from the right goes through a
+precomputed doubled-digit table, and the checksums are one row sum.
+Results are identical to luhn_algorithm(), find_validation_digit() and
+luhn_check().
+"""
+
+# Digit sum of 2 * d for d = 0..9 (e.g. 7 -> 14 -> 1 + 4 = 5)
+DOUBLED_DIGIT = np.array(DOUBLED_DIGIT_SUM, dtype=np.uint8)
+
+
+def parse_digits(numbers):
+    """
+    Converts account numbers into a right-aligned, zero-padded digit matrix.
+
+    Leading zero padding does not change a Luhn checksum, so numbers of
+    different lengths can share one matrix.
+
+    Parameters:
+        numbers (array-like): Non-negative ints, or strings/bytes of digits
+    Returns:
+        tuple: (digits (n x width uint8 matrix),
+                well_formed (bool array, False for rows that are not all digits))
+    """
+    array = np.asarray(numbers)
+
+    if array.dtype.kind in "iu":
+        return _int_digits(array.ravel())
+
+    # Everything else goes through fixed-width ASCII bytes
+    if array.dtype.kind == "U":
+        # Unicode arrays are UCS-4 code points; anything above 127 is not a digit
+        flat = array.ravel()
+        codes = flat.view(np.uint32).reshape(len(flat), flat.dtype.itemsize // 4)
+        ascii_ok = (codes < 128).all(axis=1)
+        text = np.where(ascii_ok, flat, "").astype("S")
+    elif array.dtype.kind == "S":
+        ascii_ok = np.ones(array.size, dtype=bool)
+        text = array.ravel()
+    else:
+        # Python objects (e.g. ints too large for int64): use their str()
+        strings = [str(number) for number in array.ravel()]
+        ascii_ok = np.array([s.isascii() for s in strings], dtype=bool)
+        text = np.array([s if ok else "" for s, ok in zip(strings, ascii_ok)], dtype="S")
+
+    return _byte_digits(text, ascii_ok)
+
+
+def luhn_batch(numbers):
+    """
+    Applies the Luhn algorithm to a whole batch of account numbers.
+
+    Parameters:
+        numbers (array-like): Account numbers (ints or digit strings)
+    Returns:
+        tuple: (is_valid (bool array), checksum_total (int64 array))
+    """
+    is_valid, checksum, _, _ = luhn_check_batch(numbers)
+    return is_valid, checksum
+
+
+def validation_digits_batch(numbers):
+    """
+    Batch version of find_validation_digit(): the digit that makes each
+    number's checksum divisible by 10.
+    """
+    return luhn_check_batch(numbers)[2]
+
+
+def luhn_check_batch(numbers):
+    """
+    Batch version of luhn_check(): every result from one parse of the batch.
+
+    Parameters:
+        numbers (array-like): Account numbers (ints or digit strings)
+    Returns:
+        tuple: (is_valid, checksum_total, validation_digit, correction) arrays
+    """
+    digits, well_formed = parse_digits(numbers)
+    if not well_formed.all():
+        bad = np.flatnonzero(~well_formed)[0]
+        raise ValueError(f"Account number at position {bad} is not a string of digits: {np.asarray(numbers).ravel()[bad]!r}")
+
+    return check_digits(digits)
+
+
+def check_digits(digits):
+    """
+    Fused check of a right-aligned digit matrix.
+
+    Returns:
+        tuple: (is_valid, checksum_total, validation_digit, correction) arrays
+    """
+    checksum = checksums(digits)
+    validation_digit = (10 - checksum % 10) % 10
+    correction = np.abs(validation_digit - digits[:, -1].astype(np.int64))
+    return validation_digit == 0, checksum, validation_digit, correction
+
+
+def checksums(digits):
+    """
+    Luhn checksum of every row of a right-aligned digit matrix.
+    """
+    width = digits.shape[1]
+    # Every second digit from the right (rightmost is position 0) is doubled
+    doubled = ((width - 1 - np.arange(width)) % 2 == 1)
+
+    contributions = np.where(doubled, DOUBLED_DIGIT[digits], digits)
+    return contributions.sum(axis=1, dtype=np.int64)
+
+
+def _int_digits(values):
+    # Peel off decimal digits right to left; leading zeros pad shorter numbers
+    if (values < 0).any():
+        well_formed = values >= 0
+        values = np.where(well_formed, values, 0)
+    else:
+        well_formed = np.ones(len(values), dtype=bool)
+
+    values = values.astype(np.uint64)
+    width = len(str(int(values.max()))) if len(values) else 1
+
+    digits = np.zeros((len(values), width), dtype=np.uint8)
+    for col in range(width - 1, -1, -1):
+        digits[:, col] = values % 10
+        values = values // 10
+    return digits, well_formed
+
+
+def _byte_digits(text, ascii_ok):
+    # Fixed-width bytes are left-aligned and NUL padded; view them as a matrix
+    width = max(text.dtype.itemsize, 1)
+    raw = np.frombuffer(text.astype(f"S{width}").tobytes(), dtype=np.uint8).reshape(len(text), width)
+
+    present = raw != 0
+    lengths = present.sum(axis=1)
+    is_digit = (raw >= ord("0")) & (raw <= ord("9"))
+    well_formed = ascii_ok & (is_digit | ~present).all(axis=1)
+
+    # Shift each row right so the last digit of every number lines up
+    left = raw.astype(np.int16) - ord("0")
+    left[~is_digit] = 0
+    source = np.arange(width)[None, :] - (width - lengths)[:, None]
+    digits = np.where(source >= 0, np.take_along_axis(left, np.clip(source, 0, width - 1), axis=1), 0)
+    return digits.astype(np.uint8), well_formed
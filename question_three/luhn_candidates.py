@@ -0,0 +1,177 @@
+import numpy as np
+
+try:
+    from .part_a_luhn_algo import DOUBLED_DIGIT_SUM, luhn_check
+    from .luhn_batch import parse_digits
+    from .luhn_stream import iter_chunks
+except ImportError:  # Run as a script from inside question_three/
+    from part_a_luhn_algo import DOUBLED_DIGIT_SUM, luhn_check
+    from luhn_batch import parse_digits
+    from luhn_stream import iter_chunks
+
+"""
+Typo candidates for account numbers that fail the Luhn check.
+
+The likely intended numbers are the single-digit substitutions and adjacent
+transpositions that pass Luhn. Instead of re-running the check per candidate,
+each edit only changes one or two digit contributions, so the new checksum is
+the old one plus a delta. For a substitution exactly one replacement digit per
+position fixes the checksum (doubling is a permutation of 0-9), so it is
+found by a table lookup rather than by trying all ten digits.
+
+Candidates are looked up in an AccountIndex: the known accounts as one sorted
+array of (number of digits, value) keys (9 bytes per account), searched with
+a binary search. Keeping the length means leading zeros stay significant.
+"""
+
+# Inverse of the doubled-digit table: which digit doubles to a given digit sum
+_UNDOUBLED = tuple(DOUBLED_DIGIT_SUM.index(s) for s in range(10))
+
+# Longest account number an AccountIndex holds (the value must fit in uint64)
+MAX_DIGITS = 19
+KEY_DTYPE = np.dtype([("length", np.uint8), ("value", np.uint64)])
+
+
+def _contribution(digit, position):
+    # Contribution to the checksum of a digit at `position` from the right
+    return DOUBLED_DIGIT_SUM[digit] if position % 2 == 1 else digit
+
+
+def typo_candidates(account_number):
+    """
+    Lists every Luhn-valid number one typo away from `account_number`.
+
+    Parameters:
+        account_number (int or str): Number that failed the Luhn check
+    Returns:
+        list of str: Substitutions (left to right), then adjacent transpositions
+                     (left to right); same length as the input
+    """
+    text = str(account_number)
+    is_valid, checksum, _, _ = luhn_check(text)
+    if is_valid:
+        return []
+
+    digits = [int(d) for d in text]
+    n = len(digits)
+    candidates = []
+
+    # Single-digit substitutions: the replacement must change the checksum by
+    # -checksum (mod 10), which fixes one contribution and so one digit
+    for i, old in enumerate(digits):
+        position = n - 1 - i
+        target = (_contribution(old, position) - checksum) % 10
+        new = _UNDOUBLED[target] if position % 2 == 1 else target
+        candidates.append(text[:i] + str(new) + text[i + 1:])
+
+    # Adjacent transpositions: swap the digits' contributions at both positions
+    for i in range(n - 1):
+        left, right = digits[i], digits[i + 1]
+        if left == right:
+            continue
+        position = n - 1 - i  # Position of the left digit; the right one is position - 1
+        delta = (_contribution(right, position) + _contribution(left, position - 1)
+                 - _contribution(left, position) - _contribution(right, position - 1))
+        if (checksum + delta) % 10 == 0:
+            candidates.append(text[:i] + text[i + 1] + text[i] + text[i + 2:])
+
+    return candidates
+
+
+class AccountIndex:
+    """
+    Sorted, de-duplicated array of known account numbers.
+
+    Each account is keyed on its number of digits and its value, so numbers
+    of up to 19 digits are supported and "0799" and "799" are different
+    accounts. Entries that are not 1-19 digits are skipped and counted in
+    `skipped`.
+    """
+
+    def __init__(self, accounts):
+        keys, well_formed = _account_keys(accounts)
+        self._set_keys(keys[well_formed], int((~well_formed).sum()))
+
+    @classmethod
+    def load(cls, path, fmt="csv", column=0, header=False):
+        """
+        Loads the index once from a saved .npy file (memory-mapped) or from a
+        CSV/fixed-width account file, read in chunks. Malformed rows of an
+        account file are skipped and counted, as luhn_stream rejects them.
+        """
+        index = cls.__new__(cls)
+        if str(path).endswith(".npy"):
+            index.keys, index.skipped = np.load(path, mmap_mode="r"), 0
+            return index
+
+        parts, skipped = [], 0
+        for fields, _ in iter_chunks(path, fmt, column, header):
+            keys, well_formed = _account_keys(fields)
+            parts.append(keys[well_formed])
+            skipped += int((~well_formed).sum())
+        index._set_keys(np.concatenate(parts) if parts else np.zeros(0, dtype=KEY_DTYPE), skipped)
+        return index
+
+    def _set_keys(self, keys, skipped):
+        keys = keys[np.lexsort((keys["value"], keys["length"]))]  # By length, then value
+        if len(keys):
+            keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]  # Drop duplicates
+        self.keys = keys
+        self.skipped = skipped
+
+    def save(self, path):
+        # Saved sorted, so load() can memory-map it without sorting again
+        np.save(path, self.keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, account_number):
+        return bool(self.contains([account_number])[0])
+
+    def contains(self, account_numbers):
+        """
+        Returns a bool array: which of the given numbers are known accounts
+        (ints, or strings whose leading zeros count).
+        """
+        keys, found = _account_keys(account_numbers)
+        where = np.searchsorted(self.keys, keys)
+        found &= where < len(self.keys)
+        found[found] = self.keys[where[found]] == keys[found]
+        return found
+
+
+def _account_keys(numbers):
+    # (length, value) keys and a well-formed mask (1-19 ASCII digits)
+    array = np.asarray(numbers).ravel()
+    if array.dtype.kind not in "SU":
+        array = np.array([str(number) for number in array.tolist()], dtype=str)
+    keys = np.zeros(len(array), dtype=KEY_DTYPE)
+    if not len(array):
+        return keys, np.zeros(0, dtype=bool)
+
+    lengths = np.char.str_len(array)
+    digits, well_formed = parse_digits(array)
+    well_formed &= (lengths > 0) & (lengths <= MAX_DIGITS)
+
+    # Value of the (right-aligned) last 19 digits; malformed rows are masked out
+    tail = digits[:, -MAX_DIGITS:].astype(np.uint64)
+    keys["length"] = np.where(well_formed, lengths, 0)
+    keys["value"] = tail @ np.uint64(10) ** np.arange(tail.shape[1] - 1, -1, -1, dtype=np.uint64)
+    return keys, well_formed
+
+
+def likely_accounts(account_number, index):
+    """
+    Known accounts the operator most likely meant to enter.
+
+    Parameters:
+        account_number (int or str): Number that failed the Luhn check
+        index (AccountIndex): Known accounts
+    Returns:
+        list of str: Candidates from typo_candidates() that exist in the index
+    """
+    candidates = typo_candidates(account_number)
+    if not candidates:
+        return []
+    return [c for c, known in zip(candidates, index.contains(candidates)) if known]
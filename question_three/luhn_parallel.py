@@ -0,0 +1,116 @@
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .luhn_stream import (
+        CHUNK_BYTES, CORRECTED_HEADER, VALID_OUT, CORRECTED_OUT, REJECTED_OUT,
+        validate_range, new_summary, merge_summary, _next_line
+    )
+except ImportError:  # Run as a script from inside question_three/
+    from luhn_stream import (
+        CHUNK_BYTES, CORRECTED_HEADER, VALID_OUT, CORRECTED_OUT, REJECTED_OUT,
+        validate_range, new_summary, merge_summary, _next_line
+    )
+
+"""
+Multi-process sharded validation of account-number files.
+
+The input is split into byte-range shards that start and end on record
+boundaries. Each shard is validated by a worker process into its own part
+files; the parts are then concatenated and the shard summaries merged in file
+order, so the outputs and the summary are identical to a serial run.
+"""
+
+
+def shard_bounds(path, shards, fmt="csv", record_length=None):
+    """
+    Splits a file into at most `shards` byte ranges on record boundaries.
+
+    Parameters:
+        path (str): Input file
+        shards (int): Number of ranges wanted
+        fmt (str): "csv" (cut after a newline) or "fixed" (cut between records)
+        record_length (int): Fixed-width record length (default: first line length)
+    Returns:
+        list of tuple: (start, stop) byte offsets, in file order
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if fmt == "fixed" and record_length is None:
+            record_length = _next_line(mm, 0, size)
+
+        cuts = [0]
+        for k in range(1, shards):
+            target = size * k // shards
+            if fmt == "fixed":
+                cut = target - target % record_length
+            else:
+                cut = _next_line(mm, max(target - 1, 0), size)  # Start of the next whole line
+            if cut > cuts[-1]:
+                cuts.append(cut)
+
+    cuts.append(size)
+    return [(start, stop) for start, stop in zip(cuts[:-1], cuts[1:]) if stop > start]
+
+
+def validate_file_parallel(path, valid_out=VALID_OUT, corrected_out=CORRECTED_OUT, rejected_out=REJECTED_OUT,
+                           fmt="csv", column=0, header=False, record_length=None, field_start=0,
+                           field_width=None, chunk_bytes=CHUNK_BYTES, workers=None, shards_per_worker=4):
+    """
+    Parallel version of luhn_stream.validate_file().
+
+    Parameters:
+        (as validate_file(), plus)
+        workers (int): Number of processes (default: all CPU cores);
+            1 or fewer validates the whole file in this process
+        shards_per_worker (int): Shards per worker, so faster workers pick up more
+    Returns:
+        tuple: (summary dict (same as a serial run), rows per second)
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    options = (fmt, column, header, record_length, field_start, field_width, chunk_bytes)
+
+    if workers <= 1:
+        summary = validate_range(path, valid_out, corrected_out, rejected_out, *options)
+        return summary, _rate(summary, started)
+
+    bounds = shard_bounds(path, workers * shards_per_worker, fmt, record_length)
+    summary = new_summary()
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(valid_out))) as tmp:
+        parts = [
+            tuple(os.path.join(tmp, f"{k:06d}.{name}") for name in ("valid", "corrected", "rejected"))
+            for k in range(len(bounds))
+        ]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(validate_range, path, *part, *options, start, stop, False)
+                for part, (start, stop) in zip(parts, bounds)
+            ]
+            # Merge in shard (file) order, whichever worker finishes first
+            for future in futures:
+                merge_summary(summary, future.result())
+
+        for column_index, out in enumerate((valid_out, corrected_out, rejected_out)):
+            with open(out, "wb") as f:
+                if out == corrected_out:
+                    f.write(CORRECTED_HEADER)
+                for part in parts:
+                    with open(part[column_index], "rb") as part_f:
+                        shutil.copyfileobj(part_f, f)
+
+    return summary, _rate(summary, started)
+
+
+def _rate(summary, started):
+    elapsed = time.perf_counter() - started
+    return summary["rows"] / elapsed if elapsed > 0 else float("inf")
@@ -0,0 +1,293 @@
+import argparse
+import json
+import mmap
+import os
+import time
+
+import numpy as np
+
+try:
+    from .luhn_batch import parse_digits, check_digits
+except ImportError:  # Run as a script from inside question_three/
+    from luhn_batch import parse_digits, check_digits
+
+"""
+Streaming validator for account-number feeds.
+
+The input file is memory-mapped and processed in bounded chunks of whole
+lines (CSV) or whole records (fixed-width), so memory use does not grow with
+the file size. Each chunk is validated with the batch Luhn functions, invalid
+numbers get their check digit appended, and the results are appended to three
+output files: valid, corrected and rejected (not a string of digits).
+
+The summary has the same largest correction that find_largest_correction()
+reports: |validation digit - last digit|, first occurrence wins on ties.
+"""
+
+CHUNK_BYTES = 8 * 2**20
+VALID_OUT = "valid_accounts.txt"
+CORRECTED_OUT = "corrected_accounts.csv"
+REJECTED_OUT = "rejected_accounts.txt"
+SUMMARY_OUT = "validation_summary.json"
+CORRECTED_HEADER = b"Original_Account,Corrected_Account\n"
+
+
+def validate_file(path, valid_out=VALID_OUT, corrected_out=CORRECTED_OUT, rejected_out=REJECTED_OUT,
+                  summary_out=None, fmt="csv", column=0, header=False,
+                  record_length=None, field_start=0, field_width=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Validates every account number in a file, one chunk at a time.
+
+    Parameters:
+        path (str): Input file
+        valid_out, corrected_out, rejected_out (str): Output files
+        summary_out (str): Optional JSON file for the summary
+        fmt (str): "csv" (one record per line) or "fixed" (fixed-length records)
+        column (int): CSV column holding the account number
+        header (bool): Skip the first CSV line
+        record_length (int): Fixed-width record length in bytes, line ending included
+            (default: position of the first newline + 1)
+        field_start, field_width (int): Fixed-width account field (default: the
+            whole record without its \n or \r\n line ending). Numbers may be
+            padded on the left with spaces or zeros. A last record without a
+            line ending is still validated.
+        chunk_bytes (int): Approximate bytes read per chunk
+    Returns:
+        dict: Summary with rows, valid, corrected, rejected,
+              largest_correction_number and largest_correction
+    """
+    summary = validate_range(path, valid_out, corrected_out, rejected_out, fmt, column, header,
+                             record_length, field_start, field_width, chunk_bytes)
+
+    if summary_out:
+        with open(summary_out, "w") as f:
+            json.dump(summary, f, indent=2)
+    return summary
+
+
+def validate_range(path, valid_out, corrected_out, rejected_out, fmt="csv", column=0, header=False,
+                   record_length=None, field_start=0, field_width=None, chunk_bytes=CHUNK_BYTES,
+                   start=0, stop=None, corrected_header=True):
+    """
+    Validates the records in bytes [start, stop) of a file (see validate_file()).
+
+    Returns:
+        dict: Summary of this range
+    """
+    summary = new_summary()
+
+    with open(valid_out, "wb") as valid_f, open(corrected_out, "wb") as corrected_f, \
+            open(rejected_out, "wb") as rejected_f:
+        if corrected_header:
+            corrected_f.write(CORRECTED_HEADER)
+        for fields, raw in iter_chunks(path, fmt, column, header, record_length, field_start,
+                                       field_width, chunk_bytes, start, stop):
+            chunk_summary, valid, corrected, rejected = validate_fields(fields, raw)
+            merge_summary(summary, chunk_summary)
+            valid_f.write(valid)
+            corrected_f.write(corrected)
+            rejected_f.write(rejected)
+
+    return summary
+
+
+def new_summary():
+    return {"rows": 0, "valid": 0, "corrected": 0, "rejected": 0,
+            "largest_correction_number": None, "largest_correction": 0}
+
+
+def merge_summary(total, part):
+    """
+    Adds a later part's counts to `total` in place. The largest correction
+    only changes on a strictly larger one, so the earliest number keeps ties.
+    """
+    for key in ("rows", "valid", "corrected", "rejected"):
+        total[key] += part[key]
+    if part["largest_correction"] > total["largest_correction"]:
+        total["largest_correction"] = part["largest_correction"]
+        total["largest_correction_number"] = part["largest_correction_number"]
+    return total
+
+
+def validate_fields(fields, raw=None):
+    """
+    Validates one chunk of account-number fields.
+
+    Parameters:
+        fields (np.ndarray): Account numbers as a bytes ("S") array
+        raw (np.ndarray): Original records, written to the rejected output
+            (default: the fields themselves)
+    Returns:
+        tuple: (summary dict, valid bytes, corrected CSV bytes, rejected bytes)
+    """
+    raw = fields if raw is None else raw
+    digits, well_formed = parse_digits(fields)
+    well_formed &= np.char.str_len(fields) > 0
+
+    # Same check digit and correction as luhn_check / find_largest_correction
+    passed, _, validation_digit, correction = check_digits(digits)
+    is_valid = well_formed & passed
+    is_invalid = well_formed & ~passed
+    validation_digit, correction = validation_digit[is_invalid], correction[is_invalid]
+
+    summary = new_summary()
+    summary["rows"] = len(fields)
+    summary["valid"] = int(is_valid.sum())
+    summary["corrected"] = int(is_invalid.sum())
+    summary["rejected"] = len(fields) - summary["valid"] - summary["corrected"]
+    if len(correction) and correction.max() > 0:
+        first = int(np.argmax(correction))  # argmax returns the first maximum
+        summary["largest_correction"] = int(correction[first])
+        summary["largest_correction_number"] = fields[is_invalid][first].decode()
+
+    originals = fields[is_invalid]
+    corrected = np.char.add(originals, validation_digit.astype("S1"))
+    corrected_rows = np.char.add(np.char.add(originals, b","), corrected)
+
+    return summary, _lines(fields[is_valid]), _lines(corrected_rows), _lines(raw[~well_formed])
+
+
+def iter_chunks(path, fmt="csv", column=0, header=False, record_length=None, field_start=0,
+                field_width=None, chunk_bytes=CHUNK_BYTES, start=0, stop=None):
+    """
+    Yields (fields, raw records) bytes arrays for bounded chunks of the file.
+
+    Only the bytes in [start, stop) are read; both must lie on record
+    boundaries.
+    """
+    if os.path.getsize(path) == 0:
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        stop = len(mm) if stop is None else stop
+        if fmt == "fixed":
+            yield from _fixed_chunks(mm, start, stop, record_length, field_start, field_width, chunk_bytes)
+        elif fmt == "csv":
+            yield from _csv_chunks(mm, start, stop, column, header and start == 0, chunk_bytes)
+        else:
+            raise ValueError(f"Unknown file format: {fmt!r}")
+
+
+def _csv_chunks(mm, pos, stop, column, header, chunk_bytes):
+    if header:
+        pos = _next_line(mm, pos, stop)
+
+    while pos < stop:
+        # Extend each chunk to the end of the line it stops in
+        end = _next_line(mm, pos + chunk_bytes - 1, stop) if pos + chunk_bytes < stop else stop
+        lines = [line.rstrip(b"\r") for line in mm[pos:end].split(b"\n")]
+        lines = [line for line in lines if line]  # Skip blank lines (and the final newline)
+        fields = [_csv_field(line, column) for line in lines]
+        yield np.array(fields, dtype=bytes), np.array(lines, dtype=bytes)
+        pos = end
+
+
+def _csv_field(line, column):
+    parts = line.split(b",")
+    return parts[column].strip(b' "') if column < len(parts) else b""
+
+
+def _fixed_chunks(mm, pos, stop, record_length, field_start, field_width, chunk_bytes):
+    record_length, terminator = _record_layout(mm, record_length)
+    if field_width is None:
+        field_width = record_length - terminator - field_start  # Field runs up to the line ending
+
+    per_chunk = max(chunk_bytes // record_length, 1)
+    n_records = (stop - pos) // record_length
+
+    for first in range(0, n_records, per_chunk):
+        count = min(per_chunk, n_records - first)
+        offset = pos + first * record_length
+        records = np.frombuffer(mm, dtype=np.uint8, count=count * record_length, offset=offset)
+        records = records.reshape(count, record_length)
+
+        # View the field columns as one fixed-width bytes string per record
+        field = np.ascontiguousarray(records[:, field_start:field_start + field_width])
+        fields = np.char.lstrip(field.view(f"S{field_width}").ravel(), b" ")
+        raw = np.char.rstrip(records.copy().view(f"S{record_length}").ravel(), b"\r\n")
+        yield fields, raw
+
+    # A last record without its line ending still counts; if it is too short
+    # to hold the whole field it is rejected
+    tail = mm[pos + n_records * record_length:stop]
+    if tail.rstrip(b"\r\n"):
+        complete = len(tail) >= field_start + field_width
+        field = tail[field_start:field_start + field_width].lstrip(b" ") if complete else b""
+        yield np.array([field], dtype=bytes), np.array([tail.rstrip(b"\r\n")], dtype=bytes)
+
+
+def _record_layout(mm, record_length):
+    # (record length, line-ending length): \r\n, \n or none, read from the
+    # end of the first record
+    if record_length is None:
+        record_length = _next_line(mm, 0, len(mm))
+    ending = mm[max(record_length - 2, 0):record_length]
+    if ending == b"\r\n":
+        return record_length, 2
+    return record_length, 1 if ending.endswith(b"\n") else 0
+
+
+def _next_line(mm, pos, stop):
+    # Offset just past the newline at or after pos (or stop if there is none)
+    newline = mm.find(b"\n", pos, stop)
+    return stop if newline < 0 else newline + 1
+
+
+def _lines(values):
+    return b"".join(value + b"\n" for value in values.tolist())
+
+
+def print_summary(summary):
+    print(f"Rows: {summary['rows']} | Valid: {summary['valid']} | "
+          f"Corrected: {summary['corrected']} | Rejected: {summary['rejected']}")
+    print(f"Largest correction is needed for account number: {summary['largest_correction_number']} "
+          f"with a correction of {summary['largest_correction']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and repair an account-number file.")
+    parser.add_argument("input", help="CSV or fixed-width file of account numbers")
+    parser.add_argument("--format", choices=["csv", "fixed"], default="csv", help="input layout")
+    parser.add_argument("--column", type=int, default=0, help="CSV column with the account number")
+    parser.add_argument("--header", action="store_true", help="skip the first CSV line")
+    parser.add_argument("--record-length", type=int, help="fixed-width record length, newline included")
+    parser.add_argument("--field-start", type=int, default=0, help="fixed-width field offset")
+    parser.add_argument("--field-width", type=int, help="fixed-width field length")
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES, help="bytes read per chunk")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (more than 1 validates byte-range shards in parallel)")
+    parser.add_argument("--shards-per-worker", type=int, default=4, help="shards per worker process")
+    parser.add_argument("--valid-out", default=VALID_OUT)
+    parser.add_argument("--corrected-out", default=CORRECTED_OUT)
+    parser.add_argument("--rejected-out", default=REJECTED_OUT)
+    parser.add_argument("--summary-out", default=SUMMARY_OUT)
+    args = parser.parse_args(argv)
+
+    options = dict(fmt=args.format, column=args.column, header=args.header, record_length=args.record_length,
+                   field_start=args.field_start, field_width=args.field_width, chunk_bytes=args.chunk_bytes)
+
+    if args.workers > 1:
+        try:
+            from .luhn_parallel import validate_file_parallel
+        except ImportError:  # Run as a script from inside question_three/
+            from luhn_parallel import validate_file_parallel
+
+        summary, rows_per_second = validate_file_parallel(
+            args.input, args.valid_out, args.corrected_out, args.rejected_out,
+            workers=args.workers, shards_per_worker=args.shards_per_worker, **options)
+        if args.summary_out:
+            with open(args.summary_out, "w") as f:
+                json.dump(summary, f, indent=2)
+    else:
+        started = time.perf_counter()
+        summary = validate_file(args.input, args.valid_out, args.corrected_out, args.rejected_out,
+                                args.summary_out, **options)
+        rows_per_second = summary["rows"] / max(time.perf_counter() - started, 1e-9)
+
+    print_summary(summary)
+    print(f"Throughput: {rows_per_second:,.0f} rows/s")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
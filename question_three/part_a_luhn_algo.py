@@ -1,3 +1,36 @@
+# Digit sum of each digit after doubling (e.g. 7 -> 14 -> 1 + 4 = 5)
+DOUBLED_DIGIT_SUM = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+# Character lookup tables, so each digit is converted with a single dict access
+_PLAIN = {str(d): d for d in range(10)}
+_DOUBLED = {str(d): DOUBLED_DIGIT_SUM[d] for d in range(10)}
+
+# Parse the digits once and compute everything the checks need
+def luhn_check(account_number):
+    """
+    Fused Luhn check: validity, checksum, check digit and correction in one pass.
+
+    Parameters:
+        account_number (int or str): Account or card number
+    Returns:
+        tuple: (is_valid (bool), checksum_total (int),
+                validation_digit (int, makes the checksum divisible by 10 when appended),
+                correction (int, |validation_digit - last digit|))
+    """
+    digits = str(account_number)
+
+    try:
+        # From the right: positions 0, 2, 4, ... are added as they are,
+        # positions 1, 3, 5, ... are doubled (looked up in the table)
+        checksum = sum(map(_PLAIN.__getitem__, digits[::-2])) + sum(map(_DOUBLED.__getitem__, digits[-2::-2]))
+    except KeyError as error:
+        raise ValueError(f"Account number is not a string of digits: {account_number!r}") from error
+
+    remainder = checksum % 10
+    validation_digit = (10 - remainder) % 10
+    correction = abs(validation_digit - _PLAIN[digits[-1]]) if digits else validation_digit
+    return remainder == 0, checksum, validation_digit, correction
+
 # Function to calculate the checksum using the Luhn algorithm
 def luhn_algorithm(account_number):
     """
@@ -8,58 +41,26 @@ def luhn_algorithm(account_number):
     Returns:
         tuple: (is_valid (bool), checksum_total (int))
     """
-
-    # Convert number to list of digits (e.g. '4532' -> [4,5,3,2])
-    digits = [int(digit) for digit in str(account_number)]  
-    
-    # Reverse the digits for processing from right to left
-    digits.reverse()
-
-    checksum = 0
-
-    # Step 1: Double every second digit and sum its digits
-    for i in range(len(digits)):
-        if i % 2 == 1:  # Every second digit (starting from the right)
-            doubled = digits[i] * 2
-            # If doubling results in a two-digit number (e.g., 14), sum its digits:
-            # Example: 14 -> 1 + 4 = 5. Achieved by (14 // 10 + 14 % 10)
-            checksum += doubled // 10 + doubled % 10 
-        else:
-            checksum += digits[i]  # Add non-doubled digits
-
-    # Step 2: Check if checksum is divisible by 10
-    is_valid = checksum % 10 == 0
+    is_valid, checksum, _, _ = luhn_check(account_number)
     return is_valid, checksum
 
 # Function to find the correct validation digit for an invalid sequence
 def find_validation_digit(account_number):
-    digits = [int(digit) for digit in str(account_number)]  # Convert number to list of digits
-    checksum = 0
-    # Reverse the digits for processing from right to left
-    digits.reverse()
+    # Check digit that will make the checksum divisible by 10
+    return luhn_check(account_number)[2]
 
-    for i in range(len(digits)):
-        if i % 2 == 1:  # Every second digit (starting from the right)
-            doubled = digits[i] * 2
-            # Add the sum of the digits of the doubled number
-            checksum += doubled // 10 + doubled % 10
-        else:
-            checksum += digits[i]  # Add non-doubled digits
-
-    # Calculate the check digit that will make the checksum divisible by 10
-    return (10 - (checksum % 10)) % 10
+# Testing the Luhn algorithm (only when run as a script, so the functions can be imported)
+if __name__ == "__main__":
+    account_numbers = [453201234567, 601112345678, 7992739871]
 
-# Testing the Luhn algorithm
-account_numbers = [453201234567, 601112345678, 7992739871]
-
-for number in account_numbers:
-    valid, checksum = luhn_algorithm(number)
-    print(f"Account Number: {number}")
-    if valid:
-        print(f"Valid: {valid} - Checksum: {checksum}")
-    else:
-        print(f"Invalid: {valid} - Checksum: {checksum}")
-        # Calculate the validation digit for invalid numbers
-        validation_digit = find_validation_digit(number)
-        print(f"Corrected Account Number: {str(number) + str(validation_digit)}")
-    print("-" * 50)
+    for number in account_numbers:
+        valid, checksum = luhn_algorithm(number)
+        print(f"Account Number: {number}")
+        if valid:
+            print(f"Valid: {valid} - Checksum: {checksum}")
+        else:
+            print(f"Invalid: {valid} - Checksum: {checksum}")
+            # Calculate the validation digit for invalid numbers
+            validation_digit = find_validation_digit(number)
+            print(f"Corrected Account Number: {str(number) + str(validation_digit)}")
+        print("-" * 50)
@@ -1,4 +1,7 @@
-from part_a_luhn_algo import luhn_algorithm, find_validation_digit
+try:
+    from .part_a_luhn_algo import luhn_check
+except ImportError:  # Run as a script from inside question_three/
+    from part_a_luhn_algo import luhn_check
 
 """
 Real-Life Application: How the Luhn algorithm protects the bank from common data entry errors and potential fraud?
@@ -16,14 +19,10 @@ def find_largest_correction(account_numbers):
     largest_correction_number = None
 
     for number in account_numbers:
-        valid, checksum = luhn_algorithm(number)
+        # One pass gives validity, the correct check digit and how far it is
+        # from the current last digit of the number
+        valid, checksum, validation_digit, correction = luhn_check(number)
         if not valid:
-            # Compute the correct check digit
-            validation_digit = find_validation_digit(number)
-
-            # Compare it with the current last digit of the number
-            correction = abs(validation_digit - (number % 10)) 
-
             # Track the number requiring the biggest adjustment
             if correction > largest_correction:
                 largest_correction = correction
@@ -33,10 +32,11 @@ def find_largest_correction(account_numbers):
 
     return largest_correction_number, largest_correction
 
-# Test account numbers
-account_numbers = [453201234567, 601112345678, 7992739871]
+# Test account numbers (only when run as a script, so the function can be imported)
+if __name__ == "__main__":
+    account_numbers = [453201234567, 601112345678, 7992739871]
 
-# Check for the largest correction
-largest_correction_number, largest_correction = find_largest_correction(account_numbers)
+    # Check for the largest correction
+    largest_correction_number, largest_correction = find_largest_correction(account_numbers)
 
-print(f"Largest correction is needed for account number: {largest_correction_number} with a correction of {largest_correction}")
+    print(f"Largest correction is needed for account number: {largest_correction_number} with a correction of {largest_correction}")
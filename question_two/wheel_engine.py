@@ -0,0 +1,272 @@
+import random
+import string
+from collections import namedtuple
+
+import numpy as np
+
+"""
+Headless Wheel of Fortune engine.
+
+WheelGame holds the state of one game (guessed letters, points, attempts)
+with the same rules as play_game(), but without any input() or print().
+Guessing strategies are small objects with a choose(game, rng) method, so
+millions of seeded games can be simulated to study score distributions and
+win rates. play_game() is an interactive wrapper around WheelGame.
+"""
+
+# Point values on the wheel (same as spin_wheel())
+WHEEL_VALUES = [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]
+
+# Letters from most to least common in English text
+ENGLISH_LETTER_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+_ENGLISH_RANK = {letter: i for i, letter in enumerate(ENGLISH_LETTER_ORDER)}
+
+# Special wedges: Bankrupt loses all points and the turn, Lose a Turn just the turn
+BANKRUPT, LOSE_A_TURN = -1, -2
+
+# Outcomes of WheelGame.guess() and WheelGame.lose_turn()
+INVALID, REPEATED, CORRECT, MISSED, LOST_TURN = "invalid", "repeated", "correct", "missed", "lost_turn"
+
+# Bit of each letter in the WheelGame masks
+_LETTER_BITS = {letter: 1 << i for i, letter in enumerate(string.ascii_lowercase)}
+
+GameResult = namedtuple("GameResult", ["points", "solved", "attempts_used", "guesses"])
+
+
+class WheelGame:
+    """
+    State of one game for a phrase of letters and spaces.
+
+    The player gets len(phrase) + 5 attempts. Invalid and repeated guesses
+    do not use an attempt; every other guess does, unless it solves the phrase.
+
+    Each letter's positions and count are found once, and the guessed and
+    still-hidden letters are kept as bit masks (bit i for the i-th letter of
+    the alphabet), so scoring and the completion check are O(1) per guess.
+    The board is only updated at the positions of a newly revealed letter.
+    """
+
+    def __init__(self, phrase):
+        self.phrase = phrase.lower()
+        self.positions = {}
+        for i, letter in enumerate(self.phrase):
+            if letter != " ":
+                self.positions.setdefault(letter, []).append(i)
+        self.letters = set(self.positions)
+
+        self._bits = dict(_LETTER_BITS)
+        self.hidden_mask = 0
+        for letter in self.positions:
+            self.hidden_mask |= self._bit(letter)
+        self.guessed_mask = 0
+
+        self.guessed = set()
+        self.total_points = 0
+        self.attempts_left = len(self.phrase) + 5
+        self.solved = False
+
+        self._board = ["_"] * len(self.phrase)
+        self._display = None
+
+    @property
+    def over(self):
+        return self.solved or self.attempts_left == 0
+
+    def display(self):
+        # Same format as display_word(); rebuilt only after a reveal
+        if self._display is None:
+            self._display = " ".join(self._board)
+        return self._display
+
+    def guess(self, letter, spin_value):
+        """
+        Plays one guess worth spin_value points per occurrence.
+
+        Returns:
+            tuple: (outcome (INVALID, REPEATED, CORRECT or MISSED),
+                    occurrences (int), points earned (int))
+        """
+        letter = letter.lower()
+        if len(letter) != 1 or not letter.isalpha():
+            return INVALID, 0, 0
+
+        bit = self._bit(letter)
+        if self.guessed_mask & bit:
+            return REPEATED, 0, 0
+
+        self.guessed_mask |= bit
+        self.guessed.add(letter)
+
+        positions = self.positions.get(letter, ())
+        occurrences = len(positions)
+        points = occurrences * spin_value
+        self.total_points += points
+
+        if occurrences:
+            self.hidden_mask &= ~bit
+            for i in positions:
+                self._board[i] = letter
+            self._display = None
+
+        if not self.hidden_mask:
+            self.solved = True
+        else:
+            self.attempts_left -= 1
+        return (CORRECT if occurrences else MISSED), occurrences, points
+
+    def lose_turn(self, bankrupt=False):
+        """
+        Plays a Bankrupt or Lose a Turn spin: no guess, one attempt used,
+        and on Bankrupt the points go back to 0.
+        """
+        if bankrupt:
+            self.total_points = 0
+        self.attempts_left -= 1
+        return LOST_TURN, 0, 0
+
+    def _bit(self, letter):
+        # a-z use bits 0-25; any other letter gets the next free bit
+        if letter not in self._bits:
+            self._bits[letter] = 1 << len(self._bits)
+        return self._bits[letter]
+
+
+def _unguessed_letters(game, order=string.ascii_lowercase):
+    # Letters in `order` not guessed yet, then any other letter of the phrase
+    # (e.g. "é"), so an unsolved game always has a letter left to guess
+    letters = [letter for letter in order if letter not in game.guessed]
+    letters += sorted(game.letters - game.guessed - set(order))
+    return letters
+
+
+class RandomStrategy:
+    """Guesses a random letter that has not been guessed yet."""
+
+    def choose(self, game, rng):
+        return rng.choice(_unguessed_letters(game))
+
+
+class FrequencyStrategy:
+    """Guesses letters from the most to the least common in English."""
+
+    def __init__(self, order=ENGLISH_LETTER_ORDER):
+        self.order = order
+
+    def choose(self, game, rng):
+        return _unguessed_letters(game, self.order)[0]
+
+
+class AdaptiveStrategy:
+    """
+    Guesses the letter found in the most candidate phrases that still match
+    the board (same revealed letters, none of the missed letters). Falls back
+    to English letter frequency (then the phrase's other letters) when no
+    candidate has an a-z letter left to guess.
+
+    The phrases are bucketed by length once, each bucket as a matrix of
+    character codes plus a phrase x letter presence matrix. During a game the
+    surviving candidates are only narrowed by the letters guessed since the
+    previous choice, so a guess costs one vectorized pass over the candidates
+    still alive instead of a Python loop over every phrase.
+    """
+
+    def __init__(self, phrases):
+        self.phrases = [phrase.lower() for phrase in phrases]
+        self.fallback = FrequencyStrategy()
+
+        by_length = {}
+        for phrase in self.phrases:
+            by_length.setdefault(len(phrase), []).append(phrase)
+        self.buckets = {}
+        for length, group in by_length.items():
+            codes = np.frombuffer("".join(group).encode("utf-32-le"), dtype=np.uint32).reshape(len(group), length)
+            presence = np.stack([(codes == ord(letter)).any(axis=1) for letter in ENGLISH_LETTER_ORDER], axis=1)
+            self.buckets[length] = (codes, presence)
+
+        # Candidates still alive in the current game
+        self._game, self._seen, self._alive = None, set(), None
+
+    def choose(self, game, rng):
+        bucket = self.buckets.get(len(game.phrase))
+        if bucket is None:
+            return self.fallback.choose(game, rng)
+        codes, presence = bucket
+
+        if game is not self._game or not self._seen <= game.guessed:
+            self._game, self._seen, self._alive = game, set(), np.arange(len(codes))
+
+        # A candidate survives a guessed letter if it has it at exactly the
+        # revealed positions (none for a missed letter)
+        alive = self._alive
+        for letter in game.guessed - self._seen:
+            revealed = np.zeros(len(game.phrase), dtype=bool)
+            revealed[game.positions.get(letter, [])] = True
+            alive = alive[((codes[alive] == ord(letter)) == revealed).all(axis=1)]
+        self._alive, self._seen = alive, set(game.guessed)
+
+        counts = presence[alive].sum(axis=0)
+        counts[[_ENGLISH_RANK[letter] for letter in game.guessed if letter in _ENGLISH_RANK]] = 0
+        if not counts.any():
+            return self.fallback.choose(game, rng)
+        # Most candidates first, then the more common English letter (argmax keeps the first)
+        return ENGLISH_LETTER_ORDER[int(np.argmax(counts))]
+
+
+def play_headless(phrase, strategy, rng, spin=None):
+    """
+    Plays one game without any I/O.
+
+    Parameters:
+        phrase (str): Phrase to guess
+        strategy: Object with choose(game, rng) -> letter
+        rng (random.Random): Random source for spins and the strategy
+        spin (callable): Optional spin source (default: a WHEEL_VALUES draw from rng);
+            may return BANKRUPT or LOSE_A_TURN
+    Returns:
+        GameResult: (points, solved, attempts_used, guesses)
+    """
+    game = WheelGame(phrase)
+    attempts = game.attempts_left
+    guesses = 0
+
+    while not game.over:
+        spin_value = spin() if spin else rng.choice(WHEEL_VALUES)
+        if spin_value == BANKRUPT or spin_value == LOSE_A_TURN:
+            game.lose_turn(bankrupt=spin_value == BANKRUPT)
+            continue
+        game.guess(strategy.choose(game, rng), spin_value)
+        guesses += 1
+
+    return GameResult(game.total_points, game.solved, attempts - game.attempts_left, guesses)
+
+
+def simulate(phrases, strategy, games, seed=0, spin=None):
+    """
+    Plays `games` seeded games, cycling through the phrases.
+
+    Parameters:
+        phrases (list of str): Phrases to guess
+        strategy: Guessing strategy object
+        games (int): Number of games
+        seed (int): Seed for the run (same seed, same results)
+        spin (callable): Optional spin function
+    Returns:
+        dict: points and attempts_used arrays, win_rate, mean_points, games
+    """
+    rng = random.Random(seed)
+    points = np.zeros(games, dtype=np.int64)
+    solved = np.zeros(games, dtype=bool)
+    attempts_used = np.zeros(games, dtype=np.int64)
+
+    for i in range(games):
+        result = play_headless(phrases[i % len(phrases)], strategy, rng, spin)
+        points[i], solved[i], attempts_used[i] = result.points, result.solved, result.attempts_used
+
+    return {
+        "games": games,
+        "win_rate": float(solved.mean()) if games else 0.0,
+        "mean_points": float(points.mean()) if games else 0.0,
+        "points": points,
+        "solved": solved,
+        "attempts_used": attempts_used,
+    }
@@ -0,0 +1,126 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+try:
+    from .wheel_engine import play_headless
+except ImportError:  # Run as a script from inside question_two/
+    from wheel_engine import play_headless
+
+"""
+Parallel Monte Carlo evaluation of guessing strategies.
+
+The work is every (phrase, strategy, replicate) game. Each game draws from
+its own random stream, derived from the run seed and the game's coordinates
+with numpy's SeedSequence, so results do not depend on the number of workers
+or on how games are grouped into tasks. Workers return compact per-strategy
+totals (games, points, solves, attempts-used histogram) instead of one record
+per game, and the parent adds them up as tasks finish.
+"""
+
+# Phrases and strategies of the current run (set once per worker process)
+_phrases = None
+_strategies = None
+
+
+def game_rng(seed, phrase_index, strategy_index, replicate):
+    """
+    Independent, reproducible random stream for one game.
+    """
+    sequence = np.random.SeedSequence(seed, spawn_key=(phrase_index, strategy_index, replicate))
+    return random.Random(int(sequence.generate_state(1, np.uint64)[0]))
+
+
+def evaluate_strategies(phrases, strategies, replicates=1, seed=0, workers=None, phrases_per_task=64):
+    """
+    Plays every phrase `replicates` times with every strategy.
+
+    Parameters:
+        phrases (list of str): Phrases to guess
+        strategies (dict): Strategy name -> strategy object (must be picklable)
+        replicates (int): Games per phrase and strategy
+        seed (int): Seed for the whole run
+        workers (int): Number of processes (default: all CPU cores);
+            1 or fewer plays every game in this process
+        phrases_per_task (int): Phrases handed to a worker per task
+    Returns:
+        tuple: ({name: {"games", "mean_points", "solve_rate", "attempts_histogram"}},
+                games per second)
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    names = list(strategies)
+    tasks = [
+        (start, min(start + phrases_per_task, len(phrases)), strategy_index, replicates, seed)
+        for strategy_index in range(len(names))
+        for start in range(0, len(phrases), phrases_per_task)
+    ]
+
+    totals = {name: _empty_totals() for name in names}
+    if workers <= 1:
+        _init_worker(phrases, [strategies[name] for name in names])
+        for strategy_index, partial in map(_play_task, tasks):
+            _add_totals(totals[names[strategy_index]], partial)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(phrases, [strategies[name] for name in names])) as pool:
+            for future in as_completed([pool.submit(_play_task, task) for task in tasks]):
+                strategy_index, partial = future.result()
+                _add_totals(totals[names[strategy_index]], partial)
+
+    stats = {name: _summarise(totals[name]) for name in names}
+    elapsed = time.perf_counter() - started
+    games = sum(s["games"] for s in stats.values())
+    return stats, (games / elapsed if elapsed > 0 else float("inf"))
+
+
+def _init_worker(phrases, strategies):
+    global _phrases, _strategies
+    _phrases, _strategies = phrases, strategies
+
+
+def _play_task(task):
+    # Play a block of phrases with one strategy; return compact totals
+    start, stop, strategy_index, replicates, seed = task
+    strategy = _strategies[strategy_index]
+    totals = _empty_totals()
+    attempts = []
+
+    for phrase_index in range(start, stop):
+        for replicate in range(replicates):
+            rng = game_rng(seed, phrase_index, strategy_index, replicate)
+            result = play_headless(_phrases[phrase_index], strategy, rng)
+            totals["games"] += 1
+            totals["points"] += result.points
+            totals["solved"] += result.solved
+            attempts.append(result.attempts_used)
+
+    totals["attempts_histogram"] = np.bincount(np.array(attempts, dtype=np.int64), minlength=1)
+    return strategy_index, totals
+
+
+def _empty_totals():
+    return {"games": 0, "points": 0, "solved": 0, "attempts_histogram": np.zeros(1, dtype=np.int64)}
+
+
+def _add_totals(total, part):
+    # Integer sums, so the merge order does not change the result
+    total["games"] += part["games"]
+    total["points"] += part["points"]
+    total["solved"] += part["solved"]
+    size = max(len(total["attempts_histogram"]), len(part["attempts_histogram"]))
+    total["attempts_histogram"] = (np.pad(total["attempts_histogram"], (0, size - len(total["attempts_histogram"])))
+                                   + np.pad(part["attempts_histogram"], (0, size - len(part["attempts_histogram"]))))
+
+
+def _summarise(total):
+    games = total["games"]
+    return {
+        "games": games,
+        "mean_points": total["points"] / games if games else 0.0,
+        "solve_rate": total["solved"] / games if games else 0.0,
+        "attempts_histogram": total["attempts_histogram"],
+    }
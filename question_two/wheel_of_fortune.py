@@ -1,10 +1,15 @@
 import random
 
+try:
+    from .wheel_engine import WheelGame, WHEEL_VALUES, INVALID, REPEATED, CORRECT
+except ImportError:  # Run as a script from inside question_two/
+    from wheel_engine import WheelGame, WHEEL_VALUES, INVALID, REPEATED, CORRECT
+
 # Function to simulate spinning the wheel
+# (the default spin source; see wheel_spins for buffered and replayable ones)
 def spin_wheel():
-    # Possible point values on the wheel
-    wheel_values = [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]
-    return random.choice(wheel_values)
+    # Possible point values on the wheel: 100, 200, ..., 1000
+    return random.choice(WHEEL_VALUES)
 
 def display_word(word, guessed_letters):
     """
@@ -40,58 +45,42 @@ def play_game():
         else:
             break
 
-    guessed_letters = set()  # Track guessed letters
-    total_points = 0  # Track total points
-    attempts_left = len(word) + 5  # Allow a few extra guesses
+    game = WheelGame(word)  # Tracks guessed letters, points and attempts
 
     # Step 2: Game loop
-    while attempts_left > 0:
+    while not game.over:
         # Display the current state of the word
-        print(f"Current word: {display_word(word, guessed_letters)}")
-        print(f"Total points: {total_points}")
-        print(f"Attempts left: {attempts_left}")
+        print(f"Current word: {game.display()}")
+        print(f"Total points: {game.total_points}")
+        print(f"Attempts left: {game.attempts_left}")
         
         # Step 3: Spin the wheel and get a point value
         spin_value = spin_wheel()
         print(f"Wheel spin! You got: {spin_value} points.")
         
-        # Step 4: Get the player's guess
+        # Step 4: Get the player's guess and score it (Step 5)
         guess = input("Guess a letter: ").lower()
+        outcome, occurrences, points = game.guess(guess, spin_value)
 
-        # Ensure valid input
-        if len(guess) != 1 or not guess.isalpha():
+        if outcome == INVALID:
             print("Please enter a valid letter.")
-            continue
-        
-        # If the letter has already been guessed, skip it
-        if guess in guessed_letters:
+        elif outcome == REPEATED:
             print("You already guessed that letter. Try again.")
-            continue
-        
-        guessed_letters.add(guess)  # Add the guessed letter to the set
-        
-        # Step 5: Check if the guessed letter is in the word (Score)
-        if guess in word:
-            occurrences = word.count(guess)  # Count how many times the letter appears in the word
-            points = occurrences * spin_value
-            total_points += points  # Add points to the total
+        elif outcome == CORRECT:
             print(f"Correct! The letter '{guess}' appeared {occurrences} time(s). You earned {points} points.")
         else:
             print(f"Sorry, the letter '{guess}' is not in the word.")
         
         # Step 6: Check if the player has guessed all letters
-        if all(letter in guessed_letters for letter in word if letter != ' '):
+        if game.solved:
             print(f"Congratulations! You've guessed the word/phrase: {word}")
-            print(f"Total points: {total_points}")
-            break
-        
-        attempts_left -= 1  # Deduct an attempt for each guess
+            print(f"Total points: {game.total_points}")
 
     # If attempts are over
-    if attempts_left == 0:
+    if game.attempts_left == 0:
         print("Game over! You've run out of attempts.")
         print(f"The word/phrase was: {word}")
-        print(f"Total points: {total_points}")
+        print(f"Total points: {game.total_points}")
 
 # Run the game
 if __name__ == "__main__":
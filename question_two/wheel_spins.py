@@ -0,0 +1,118 @@
+import numpy as np
+
+try:
+    from .wheel_engine import WHEEL_VALUES, BANKRUPT, LOSE_A_TURN
+except ImportError:  # Run as a script from inside question_two/
+    from wheel_engine import WHEEL_VALUES, BANKRUPT, LOSE_A_TURN
+
+"""
+Spin sources for the Wheel of Fortune engine.
+
+A spin source is any callable that returns the next spin: a point value, or
+BANKRUPT / LOSE_A_TURN. spin_wheel() stays the default for play_game().
+BufferedSpins draws large blocks of spins at once with a NumPy Generator and
+hands them out one by one, so bulk simulations do not pay for a random.choice
+call per spin. RecordingSpins and ReplaySpins capture and replay a spin
+sequence for deterministic tests.
+"""
+
+
+class Wheel:
+    """
+    Wedges of a wheel and how likely each one is.
+
+    Parameters:
+        values (list of int): Point values of the wedges
+        weights (list of float): Relative weight of each value wedge (default: equal)
+        bankrupt (int): Number of Bankrupt wedges (weight 1 each)
+        lose_a_turn (int): Number of Lose a Turn wedges (weight 1 each)
+    """
+
+    def __init__(self, values=WHEEL_VALUES, weights=None, bankrupt=0, lose_a_turn=0):
+        self.wedges = np.array(list(values) + [BANKRUPT] * bankrupt + [LOSE_A_TURN] * lose_a_turn, dtype=np.int64)
+        if weights is None:
+            self.weights = None
+        else:
+            if len(weights) != len(values):
+                raise ValueError("Expected one weight per wheel value")
+            weights = np.array(list(weights) + [1.0] * (bankrupt + lose_a_turn), dtype=np.float64)
+            self.weights = weights / weights.sum()
+
+    def draw(self, rng, size):
+        """
+        Draws `size` spins with a numpy Generator.
+        """
+        if self.weights is None:
+            return self.wedges[rng.integers(0, len(self.wedges), size=size)]
+        cumulative = np.cumsum(self.weights)
+        index = np.searchsorted(cumulative, rng.random(size) * cumulative[-1], side="right")
+        return self.wedges[np.minimum(index, len(self.wedges) - 1)]
+
+
+class BufferedSpins:
+    """
+    Spin source that pre-generates `block` spins at a time.
+
+    Parameters:
+        wheel (Wheel): Wheel to spin (default: the standard 100-1000 wheel)
+        seed (int or np.random.Generator): Seed or generator for the spins
+        block (int): Spins generated per refill
+    """
+
+    def __init__(self, wheel=None, seed=None, block=65536):
+        self.wheel = wheel or Wheel()
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        self.block = block
+        self._buffer = []
+        self._next = 0
+
+    def __call__(self):
+        if self._next == len(self._buffer):
+            self._buffer = self.wheel.draw(self.rng, self.block).tolist()  # Python ints hand out faster
+            self._next = 0
+        spin = self._buffer[self._next]
+        self._next += 1
+        return spin
+
+    def take(self, count):
+        """
+        Returns the next `count` spins as one array (for vectorized consumers):
+        what is left in the buffer first, then freshly drawn spins.
+        """
+        buffered = np.array(self._buffer[self._next:self._next + count], dtype=np.int64)
+        self._next += len(buffered)
+        if len(buffered) == count:
+            return buffered
+        return np.concatenate((buffered, self.wheel.draw(self.rng, count - len(buffered))))
+
+
+class RecordingSpins:
+    """
+    Wraps a spin source and records every spin it hands out.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.spins = []
+
+    def __call__(self):
+        spin = self.source()
+        self.spins.append(spin)
+        return spin
+
+
+class ReplaySpins:
+    """
+    Replays a recorded spin sequence; raises IndexError when it runs out.
+    """
+
+    def __init__(self, spins):
+        self.spins = list(spins)
+        self._next = 0
+
+    def __call__(self):
+        if self._next == len(self.spins):
+            raise IndexError("No more recorded spins to replay")
+        spin = self.spins[self._next]
+        self._next += 1
+        return spin
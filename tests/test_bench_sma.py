@@ -0,0 +1,43 @@
+import json
+import sys
+import pytest
+from benchmarks.bench_sma import generate_universe, measure, main
+
+# Test: synthetic universe has the requested shape and no gaps
+def test_generate_universe_shape():
+    close_df = generate_universe(3, 120, seed=1)
+    assert close_df.shape == (120, 3)
+    assert not close_df.isna().any().any()
+
+# Test: a tiny benchmark run records every stage
+def test_benchmark_writes_results(tmp_path):
+    output = tmp_path / "bench.json"
+    main(["--tickers", "2", "--days", "300", "--periods", "10:30:10", "--repeat", "1", "--output", str(output)])
+
+    results = json.loads(output.read_text())["results"]
+    assert [r["stage"] for r in results] == ["load", "per_stock_sweep", "portfolio_sweep", "csv_output"]
+    assert all(r["seconds"] >= 0 and r["peak_bytes"] > 0 for r in results)
+
+# Test: the timed runs are not traced; the peak comes from one extra traced run
+def test_measure_times_untraced_runs():
+    import tracemalloc
+    traced = []
+
+    def func():
+        traced.append(tracemalloc.is_tracing())
+        return bytearray(1 << 20)
+
+    result, seconds, peak = measure(func, repeat=3)
+    assert traced == [False, False, False, True]
+    assert len(result) == 1 << 20 and seconds >= 0 and peak >= 1 << 20
+
+# Test: with a process pool the workers' peak RSS is recorded
+@pytest.mark.skipif(sys.platform == "win32", reason="needs resource.getrusage")
+def test_benchmark_records_worker_rss(tmp_path):
+    output = tmp_path / "bench.json"
+    main(["--tickers", "2", "--days", "300", "--periods", "10:30:10", "--repeat", "1", "--workers", "2",
+          "--output", str(output)])
+
+    results = {r["stage"]: r for r in json.loads(output.read_text())["results"]}
+    assert results["portfolio_sweep"]["worker_peak_rss_bytes"] > 0
+    assert results["load"]["worker_peak_rss_bytes"] is None
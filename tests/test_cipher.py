@@ -1,5 +1,10 @@
+import io
 import pytest
-from question_one.cipher_helpers import shift_cipher
+from question_one.cipher_helpers import (
+    shift_cipher, shift_decipher, keyed_cipher, keyed_decipher, keyed_cipher_batch, shift_table, shift_bytes_table
+)
+from question_one.cipher import cipher_stream, main
+from question_one.cipher_cracker import crack_shift, crack_shifts
 
 @pytest.mark.parametrize("word, shift, expected", [
     ("abc", 3, "def"),
@@ -14,3 +19,108 @@ from question_one.cipher_helpers import shift_cipher
 ])
 def test_shift_cipher_cases(word, shift, expected):
     assert shift_cipher(word, shift) == expected
+
+# Test: decoding restores the original text
+@pytest.mark.parametrize("word, shift", [("hello world", 5), ("Attack at Dawn!", 13), ("xyz", 29), ("", 3)])
+def test_shift_decipher_round_trip(word, shift):
+    assert shift_decipher(shift_cipher(word, shift), shift) == word
+
+# Test: bytes input gives the same result as str input
+def test_shift_cipher_bytes():
+    assert shift_cipher(b"hello world!", 5) == b"mjqqt btwqi!"
+    assert shift_decipher(b"mjqqt btwqi!", 5) == b"hello world!"
+
+# Test: shifts equal mod 26 share one cached table
+def test_shift_tables_cached_mod_26():
+    for shift in (29, -23, 3 + 26 * 10**6):
+        assert shift_table(shift) is shift_table(3)
+        assert shift_bytes_table(shift) is shift_bytes_table(3)
+
+# Test: chunked streaming (serial and with workers) matches one shift_cipher call
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cipher_stream_matches_shift_cipher(workers):
+    text = "The quick brown fox jumps over the lazy dog!\n" * 500
+    target = io.StringIO()
+    cipher_stream(io.StringIO(text), target, 7, chunk_size=100, workers=workers)
+    assert target.getvalue() == shift_cipher(text, 7)
+
+# Test: non-interactive mode enciphers a file and --decode restores it
+def test_cipher_main_streaming(tmp_path):
+    source = tmp_path / "plain.txt"
+    source.write_text("Hello, World\r\nabc\n", newline="")
+    main([str(source), "--shift", "3", "--output", str(tmp_path / "secret.txt")])
+    assert (tmp_path / "secret.txt").read_bytes() == b"Khoor, Zruog\r\ndef\n"
+
+    main([str(tmp_path / "secret.txt"), "--shift", "3", "--decode", "--output", str(tmp_path / "back.txt")])
+    assert (tmp_path / "back.txt").read_bytes() == source.read_bytes()
+
+# Test: files without --shift are an error, not silently ignored
+def test_cipher_main_files_need_shift(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "plain.txt")])
+    assert "need --shift" in capsys.readouterr().err
+
+# Test: stdin keeps its CRLF line endings
+def test_cipher_main_stdin_keeps_line_endings(monkeypatch):
+    stdin = io.TextIOWrapper(io.BytesIO(b"Hello\r\nabc\n"), encoding="utf-8")
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr("sys.stdin", stdin)
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    main(["--shift", "3"])
+    stdout.flush()
+    assert stdout.buffer.getvalue() == b"Khoor\r\ndef\n"
+
+PLAINTEXT = ("Frequency analysis is based on the fact that in any given stretch of written "
+             "language certain letters occur with varying frequencies")
+
+# Test: the cracker recovers every shift, with either scoring method
+@pytest.mark.parametrize("method", ["chi2", "loglik"])
+def test_crack_shift_recovers_shift(method):
+    for shift in range(26):
+        ranked = crack_shift(shift_cipher(PLAINTEXT, shift), method)
+        assert ranked[0][0] == shift
+        assert sorted(s for s, _ in ranked) == list(range(26))
+
+# Test: batch cracking agrees with cracking one message at a time
+def test_crack_shifts_batch():
+    messages = [shift_cipher(PLAINTEXT, shift) for shift in (3, 11, 25)]
+    order, scores = crack_shifts(messages)
+    assert order[:, 0].tolist() == [3, 11, 25]
+    for row, message in enumerate(messages):
+        assert [(int(s), float(v)) for s, v in zip(order[row], scores[row])] == crack_shift(message)
+
+# Test: keyed cipher on the classic Vigenère example, both key-stream modes
+@pytest.mark.parametrize("word, key, per_letter, expected", [
+    ("ATTACK AT DAWN", "LEMON", True, "LXFOPV EF RNHR"),
+    ("attack at dawn", "lemon", False, "lxfopv mh oeib"),
+    ("Hello, World!", [1, 2], True, "Igmnp, Yptmf!"),
+    (b"hello", [1, 2], True, b"igmnp"),
+])
+def test_keyed_cipher(word, key, per_letter, expected):
+    assert keyed_cipher(word, key, per_letter) == expected
+    assert keyed_decipher(expected, key, per_letter) == word
+
+# Test: a single-shift key matches shift_cipher on ASCII text
+@pytest.mark.parametrize("word, shift", [("hello world", 5), ("xyz", 29), ("Hello, World!", 4), ("", 3)])
+def test_keyed_cipher_single_shift(word, shift):
+    assert keyed_cipher(word, shift) == shift_cipher(word, shift)
+    assert keyed_cipher(word, [shift]) == shift_cipher(word, shift)
+
+# Test: non-ASCII letters follow shift_cipher whatever the key length
+@pytest.mark.parametrize("word", ["café", "Straße", "Ünïcode ok", "naïve Ωmega"])
+@pytest.mark.parametrize("key", [3, "d", "dd", [3], [3, 3, 3]])
+def test_keyed_cipher_non_ascii_letters(word, key):
+    assert keyed_cipher(word, key) == shift_cipher(word, 3)
+    assert keyed_cipher_batch([word, "abc", word], key) == [shift_cipher(r, 3) for r in (word, "abc", word)]
+
+# Test: non-ASCII letters advance the key like any other letter
+def test_keyed_cipher_non_ascii_key_stream():
+    assert keyed_cipher("éa", [0, 1]) == shift_cipher("é", 0) + "b"
+
+# Test: batch mode restarts the key stream per record
+def test_keyed_cipher_batch():
+    records = ["abc", "", "Hello, World!", "xyz"]
+    assert keyed_cipher_batch(records, "key") == [keyed_cipher(r, "key") for r in records]
+    keys = ["b", "cd", [1, 2, 3], "z"]
+    assert keyed_cipher_batch(records, keys) == [keyed_cipher(r, k) for r, k in zip(records, keys)]
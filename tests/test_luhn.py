@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+from question_three.part_a_luhn_algo import luhn_algorithm, find_validation_digit, luhn_check
+from question_three.part_b_banking import find_largest_correction
+from question_three.luhn_batch import luhn_batch, validation_digits_batch, luhn_check_batch
+
+# Test: batch results match the scalar functions for ints
+def test_luhn_batch_matches_scalar_ints():
+    numbers = np.random.default_rng(0).integers(0, 10**18, 500)
+    valid, checksum = luhn_batch(numbers)
+    expected = [luhn_algorithm(int(n)) for n in numbers]
+    assert valid.tolist() == [v for v, _ in expected]
+    assert checksum.tolist() == [c for _, c in expected]
+    assert validation_digits_batch(numbers).tolist() == [find_validation_digit(int(n)) for n in numbers]
+
+# Test: strings of mixed length (with leading zeros) and oversized ints
+@pytest.mark.parametrize("numbers", [
+    ["453201234567", "601112345678", "7992739871", "79927398713"],
+    ["0004532", "12", "", "0"],
+    [b"79927398713", b"1"],
+    [10**25 + 7, 3, 453201234567],
+])
+def test_luhn_batch_matches_scalar_mixed(numbers):
+    valid, checksum = luhn_batch(numbers)
+    texts = [n.decode() if isinstance(n, bytes) else n for n in numbers]
+    assert list(zip(valid.tolist(), checksum.tolist())) == [luhn_algorithm(n) for n in texts]
+    assert validation_digits_batch(numbers).tolist() == [find_validation_digit(n) for n in texts]
+
+# Test: malformed account numbers are rejected
+@pytest.mark.parametrize("numbers", [["123", "12a"], ["1 2"], [-5], ["١٢"]])
+def test_luhn_batch_rejects_malformed(numbers):
+    with pytest.raises(ValueError):
+        luhn_batch(numbers)
+
+# Test: fused check agrees with the separate functions (known values included)
+@pytest.mark.parametrize("number, expected", [
+    (453201234567, (False, 52, 8, 1)),
+    (601112345678, (True, 40, 0, 8)),
+    (7992739871, (False, 56, 4, 3)),
+    ("79927398713", (True, 70, 0, 3)),
+])
+def test_luhn_check(number, expected):
+    assert luhn_check(number) == expected
+    assert luhn_check(number)[:2] == luhn_algorithm(number)
+    assert luhn_check(number)[2] == find_validation_digit(number)
+
+# Test: batch fused check matches luhn_check row by row
+def test_luhn_check_batch_matches_scalar():
+    numbers = np.random.default_rng(1).integers(1, 10**16, 300)
+    results = zip(*(column.tolist() for column in luhn_check_batch(numbers)))
+    assert list(results) == [luhn_check(int(n)) for n in numbers]
+
+# Test: largest correction from the banking example
+def test_find_largest_correction(capsys):
+    assert find_largest_correction([453201234567, 601112345678, 7992739871]) == (7992739871, 3)
+    assert "Corrected Account: 79927398714" in capsys.readouterr().out
@@ -0,0 +1,56 @@
+import numpy as np
+from question_three.part_a_luhn_algo import luhn_check
+from question_three.luhn_candidates import typo_candidates, AccountIndex, likely_accounts
+
+# Reference: try every single-digit substitution and adjacent swap
+def brute_force_candidates(text):
+    substitutions = [
+        text[:i] + d + text[i + 1:]
+        for i in range(len(text)) for d in "0123456789"
+        if d != text[i] and luhn_check(text[:i] + d + text[i + 1:])[0]
+    ]
+    swaps = [
+        text[:i] + text[i + 1] + text[i] + text[i + 2:]
+        for i in range(len(text) - 1)
+        if text[i] != text[i + 1] and luhn_check(text[:i] + text[i + 1] + text[i] + text[i + 2:])[0]
+    ]
+    return substitutions + swaps
+
+# Test: checksum deltas find exactly the brute-force candidates
+def test_typo_candidates_match_brute_force():
+    rng = np.random.default_rng(2)
+    for _ in range(300):
+        text = "".join(rng.choice(list("0123456789"), size=int(rng.integers(2, 17))))
+        expected = brute_force_candidates(text) if not luhn_check(text)[0] else []
+        assert typo_candidates(text) == expected
+
+# Test: only candidates that are known accounts are proposed
+def test_likely_accounts(tmp_path):
+    path = tmp_path / "accounts.csv"
+    path.write_text("account\n79927398713\n1234567812345670\n79927398713\n")
+    index = AccountIndex.load(str(path), header=True)
+    assert len(index) == 2 and 79927398713 in index and 5 not in index
+
+    # One wrong digit and one swapped pair of the same account
+    assert likely_accounts("79927398703", index) == ["79927398713"]
+    assert likely_accounts("79927389713", index) == ["79927398713"]
+    assert likely_accounts("79927398713", index) == []  # Already valid
+
+    index.save(str(tmp_path / "index.npy"))
+    assert AccountIndex.load(str(tmp_path / "index.npy")).contains(["1234567812345670", "1"]).tolist() == [True, False]
+
+# Test: leading zeros are significant, so a longer candidate never matches a shorter account
+def test_index_keeps_leading_zeros():
+    index = AccountIndex(["79927398713", "0123"])
+    assert likely_accounts("179927398713", index) == []
+    assert "079927398713" not in index and "79927398713" in index
+    assert index.contains(["0123", "123", 123]).tolist() == [True, False, False]
+
+# Test: malformed rows of the account file are skipped and counted
+def test_load_skips_malformed_rows(tmp_path):
+    path = tmp_path / "accounts.csv"
+    path.write_text("79927398713\nabc\n\n" + "1" * 20 + "\n1234567812345670\n")
+    index = AccountIndex.load(str(path))
+
+    assert len(index) == 2 and index.skipped == 2  # "abc" and the 20-digit number; blank lines are skipped
+    assert likely_accounts("79927398703", index) == ["79927398713"]
@@ -0,0 +1,144 @@
+import pytest
+import json
+import numpy as np
+from question_three.part_a_luhn_algo import luhn_algorithm, find_validation_digit
+from question_three.luhn_stream import validate_file
+from question_three.luhn_parallel import shard_bounds, validate_file_parallel
+
+# Reference: the find_largest_correction loop, without the prints
+def reference_largest_correction(numbers):
+    largest_correction, largest_correction_number = 0, None
+    for number in numbers:
+        if not luhn_algorithm(number)[0]:
+            correction = abs(find_validation_digit(number) - number % 10)
+            if correction > largest_correction:
+                largest_correction, largest_correction_number = correction, number
+    return largest_correction_number, largest_correction
+
+def outputs(tmp_path, prefix):
+    return {name: str(tmp_path / f"{prefix}_{name}") for name in ("valid", "corrected", "rejected", "summary")}
+
+# Test: CSV input in small chunks matches the in-memory functions
+def test_validate_csv_file(tmp_path):
+    numbers = [int(n) for n in np.random.default_rng(3).integers(10**9, 10**15, 2000)]
+    path = tmp_path / "accounts.csv"
+    path.write_text("id,account\n" + "".join(f"{i},{n}\n" for i, n in enumerate(numbers)) + "x,12a4\n")
+
+    out = outputs(tmp_path, "csv")
+    summary = validate_file(str(path), out["valid"], out["corrected"], out["rejected"], out["summary"],
+                            column=1, header=True, chunk_bytes=500)
+
+    number, correction = reference_largest_correction(numbers)
+    assert summary["largest_correction_number"] == str(number)
+    assert summary["largest_correction"] == correction
+    assert summary["rows"] == 2001 and summary["rejected"] == 1
+    assert json.load(open(out["summary"])) == summary
+
+    valid = [n for n in numbers if luhn_algorithm(n)[0]]
+    assert open(out["valid"]).read().split() == [str(n) for n in valid]
+
+    corrected = open(out["corrected"]).read().splitlines()[1:]
+    invalid = [n for n in numbers if not luhn_algorithm(n)[0]]
+    assert corrected == [f"{n},{n}{find_validation_digit(n)}" for n in invalid]
+    assert open(out["rejected"]).read() == "x,12a4\n"
+
+# Test: fixed-width records give the same results as the CSV layout
+def test_validate_fixed_width_matches_csv(tmp_path):
+    numbers = [int(n) for n in np.random.default_rng(4).integers(1, 10**12, 500)]
+    (tmp_path / "a.csv").write_text("".join(f"{n}\n" for n in numbers))
+    (tmp_path / "a.fw").write_text("".join(f"{n:>14}\n" for n in numbers))
+
+    csv_out, fixed_out = outputs(tmp_path, "c"), outputs(tmp_path, "f")
+    csv_summary = validate_file(str(tmp_path / "a.csv"), csv_out["valid"], csv_out["corrected"],
+                                csv_out["rejected"], chunk_bytes=300)
+    fixed_summary = validate_file(str(tmp_path / "a.fw"), fixed_out["valid"], fixed_out["corrected"],
+                                  fixed_out["rejected"], fmt="fixed", chunk_bytes=300)
+
+    assert fixed_summary == csv_summary
+    for name in ("valid", "corrected", "rejected"):
+        assert open(fixed_out[name]).read() == open(csv_out[name]).read()
+
+# Test: shards cover the file exactly and start at line beginnings
+def test_shard_bounds_on_line_boundaries(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_bytes(b"".join(b"%d\n" % n for n in range(1, 5000, 7)))
+    data = path.read_bytes()
+
+    bounds = shard_bounds(str(path), 6)
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(data)
+    assert all(stop == next_start for (_, stop), (next_start, _) in zip(bounds, bounds[1:]))
+    assert all(data[start - 1:start] == b"\n" for start, _ in bounds[1:])
+
+# Test: sharded run gives the same outputs and summary as the serial run
+@pytest.mark.parametrize("fmt", ["csv", "fixed"])
+def test_parallel_matches_serial(tmp_path, fmt):
+    numbers = [int(n) for n in np.random.default_rng(5).integers(1, 10**12, 3000)]
+    path = tmp_path / "accounts"
+    if fmt == "csv":
+        path.write_text("account\n" + "".join(f"{n}\n" for n in numbers) + "bad\n")
+    else:
+        path.write_text("".join(f"{n:>14}\n" for n in numbers))
+
+    serial, parallel = outputs(tmp_path, "s"), outputs(tmp_path, "p")
+    expected = validate_file(str(path), serial["valid"], serial["corrected"], serial["rejected"],
+                             fmt=fmt, header=fmt == "csv", chunk_bytes=700)
+    summary, rows_per_second = validate_file_parallel(
+        str(path), parallel["valid"], parallel["corrected"], parallel["rejected"],
+        fmt=fmt, header=fmt == "csv", chunk_bytes=700, workers=2, shards_per_worker=3)
+
+    assert summary == expected
+    assert rows_per_second > 0
+    for name in ("valid", "corrected", "rejected"):
+        assert open(parallel[name]).read() == open(serial[name]).read()
+
+# Test: CRLF fixed-width records are read without the \r
+def test_validate_fixed_width_crlf(tmp_path):
+    path = tmp_path / "a.fw"
+    path.write_bytes(b"79927398713\r\n45320123456\r\n")
+
+    out = outputs(tmp_path, "crlf")
+    summary = validate_file(str(path), out["valid"], out["corrected"], out["rejected"], fmt="fixed")
+
+    assert summary["rows"] == 2 and summary["rejected"] == 0
+    assert open(out["valid"]).read() == "79927398713\n"
+
+# Test: a last record without a trailing newline is still validated
+@pytest.mark.parametrize("ending", [b"\n", b"\r\n"])
+def test_validate_fixed_width_no_trailing_newline(tmp_path, ending):
+    path = tmp_path / "a.fw"
+    path.write_bytes(ending.join([b"79927398713", b"45320123456", b"79927398713"]))
+
+    out = outputs(tmp_path, "tail")
+    summary = validate_file(str(path), out["valid"], out["corrected"], out["rejected"], fmt="fixed")
+
+    assert summary["rows"] == 3 and summary["valid"] == 2 and summary["rejected"] == 0
+    assert open(out["valid"]).read() == "79927398713\n79927398713\n"
+
+# Test: a truncated last record is rejected, not dropped
+def test_validate_fixed_width_truncated_record(tmp_path):
+    path = tmp_path / "a.fw"
+    path.write_bytes(b"79927398713\n4532012")
+
+    out = outputs(tmp_path, "cut")
+    summary = validate_file(str(path), out["valid"], out["corrected"], out["rejected"], fmt="fixed")
+
+    assert summary["rows"] == 2 and summary["rejected"] == 1
+    assert open(out["rejected"]).read() == "4532012\n"
+
+# Test: sharded CRLF fixed-width run without a final newline matches the serial run
+def test_parallel_fixed_width_crlf(tmp_path):
+    numbers = [int(n) for n in np.random.default_rng(6).integers(1, 10**12, 1000)]
+    path = tmp_path / "accounts"
+    path.write_bytes(b"\r\n".join(b"%14d" % n for n in numbers))
+
+    serial, parallel = outputs(tmp_path, "s"), outputs(tmp_path, "p")
+    expected = validate_file(str(path), serial["valid"], serial["corrected"], serial["rejected"],
+                             fmt="fixed", chunk_bytes=700)
+    summary, _ = validate_file_parallel(str(path), parallel["valid"], parallel["corrected"],
+                                        parallel["rejected"], fmt="fixed", chunk_bytes=700,
+                                        workers=2, shards_per_worker=3)
+
+    assert expected["rows"] == 1000 and expected["rejected"] == 0
+    assert summary == expected
+    for name in ("valid", "corrected", "rejected"):
+        assert open(parallel[name]).read() == open(serial[name]).read()
@@ -0,0 +1,88 @@
+import pytest
+import pandas as pd
+import numpy as np
+from question_four.price_sources import CsvDirectorySource, PriceCache
+
+# Helper: write <TICKER>.csv files ending `lag` business days before today
+def write_csv_prices(directory, tickers, length=100, lag=0):
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=length + lag)[:length]
+    for i, ticker in enumerate(tickers):
+        close = 100 + i + np.arange(length, dtype=float)
+        pd.DataFrame({"Date": dates, "Close": close}).to_csv(directory / f"{ticker}.csv", index=False)
+    return dates
+
+# Source wrapper that records every fetch request
+class RecordingSource:
+    def __init__(self, source):
+        self.source = source
+        self.calls = []
+
+    def fetch(self, tickers, start=None):
+        self.calls.append((list(tickers), start))
+        return self.source.fetch(tickers, start=start)
+
+class FailingSource:
+    def fetch(self, tickers, start=None):
+        raise ConnectionError("no network")
+
+# Test: the file-based source reads prices with no network
+def test_csv_directory_source(tmp_path):
+    write_csv_prices(tmp_path, ["AAA", "BBB"])
+    close_df = CsvDirectorySource(tmp_path).fetch(["AAA", "BBB", "MISSING"])
+
+    assert list(close_df.columns) == ["AAA", "BBB"]
+    assert len(close_df) == 100
+    assert close_df["BBB"].iloc[0] == 101.0
+
+# Test: a stale cache only fetches the missing tail of dates
+def test_cache_fetches_only_missing_tail(tmp_path):
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    write_csv_prices(csv_dir, ["AAA"], length=100, lag=10)
+
+    cache = PriceCache(tmp_path / "cache", RecordingSource(CsvDirectorySource(csv_dir)))
+    first = cache.load(["AAA"])
+    assert len(first) == 100
+    assert cache.source.calls[0][1] is None  # cold start: full history
+
+    # Ten more days arrive upstream
+    dates = write_csv_prices(csv_dir, ["AAA"], length=110)
+    second = cache.load(["AAA"])
+
+    assert len(second) == 110
+    assert cache.source.calls[1][1] == first.index[-1].date()  # overlaps the last cached day
+    assert second["AAA"].iloc[-1] == 209.0
+    assert second.index[-1] == dates[-1]
+
+# Test: upstream failure falls back to the cache
+def test_cache_offline_fallback(tmp_path):
+    write_csv_prices(tmp_path, ["AAA"], lag=10)
+    PriceCache(tmp_path / "cache", CsvDirectorySource(tmp_path)).load(["AAA"])
+
+    offline = PriceCache(tmp_path / "cache", FailingSource()).load(["AAA"])
+    assert len(offline) == 100
+
+    no_source = PriceCache(tmp_path / "cache").load(["AAA", "BBB"])
+    assert list(no_source.columns) == ["AAA"]
+
+# Test: a history adjusted upstream (e.g. a 10:1 split) is downloaded again in full
+def test_cache_refetches_adjusted_history(tmp_path):
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    write_csv_prices(csv_dir, ["AAA", "BBB"], length=100, lag=10)
+
+    cache = PriceCache(tmp_path / "cache", RecordingSource(CsvDirectorySource(csv_dir)))
+    cache.load(["AAA", "BBB"])
+
+    # Ten more days arrive, and AAA's whole history is divided by 10
+    dates = write_csv_prices(csv_dir, ["AAA", "BBB"], length=110)
+    split = pd.read_csv(csv_dir / "AAA.csv")
+    split["Close"] /= 10
+    split.to_csv(csv_dir / "AAA.csv", index=False)
+
+    refreshed = cache.load(["AAA", "BBB"])
+
+    assert cache.source.calls[-1] == (["AAA"], None)  # full history, AAA only
+    np.testing.assert_array_equal(refreshed["AAA"].to_numpy(), (100 + np.arange(110.0)) / 10)
+    np.testing.assert_array_equal(refreshed["BBB"].to_numpy(), 101 + np.arange(110.0))
+    assert refreshed.index[-1] == dates[-1]
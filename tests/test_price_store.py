@@ -0,0 +1,75 @@
+import pytest
+import pandas as pd
+import numpy as np
+from question_four.price_store import PriceStore
+from question_four.sma_cube import build_score_cube
+from question_four.sma_parallel import build_score_cube_parallel
+from question_four.sma_walk_forward import walk_forward_table
+
+PERIODS = [10, 20, 30]
+
+# Universe with a late listing and an interior gap
+def make_close_df():
+    rng = np.random.default_rng(3)
+    dates = pd.bdate_range("2020-01-01", periods=300).as_unit("s")  # Day dates, as PriceCache.load returns
+    df = pd.DataFrame({t: 100 + np.cumsum(rng.normal(0.05, 1.0, 300)) for t in ["AAA", "BBB", "CCC"]},
+                      index=dates)
+    df.iloc[:50, 1] = np.nan
+    df.iloc[120:125, 2] = np.nan
+    return df
+
+# Test: each row holds exactly the ticker's dropna() history
+def test_from_frame_matches_dropna():
+    close_df = make_close_df()
+    store = PriceStore.from_frame(close_df)
+
+    for ticker in close_df.columns:
+        assert np.array_equal(store.ticker_values(ticker), close_df[ticker].dropna().to_numpy())
+    assert store["BBB"].index[0] == close_df.index[50]
+    assert store.stops.tolist() == [300, 300, 295]
+
+# Test: saved store opens memory-mapped and hands out zero-copy views
+def test_save_and_open_memory_mapped(tmp_path):
+    PriceStore.from_frame(make_close_df(), dtype=np.float32).save(tmp_path)
+    store = PriceStore.open(tmp_path)
+
+    assert isinstance(store.values, np.memmap)
+    assert store.values.dtype == np.float32
+    assert np.shares_memory(store.ticker_values("AAA"), store.values)
+    assert "CCC" in store and "ZZZ" not in store
+
+# Test: scoring from the store gives the same cube as from the DataFrame
+def test_cube_from_store_matches_frame(tmp_path):
+    close_df = make_close_df()
+    expected = build_score_cube(close_df, list(close_df.columns), PERIODS, forward_days=20)
+
+    PriceStore.from_frame(close_df).save(tmp_path)
+    store = PriceStore.open(tmp_path)
+
+    pd.testing.assert_frame_equal(build_score_cube(store, store.tickers, PERIODS, forward_days=20), expected)
+    pd.testing.assert_frame_equal(
+        build_score_cube_parallel(store, store.tickers, PERIODS, forward_days=20, workers=2), expected)
+
+# Test: tickers with interior gaps keep the right date for every close
+def test_getitem_dates_after_gap(tmp_path):
+    close_df = make_close_df()
+    PriceStore.from_frame(close_df).save(tmp_path)
+    store = PriceStore.open(tmp_path)
+
+    for ticker in close_df.columns:
+        pd.testing.assert_series_equal(store[ticker], close_df[ticker].dropna(), check_freq=False)
+
+# Test: walk-forward selection from the store matches the DataFrame
+def test_walk_forward_from_store_matches_frame(tmp_path):
+    rng = np.random.default_rng(8)
+    dates = pd.bdate_range("2014-01-01", periods=900).as_unit("s")
+    close_df = pd.DataFrame({t: 100 + np.cumsum(rng.normal(0.05, 1.0, 900)) for t in ["AAA", "BBB"]},
+                            index=dates)
+    close_df.iloc[400:420, 1] = np.nan  # 20-day gap
+
+    PriceStore.from_frame(close_df).save(tmp_path)
+    store = PriceStore.open(tmp_path)
+
+    options = dict(forward_days=20, train_days=250, test_days=100)
+    pd.testing.assert_frame_equal(walk_forward_table(store, store.tickers, PERIODS, **options),
+                                  walk_forward_table(close_df, list(close_df.columns), PERIODS, **options))
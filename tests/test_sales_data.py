@@ -0,0 +1,95 @@
+import pytest
+import pandas as pd
+from question_five import sales_generator
+from question_five.sales_generator import generate_sales, write_sales, COLUMNS, CATEGORIES, REGIONS
+from question_five.sales_report import calculate_sales_report, calculate_sales_file
+
+# Test: the first 25 rows follow the original category/region/product layout
+def test_generate_sales_schema():
+    df = generate_sales(30, seed=1)
+    assert list(df.columns) == COLUMNS
+    assert list(df["Category"][:25]) == [c for c in CATEGORIES for _ in range(5)]
+    assert list(df["Region"][:25]) == REGIONS * 5
+    assert list(df["Product"][:6]) == ["Ele_Prod01", "Ele_Prod02", "Ele_Prod03", "Ele_Prod04", "Ele_Prod05", "Fur_Prod01"]
+    assert df["Product"][25] == "Ele_Prod06"
+    assert df["Units Sold"].between(50, 800).all()
+    assert df["Unit Price (£)"].between(20, 150).all()
+    assert df["Manufacturing Cost (£)"].between(5, 100).all()
+
+# Test: same seed, same rows, whatever the chunk size
+def test_csv_output_independent_of_chunk_size(tmp_path):
+    write_sales(str(tmp_path / "a.csv"), 500, seed=7, chunk_rows=37)
+    write_sales(str(tmp_path / "b.csv"), 500, seed=7, chunk_rows=500)
+    assert (tmp_path / "a.csv").read_text() == (tmp_path / "b.csv").read_text()
+
+    df = pd.read_csv(tmp_path / "a.csv")
+    assert len(df) == 500 and list(df.columns) == COLUMNS
+    assert (df["Units Sold"].to_numpy() == generate_sales(500, seed=7)["Units Sold"].to_numpy()).all()
+
+# Test: XLSX output rolls over to a new sheet at the row limit
+def test_xlsx_output(tmp_path, monkeypatch):
+    pytest.importorskip("openpyxl")
+    monkeypatch.setattr(sales_generator, "XLSX_MAX_ROWS", 40)
+    write_sales(str(tmp_path / "sales.xlsx"), 100, seed=3, fmt="xlsx", chunk_rows=33)
+
+    sheets = pd.read_excel(tmp_path / "sales.xlsx", sheet_name=None)
+    assert list(sheets) == ["Sales", "Sales_2", "Sales_3"]
+    df = pd.concat(sheets.values(), ignore_index=True)
+    assert list(df["Product"]) == list(generate_sales(100, seed=3)["Product"])
+
+# Test: every sheet of a multi-sheet workbook is calculated and written back
+def test_calculate_multi_sheet_xlsx(tmp_path, monkeypatch):
+    pytest.importorskip("openpyxl")
+    monkeypatch.setattr(sales_generator, "XLSX_MAX_ROWS", 40)
+    write_sales(str(tmp_path / "blank.xlsx"), 100, seed=3, fmt="xlsx", chunk_rows=33)
+    blank = pd.read_excel(tmp_path / "blank.xlsx", sheet_name=None)
+    expected = calculate_sales_report(pd.concat(blank.values(), ignore_index=True))
+
+    df = calculate_sales_file(str(tmp_path / "blank.xlsx"), str(tmp_path / "done.xlsx"))
+    assert df["Profit (£)"].tolist() == expected["Profit (£)"].tolist()
+
+    sheets = pd.read_excel(tmp_path / "done.xlsx", sheet_name=None)
+    assert list(sheets) == ["Sales", "Sales_2", "Sales_3"]
+    assert [len(sheet) for sheet in sheets.values()] == [40, 40, 20]
+    done = pd.concat(sheets.values(), ignore_index=True)
+    # The XLSX writer may round the last bit of a float, so compare approximately
+    assert done["Revenue (£)"].tolist() == pytest.approx(expected["Revenue (£)"].tolist(), rel=1e-12)
+
+    calculate_sales_file(str(tmp_path / "blank.xlsx"), str(tmp_path / "done.csv"))
+    assert len(pd.read_csv(tmp_path / "done.csv")) == 100
+
+# Test: Parquet output (when pyarrow is available)
+def test_parquet_output(tmp_path):
+    pytest.importorskip("pyarrow")
+    write_sales(str(tmp_path / "sales.parquet"), 100, seed=3, fmt="parquet", chunk_rows=33)
+    df = pd.read_parquet(tmp_path / "sales.parquet")
+    assert list(df["Units Sold"]) == list(generate_sales(100, seed=3)["Units Sold"])
+
+# Reference: the Calculate_Sales_Report VBA macro, one row at a time
+def vba_calculate(units_sold, unit_price, manufacturing_cost):
+    revenue = units_sold * unit_price
+    total_cost = units_sold * manufacturing_cost
+    discount = revenue * 0.1 if units_sold > 400 else 0
+    profit = revenue - total_cost - discount
+    return revenue, discount, profit
+
+# Test: vectorized columns are identical to the VBA formulas
+def test_calculate_sales_report_matches_vba():
+    df = calculate_sales_report(generate_sales(5000, seed=11))
+    expected = [
+        vba_calculate(float(u), p, c)
+        for u, p, c in zip(df["Units Sold"], df["Unit Price (£)"], df["Manufacturing Cost (£)"])
+    ]
+    actual = list(zip(df["Revenue (£)"], df["Discount (£)"], df["Profit (£)"]))
+    assert actual == expected
+    assert (df.loc[df["Units Sold"] <= 400, "Discount (£)"] == 0).all()
+
+# Test: calculated output from the generator and from an existing file
+def test_calculated_outputs(tmp_path):
+    write_sales(str(tmp_path / "blank.csv"), 200, seed=5, chunk_rows=64)
+    write_sales(str(tmp_path / "done.csv"), 200, seed=5, chunk_rows=64, calculate=True)
+
+    from_file = calculate_sales_file(str(tmp_path / "blank.csv"), str(tmp_path / "filled.csv"))
+    generated = pd.read_csv(tmp_path / "done.csv", float_precision="round_trip")
+    assert from_file["Profit (£)"].tolist() == generated["Profit (£)"].tolist()
+    assert pd.read_csv(tmp_path / "filled.csv", float_precision="round_trip")["Revenue (£)"].tolist() == generated["Revenue (£)"].tolist()
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from question_four.simple_moving_avg import best_sma_for_stock
+from question_four.simple_moving_avg import best_sma_for_stock, parse_periods, main, open_price_store
 
 # Helper to create synthetic price data
 def generate_price_series(length, start=100, drift=0.1, noise=1.0, seed=None):
@@ -50,3 +50,91 @@ def test_best_sma_selects_highest_return():
     result = best_sma_for_stock(price_series, [10, 20, 50, 100], forward_days=50)
     assert result is not None
     assert result["Best_SMA"] in [10, 20, 50, 100]
+
+# Test: period grid parsing for the CLI
+def test_parse_periods():
+    assert parse_periods("10:200:5") == list(range(10, 201, 5))
+    assert parse_periods("10,20,50") == [10, 20, 50]
+
+# Test: full pipeline from the CLI with a file-based price source (no network)
+def test_main_with_csv_source(tmp_path):
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=400)
+    for i, ticker in enumerate(["AAA", "BBB"]):
+        prices = generate_price_series(400, seed=i + 1)
+        pd.DataFrame({"Date": dates, "Close": prices}).to_csv(tmp_path / f"{ticker}.csv", index=False)
+
+    main([
+        "--tickers", "AAA,BBB", "--periods", "10:50:10", "--csv-source", str(tmp_path),
+        "--cache-dir", str(tmp_path / "cache"),
+        "--per-stock-out", str(tmp_path / "per_stock.csv"),
+        "--portfolio-out", str(tmp_path / "portfolio.csv"),
+        "--cube-out", str(tmp_path / "cube.csv"),
+        "--walk-forward-out", str(tmp_path / "walk_forward.csv"),
+        "--train-days", "150", "--test-days", "50",
+    ])
+
+    per_stock = pd.read_csv(tmp_path / "per_stock.csv")
+    assert list(per_stock["Ticker"]) == ["AAA", "BBB"]
+    assert len(pd.read_csv(tmp_path / "cube.csv")) == 2 * 5
+    assert (tmp_path / "portfolio.csv").exists()
+    assert set(pd.read_csv(tmp_path / "walk_forward.csv")["Ticker"]) == {"AAA", "BBB"}
+
+    # The per-stock column is named after the holding period
+    main([
+        "--tickers", "AAA,BBB", "--periods", "10:50:10", "--forward-days", "20", "--offline",
+        "--cache-dir", str(tmp_path / "cache"), "--per-stock-out", str(tmp_path / "per_stock_20.csv"),
+        "--portfolio-out", str(tmp_path / "portfolio_20.csv"), "--cube-out", "", "--walk-forward-out", "",
+    ])
+    assert list(pd.read_csv(tmp_path / "per_stock_20.csv").columns) == ["Ticker", "Best_SMA",
+                                                                        "Best_Avg_Forward_20d", "Signals"]
+
+# Test: the CLI rejects a walk-forward training window no longer than the holding period
+@pytest.mark.parametrize("forward_days", ["50", "20,50"])
+def test_main_rejects_short_training_window(tmp_path, forward_days):
+    with pytest.raises(SystemExit):
+        main(["--forward-days", forward_days, "--train-days", "50", "--offline",
+              "--cache-dir", str(tmp_path / "cache")])
+
+# Test: several holding periods in one call, one result per horizon
+def test_best_sma_for_stock_multiple_horizons():
+    price_series = generate_price_series(300, seed=42)
+    sma_periods = list(range(10, 51, 10))
+    result = best_sma_for_stock(price_series, sma_periods, forward_days=[20, 50, 250])
+
+    assert set(result) == {20, 50, 250}
+    assert result[250] is None  # not enough history for this horizon
+    assert result[50]["Best_SMA"] == best_sma_for_stock(price_series, sma_periods, 50)["Best_SMA"]
+    assert "Best_Avg_Forward_20d" in result[20]
+
+# Test: the price store is rebuilt when the cache moves on or the request changes
+def test_open_price_store_rebuilds_when_out_of_date(tmp_path):
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+
+    def write_prices(tickers, length, lag):
+        dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=length + lag)[:length]
+        for i, ticker in enumerate(tickers):
+            pd.DataFrame({"Date": dates, "Close": generate_price_series(length, seed=i + 1)}).to_csv(
+                csv_dir / f"{ticker}.csv", index=False)
+        return dates
+
+    options = dict(cache_dir=str(tmp_path / "cache"), csv_source=str(csv_dir))
+    store_dir = str(tmp_path / "store")
+    write_prices(["AAA", "BBB"], 300, lag=10)
+    first = open_price_store(store_dir, ["AAA", "BBB"], **options)
+    assert len(first.dates) == 300
+
+    # Same request, nothing new upstream: the saved store is reused as is
+    values_path = tmp_path / "store" / "values.npy"
+    written = values_path.stat().st_mtime_ns
+    open_price_store(store_dir, ["AAA", "BBB"], **options)
+    assert values_path.stat().st_mtime_ns == written
+
+    # Newer dates upstream
+    dates = write_prices(["AAA", "BBB", "CCC"], 310, lag=0)
+    newer = open_price_store(store_dir, ["AAA", "BBB"], **options)
+    assert newer.dates[-1] == dates[-1].to_datetime64().astype("datetime64[D]")
+
+    # Other tickers or dtype
+    assert open_price_store(store_dir, ["AAA", "CCC"], **options).tickers == ["AAA", "CCC"]
+    assert open_price_store(store_dir, ["AAA", "CCC"], np.float32, **options).values.dtype == np.float32
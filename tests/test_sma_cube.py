@@ -0,0 +1,81 @@
+import pytest
+import pandas as pd
+import numpy as np
+from question_four.sma_cube import (
+    build_score_cube, best_sma_from_cube, portfolio_scores_from_cube, export_cube, load_cube, cube_for_horizon
+)
+from question_four.sma_parallel import build_score_cube_parallel
+
+PERIODS = list(range(10, 101, 10))
+TICKERS = ["AAA", "BBB", "CCC"]
+
+# Synthetic universe; CCC has a short history so some periods drop out for it
+def make_close_df():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({t: 100 + np.cumsum(rng.normal(0.05, 1.0, 400)) for t in TICKERS})
+    df.loc[:259, "CCC"] = np.nan
+    return df
+
+# Per-period portfolio loop the cube replaces
+def reference_portfolio(close_df, tickers, periods, forward_days):
+    scores = []
+    for p in periods:
+        per_stock = []
+        for ticker in tickers:
+            close = close_df[ticker].dropna()
+            if len(close) < p + forward_days + 5:
+                continue
+            sma = close.rolling(window=p, min_periods=p).mean()
+            forward_ret = close.shift(-forward_days) / close - 1
+            r = forward_ret[(close > sma) & forward_ret.notna()]
+            if not r.empty:
+                per_stock.append(float(r.mean()))
+        if len(per_stock) == len(tickers):
+            scores.append({"SMA_Period": p, "PortfolioMeanReturn": float(np.mean(per_stock))})
+    return pd.DataFrame(scores).sort_values("PortfolioMeanReturn", ascending=False)
+
+# Test: portfolio reduction matches the original per-period loop exactly
+def test_portfolio_scores_match_reference():
+    close_df = make_close_df()
+    cube = build_score_cube(close_df, TICKERS, PERIODS, forward_days=50)
+
+    result = portfolio_scores_from_cube(cube, TICKERS).reset_index(drop=True)
+    expected = reference_portfolio(close_df, TICKERS, PERIODS, 50).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+# Test: per-stock reduction skips tickers without enough history
+def test_best_sma_from_cube_skips_short_history():
+    cube = build_score_cube(make_close_df(), TICKERS, PERIODS, forward_days=50)
+    best = best_sma_from_cube(cube)
+
+    assert list(best["Ticker"]) == ["AAA", "BBB"]
+    assert set(best["Best_SMA"]) <= set(PERIODS)
+
+# Test: exported cube reloads without loss
+def test_cube_export_roundtrip(tmp_path):
+    cube = build_score_cube(make_close_df(), TICKERS, PERIODS, forward_days=50)
+    path = tmp_path / "cube.csv"
+    export_cube(cube, path)
+
+    pd.testing.assert_frame_equal(load_cube(path), cube, check_dtype=False)
+
+# Test: process-pool build is identical to the serial build
+def test_parallel_cube_matches_serial():
+    close_df = make_close_df()
+    serial = build_score_cube(close_df, TICKERS, PERIODS, forward_days=50)
+    parallel = build_score_cube_parallel(close_df, TICKERS, PERIODS, forward_days=50,
+                                         workers=2, tickers_per_task=1)
+    pd.testing.assert_frame_equal(parallel, serial)
+
+# Test: a multi-horizon cube slices back to the single-horizon cubes
+def test_multi_horizon_cube_slices():
+    close_df = make_close_df()
+    cube = build_score_cube(close_df, TICKERS, PERIODS, forward_days=[20, 50])
+    assert len(cube) == len(TICKERS) * len(PERIODS) * 2
+
+    single = build_score_cube(close_df, TICKERS, PERIODS, forward_days=20)
+    sliced = cube_for_horizon(cube, 20)
+    pd.testing.assert_frame_equal(sliced.drop(columns="Avg_Forward_Return"),
+                                  single.drop(columns="Avg_Forward_Return"))
+    assert sliced["Avg_Forward_Return"].to_numpy() == pytest.approx(
+        single["Avg_Forward_Return"].to_numpy(), rel=1e-12, nan_ok=True)
@@ -0,0 +1,61 @@
+import pytest
+import pandas as pd
+import numpy as np
+from question_four.sma_engine import sma_score_table, score_periods, score_periods_multi, signal_matrix, best_from_scores
+
+# Per-period loop the engine replaces, kept here as the reference
+def reference_scores(close, sma_periods, forward_days):
+    forward_ret = close.shift(-forward_days) / close - 1
+    rows = []
+    for p in sma_periods:
+        sma = close.rolling(window=p, min_periods=p).mean()
+        r = forward_ret[(close > sma) & forward_ret.notna()]
+        rows.append((float(r.mean()) if not r.empty else np.nan, len(r)))
+    return rows
+
+def random_walk(length, seed):
+    rng = np.random.default_rng(seed)
+    return pd.Series(np.round(100 + np.cumsum(rng.normal(0.05, 1.0, length)), 2))
+
+# Test: signals match pandas rolling mean exactly
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_signal_matrix_matches_rolling(seed):
+    close = random_walk(800, seed)
+    periods = list(range(5, 120, 7))
+    signals = signal_matrix(close.to_numpy(), periods)
+    for row, p in enumerate(periods):
+        expected = (close > close.rolling(window=p, min_periods=p).mean()).to_numpy()
+        assert np.array_equal(signals[row], expected)
+
+# Test: per-period score table matches the original loop
+@pytest.mark.parametrize("seed", [4, 5])
+def test_score_table_matches_reference(seed):
+    close = random_walk(600, seed)
+    periods = list(range(10, 201, 5))
+    table = sma_score_table(close, periods, forward_days=50)
+
+    expected = reference_scores(close, periods, 50)
+    assert list(table["SMA_Period"]) == periods
+    assert list(table["Signals"]) == [count for _, count in expected]
+    # Bit-identical to r.mean(), not just close
+    assert np.array_equal(table["Avg_Forward_Return"].to_numpy(), np.array([avg for avg, _ in expected]),
+                          equal_nan=True)
+
+# Test: flat prices give no signals and no winner
+def test_flat_prices_have_no_signals():
+    avg, counts = score_periods(np.full(300, 100.0), [20, 30, 40], forward_days=50)
+    assert counts.tolist() == [0, 0, 0]
+    assert best_from_scores([20, 30, 40], avg, counts) is None
+
+# Test: multi-horizon pass agrees with one single-horizon sweep per horizon
+def test_score_periods_multi_matches_single_horizons():
+    close = random_walk(700, 9).to_numpy()
+    periods = list(range(10, 101, 10))
+    horizons = [5, 20, 50, 100]
+    avg, counts = score_periods_multi(close, periods, horizons)
+
+    assert avg.shape == counts.shape == (len(periods), len(horizons))
+    for col, h in enumerate(horizons):
+        single_avg, single_counts = score_periods(close, periods, h)
+        assert counts[:, col].tolist() == single_counts.tolist()
+        assert avg[:, col] == pytest.approx(single_avg, rel=1e-12, nan_ok=True)
@@ -0,0 +1,45 @@
+import json
+import pytest
+import pandas as pd
+import numpy as np
+from question_four.sma_engine import signal_matrix, score_periods
+from question_four.sma_stream import SmaSignalState
+
+PERIODS = [5, 10, 20, 50]
+
+def random_walk(length, seed):
+    rng = np.random.default_rng(seed)
+    return 100 + np.cumsum(rng.normal(0.05, 1.0, length))
+
+# Test: streamed signals and statistics match the batch sweep
+def test_stream_matches_batch_sweep():
+    closes = random_walk(400, seed=11)
+    state = SmaSignalState(PERIODS, forward_days=20)
+    streamed = np.array([state.update(close) for close in closes]).T
+
+    assert np.array_equal(streamed, signal_matrix(closes, PERIODS))
+
+    avg, counts = score_periods(closes, PERIODS, forward_days=20)
+    assert state.return_counts.tolist() == counts.tolist()
+    assert state.avg_forward_returns == pytest.approx(avg, rel=1e-9)
+
+    expected_sma = pd.Series(closes).rolling(50).mean().iloc[-1]
+    assert state.sma[-1] == pytest.approx(expected_sma, rel=1e-12)
+
+# Test: windows that are not full yet never signal
+def test_stream_warm_up():
+    state = SmaSignalState([3, 10], forward_days=5)
+    for close in [1.0, 2.0, 3.0, 4.0]:
+        signal = state.update(close)
+    assert signal.tolist() == [True, False]
+    assert np.isnan(state.sma[1])
+
+# Test: serialised state resumes exactly where it left off
+def test_stream_state_roundtrip():
+    closes = random_walk(300, seed=5)
+    state = SmaSignalState.from_history(closes[:200], PERIODS, forward_days=20)
+    restored = SmaSignalState.from_dict(json.loads(json.dumps(state.to_dict())))
+
+    for close in closes[200:]:
+        assert np.array_equal(state.update(close), restored.update(close))
+    assert restored.to_dict() == state.to_dict()
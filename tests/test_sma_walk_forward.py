@@ -0,0 +1,62 @@
+import pytest
+import pandas as pd
+import numpy as np
+from question_four.sma_walk_forward import walk_forward_windows, walk_forward_ticker, walk_forward_table
+
+PERIODS = [10, 20, 30, 40]
+
+def random_walk(length, seed):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2015-01-01", periods=length)
+    return pd.Series(100 + np.cumsum(rng.normal(0.05, 1.0, length)), index=dates)
+
+# Naive window score: full rolling mean per period, then mean over day positions [start, stop)
+def naive_window_scores(close, start, stop, forward_days):
+    forward_ret = (close.shift(-forward_days) / close - 1).iloc[start:stop]
+    scores = []
+    for p in PERIODS:
+        sma = close.rolling(window=p, min_periods=p).mean().iloc[start:stop]
+        r = forward_ret[(close.iloc[start:stop] > sma) & forward_ret.notna()]
+        scores.append(r.mean() if not r.empty else np.nan)
+    return np.array(scores)
+
+# Test: window layout never lets training look past its own end
+def test_walk_forward_windows():
+    windows = walk_forward_windows(1000, train_days=300, test_days=100, forward_days=50)
+    assert windows[0] == (0, 300, 400)
+    assert all(end - start == 300 for start, end, _ in windows)
+    assert windows[-1][1] < 1000 - 50
+
+# Test: a training window no longer than the holding period is rejected
+@pytest.mark.parametrize("train_days", [30, 50])
+def test_walk_forward_rejects_short_training_window(train_days):
+    with pytest.raises(ValueError):
+        walk_forward_windows(1000, train_days=train_days, test_days=100, forward_days=50)
+    with pytest.raises(ValueError):
+        walk_forward_ticker(random_walk(900, seed=3), [5, 10], forward_days=50, train_days=train_days, test_days=100)
+
+# Test: prefix-sum selection matches a naive re-sweep of every window
+def test_walk_forward_matches_naive_selection():
+    close = random_walk(900, seed=3)
+    table = walk_forward_ticker(close, PERIODS, forward_days=20, train_days=250, test_days=100, ticker="AAA")
+
+    assert len(table) > 0
+    for _, row in table.iterrows():
+        start = close.index.get_loc(row["Train_Start"])
+        end = close.index.get_loc(row["Train_End"]) + 1
+        test_end = close.index.get_loc(row["Test_End"]) + 1
+
+        train = naive_window_scores(close, start, end - 20, 20)
+        assert row["Best_SMA"] == PERIODS[int(np.nanargmax(train))]
+        assert row["Train_Avg_Forward_Return"] == pytest.approx(np.nanmax(train), rel=1e-9)
+
+        oos = naive_window_scores(close, end, test_end, 20)[PERIODS.index(row["Best_SMA"])]
+        assert row["OOS_Avg_Forward_Return"] == pytest.approx(oos, rel=1e-9, nan_ok=True)
+
+# Test: short histories produce no windows
+def test_walk_forward_table_skips_short_history():
+    close_df = pd.DataFrame({"AAA": random_walk(900, 1), "BBB": random_walk(900, 2)})
+    close_df.iloc[:700, 1] = np.nan
+
+    table = walk_forward_table(close_df, ["AAA", "BBB"], PERIODS, forward_days=20, train_days=250, test_days=100)
+    assert set(table["Ticker"]) == {"AAA"}
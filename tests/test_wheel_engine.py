@@ -0,0 +1,149 @@
+import random
+import pytest
+from question_two.wheel_engine import (
+    WheelGame, ENGLISH_LETTER_ORDER, RandomStrategy, FrequencyStrategy, AdaptiveStrategy, play_headless, simulate,
+    INVALID, REPEATED, CORRECT, MISSED, BANKRUPT
+)
+from question_two.wheel_spins import Wheel, BufferedSpins, RecordingSpins, ReplaySpins
+from question_two.wheel_montecarlo import evaluate_strategies
+from question_two.wheel_of_fortune import display_word
+
+# Test: guesses follow the play_game rules
+def test_wheel_game_rules():
+    game = WheelGame("Hello world")
+    assert game.attempts_left == len("hello world") + 5
+    assert game.guess("1", 500) == (INVALID, 0, 0)
+    assert game.guess("l", 500) == (CORRECT, 3, 1500)
+    assert game.guess("L", 500) == (REPEATED, 0, 0)
+    assert game.guess("z", 500) == (MISSED, 0, 0)
+    assert game.attempts_left == len("hello world") + 3  # Only real guesses use attempts
+    assert game.display() == "_ _ l l o _ _ o _ l _".replace("o", "_")
+
+    for letter in "hewrd":
+        game.guess(letter, 100)
+    assert not game.solved
+    game.guess("o", 100)
+    assert game.solved and game.over and game.total_points == 1500 + 500 + 200
+
+# Test: the game ends when attempts run out
+def test_wheel_game_out_of_attempts():
+    game = WheelGame("a")
+    for letter in "bcdefg":
+        game.guess(letter, 100)
+    assert game.over and not game.solved and game.attempts_left == 0
+
+# Test: every strategy solves a short phrase and never repeats a letter
+@pytest.mark.parametrize("strategy", [RandomStrategy(), FrequencyStrategy(), AdaptiveStrategy(["hello", "help", "world"])])
+def test_strategies_play_valid_games(strategy):
+    result = play_headless("help", strategy, random.Random(0))
+    assert result.guesses == result.attempts_used + result.solved
+    if isinstance(strategy, AdaptiveStrategy):
+        assert result.solved and result.attempts_used <= 3
+
+# Test: a phrase with a non-ASCII letter can still be finished once a-z are used up
+@pytest.mark.parametrize("strategy", [RandomStrategy(), FrequencyStrategy(), AdaptiveStrategy(["hello café", "the quick brown fox jumps over a lazy dog!"])])
+def test_strategies_guess_non_ascii_letters(strategy):
+    phrase = "the quick brown fox jumps over a lazy café"
+    result = play_headless(phrase, strategy, random.Random(0))
+    assert result.solved and result.guesses == 27
+    assert simulate([phrase, "hello café"], strategy, 6)["solved"][::2].all()
+
+# Test: seeded simulations are reproducible and summarised
+def test_simulate_is_reproducible():
+    phrases = ["hello world", "wheel of fortune", "python"]
+    first = simulate(phrases, RandomStrategy(), games=200, seed=7)
+    second = simulate(phrases, RandomStrategy(), games=200, seed=7)
+    assert (first["points"] == second["points"]).all()
+    assert 0 <= first["win_rate"] <= 1 and first["mean_points"] == first["points"].mean()
+    assert simulate(["hello world"], FrequencyStrategy(), games=30, seed=1)["win_rate"] == 1.0
+
+# Test: the parallel evaluator gives the same statistics as a serial run
+def test_evaluate_strategies_parallel_matches_serial():
+    phrases = ["hello world", "wheel of fortune", "python", "monte carlo"] * 5
+    strategies = {"random": RandomStrategy(), "frequency": FrequencyStrategy()}
+    serial, _ = evaluate_strategies(phrases, strategies, replicates=2, seed=3, workers=1, phrases_per_task=3)
+    parallel, games_per_second = evaluate_strategies(phrases, strategies, replicates=2, seed=3, workers=2,
+                                                     phrases_per_task=7)
+
+    assert games_per_second > 0
+    for name in strategies:
+        assert serial[name]["games"] == parallel[name]["games"] == 40
+        assert serial[name]["mean_points"] == parallel[name]["mean_points"]
+        assert serial[name]["solve_rate"] == parallel[name]["solve_rate"]
+        assert serial[name]["attempts_histogram"].tolist() == parallel[name]["attempts_histogram"].tolist()
+
+# Test: bit masks and the incrementally updated board stay in step with display_word
+def test_wheel_game_masks_and_board():
+    phrase = "the quick brown fox jumps over the lazy dog " * 20
+    game = WheelGame(phrase)
+    guessed = set()
+    for letter in "etaoinshrdlcumwfgypbvkjxqz":
+        assert game.display() == display_word(game.phrase, guessed)
+        game.guess(letter, 100)
+        guessed.add(letter)
+        assert bin(game.guessed_mask).count("1") == len(guessed)
+    assert game.solved and game.hidden_mask == 0
+    assert game.total_points == 100 * sum(1 for ch in phrase if ch != " ")
+
+# Test: buffered spins are seeded, follow the weights and refill across blocks
+def test_buffered_spins():
+    wheel = Wheel(values=[100, 1000], weights=[3, 1], bankrupt=1)
+    first = BufferedSpins(wheel, seed=5, block=100)
+    spins = [first() for _ in range(5000)]
+    assert set(spins) == {100, 1000, BANKRUPT}
+    assert spins.count(100) > 2 * spins.count(1000)
+
+    second = BufferedSpins(wheel, seed=5, block=100)
+    assert [second() for _ in range(5000)] == spins
+
+# Test: recorded spins replay the same game, with Bankrupt and Lose a Turn wedges
+def test_record_and_replay_spins():
+    recorder = RecordingSpins(BufferedSpins(Wheel(bankrupt=2, lose_a_turn=2), seed=1, block=16))
+    played = play_headless("wheel of fortune", FrequencyStrategy(), random.Random(0), spin=recorder)
+    replayed = play_headless("wheel of fortune", FrequencyStrategy(), random.Random(0), spin=ReplaySpins(recorder.spins))
+    assert played == replayed
+    assert len(recorder.spins) == played.attempts_used + played.solved
+
+    replay = ReplaySpins([BANKRUPT])
+    assert replay() == BANKRUPT
+    with pytest.raises(IndexError):
+        replay()
+
+# Test: Bankrupt clears the points and uses an attempt
+def test_bankrupt_resets_points():
+    game = WheelGame("hello")
+    game.guess("l", 500)
+    attempts = game.attempts_left
+    game.lose_turn(bankrupt=True)
+    assert game.total_points == 0 and game.attempts_left == attempts - 1
+
+# Reference: the original full rescan of every phrase per guess
+class RescanStrategy:
+    def __init__(self, phrases):
+        self.phrases = [phrase.lower() for phrase in phrases]
+        self.fallback = FrequencyStrategy()
+
+    def choose(self, game, rng):
+        board = [letter if letter in game.guessed else None for letter in game.phrase]
+        missed = game.guessed - game.letters
+        counts = {}
+        for phrase in self.phrases:
+            if len(phrase) != len(board) or missed & set(phrase):
+                continue
+            if any((b is None and p in game.guessed) or (b is not None and p != b) for p, b in zip(phrase, board)):
+                continue
+            for letter in set(phrase) - game.guessed - {" "}:
+                counts[letter] = counts.get(letter, 0) + 1
+        if not counts:
+            return self.fallback.choose(game, rng)
+        return max(counts, key=lambda letter: (counts[letter], -ENGLISH_LETTER_ORDER.index(letter)))
+
+# Test: incremental candidate narrowing plays exactly like the full rescan
+def test_adaptive_strategy_matches_rescan():
+    rng = random.Random(4)
+    words = ["".join(rng.choice("abcdeorst") for _ in range(rng.randint(2, 5))) for _ in range(60)]
+    phrases = [" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(400)]
+    adaptive, rescan = AdaptiveStrategy(phrases), RescanStrategy(phrases)
+
+    for i, phrase in enumerate(phrases[:150] + ["not in the list", "xyz"]):
+        assert play_headless(phrase, adaptive, random.Random(i)) == play_headless(phrase, rescan, random.Random(i))